@@ -0,0 +1,50 @@
+#
+# Compare the time needed to clone a model through Block.clone()
+# (which pickles the model, sharing references to components outside
+# the cloned block) and through copy.deepcopy() (the fallback used
+# when a model holds objects that only support deepcopy).
+#
+#   python clone_model.py [number of constraints]
+#
+import sys
+import time
+import copy
+import pickle
+
+from pyomo.environ import (ConcreteModel, RangeSet, Var, Block,
+                           Constraint, Objective)
+from pyomo.core.base.block import _CloneReferences
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+def c_rule(b, i):
+    return b.y[i] - 2*b.model().x[i] >= i
+
+def build():
+    model = ConcreteModel()
+    model.I = RangeSet(N)
+    model.x = Var(model.I, bounds=(0, None))
+    model.b = Block()
+    model.b.y = Var(model.I)
+    model.b.c = Constraint(model.I, rule=c_rule)
+    model.obj = Objective(expr=sum(model.b.y[i] for i in model.I))
+    return model
+
+if __name__ == "__main__":
+    model = build()
+
+    start = time.time()
+    model.clone()
+    print("clone() (pickle)  : %6.2f s" % (time.time() - start,))
+
+    start = time.time()
+    copy.deepcopy(model, {'__block_scope__': {id(model): True,
+                                              id(None): False}})
+    print("deepcopy          : %6.2f s" % (time.time() - start,))
+
+    size = len(pickle.dumps(model, pickle.HIGHEST_PROTOCOL))
+    print("pickled model size: %6.1f MB" % (size / 1e6,))
+
+    start = time.time()
+    _CloneReferences(model.b).clone()
+    print("sub-block clone   : %6.2f s" % (time.time() - start,))
@@ -0,0 +1,45 @@
+#
+# Compare the memory used by a standard indexed Var with that of a
+# columnar Var (Var(..., columnar=True)) once the variables have
+# distinct values and bounds (e.g., after loading data and a
+# solution), along with the time needed to update their values.
+#
+#   python columnar_var.py [N]
+#
+import sys
+import time
+import random
+import tracemalloc
+
+from pyomo.environ import ConcreteModel, RangeSet, Var
+
+def measure(N, columnar):
+    values = [random.random() for i in range(N)]
+    model = ConcreteModel()
+    model.I = RangeSet(N)
+    tracemalloc.start()
+    start = time.time()
+    model.x = Var(model.I, columnar=columnar)
+    for i, vardata in enumerate(model.x.values()):
+        vardata.setlb(values[i]-1.0)
+        vardata.setub(values[i]+1.0)
+    construct_time = time.time() - start
+    start = time.time()
+    if columnar:
+        model.x.set_values(values)
+    else:
+        for i, vardata in enumerate(model.x.values()):
+            vardata.set_value(values[i])
+    update_time = time.time() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, construct_time, update_time
+
+if __name__ == "__main__":
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    for columnar in (False, True):
+        size, construct_time, update_time = measure(N, columnar)
+        print("columnar=%-5s: %8.1f MB (%5.1f bytes/var), "
+              "construct %6.2f s, set values %6.2f s"
+              % (columnar, size/1e6, float(size)/N,
+                 construct_time, update_time))
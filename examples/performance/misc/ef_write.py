@@ -0,0 +1,96 @@
+#
+# Compare the time (and, under Python 3, the peak memory) needed to
+# write the extensive form of a two-stage problem to an LP file by
+# constructing the EF instance (create_ef_instance + write_ef) and by
+# writing it directly from the scenario instances (write_ef_direct).
+# The scenario instances are constructed before either is timed.
+#
+#   python ef_write.py [number of scenarios] [number of variables]
+#
+import os
+import sys
+import time
+import tempfile
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from pyomo.environ import (ConcreteModel, RangeSet, Var, Expression,
+                           Constraint, Objective, NonNegativeReals)
+from pyomo.pysp.scenariotree.tree_structure_model import \
+    CreateConcreteTwoStageScenarioTreeModel
+from pyomo.pysp.scenariotree.instance_factory import \
+    ScenarioTreeInstanceFactory
+from pyomo.pysp.scenariotree.manager import \
+    ScenarioTreeManagerClientSerial
+from pyomo.pysp.ef import create_ef_instance, write_ef, write_ef_direct
+
+S = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+N = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+def pysp_instance_creation_callback(scenario_name, node_names):
+    s = int(scenario_name.replace('Scenario', ''))
+    model = ConcreteModel()
+    model.I = RangeSet(N)
+    model.x = Var(model.I, bounds=(0, 10))
+    model.y = Var(model.I, within=NonNegativeReals)
+    model.StageCost = Expression([1, 2])
+    model.StageCost[1] = sum(i * model.x[i] for i in model.I)
+    model.StageCost[2] = sum(((i + s) % 7) * model.y[i] for i in model.I)
+    model.demand = Constraint(
+        model.I, rule=lambda m, i: m.x[i] + m.y[i] >= (i * s) % 13)
+    model.link = Constraint(
+        model.I, rule=lambda m, i: Constraint.Skip if i == 1
+        else m.y[i] - m.y[i-1] <= m.x[i])
+    model.o = Objective(expr=model.StageCost[1] + model.StageCost[2])
+    return model
+
+def scenario_tree_model():
+    m = CreateConcreteTwoStageScenarioTreeModel(S)
+    m.StageCost['Stage1'] = 'StageCost[1]'
+    m.StageCost['Stage2'] = 'StageCost[2]'
+    m.StageVariables['Stage1'].add('x')
+    return m
+
+def measure(func):
+    if tracemalloc is not None:
+        tracemalloc.start()
+    start = time.time()
+    func()
+    elapsed = time.time() - start
+    peak = None
+    if tracemalloc is not None:
+        peak = tracemalloc.get_traced_memory()[1] / 2.0**20
+        tracemalloc.stop()
+    return elapsed, peak
+
+if __name__ == "__main__":
+    fd, filename = tempfile.mkstemp(suffix=".lp")
+    os.close(fd)
+    options = ScenarioTreeManagerClientSerial.register_options()
+    with ScenarioTreeInstanceFactory(
+            pysp_instance_creation_callback,
+            scenario_tree_model()) as factory:
+        with ScenarioTreeManagerClientSerial(
+                options, factory=factory) as manager:
+            manager.initialize()
+            scenario_tree = manager.scenario_tree
+            print("%d scenarios x %d first-stage variables" % (S, N))
+
+            t, peak = measure(
+                lambda: write_ef_direct(scenario_tree, filename))
+            size = os.path.getsize(filename) / 2.0**20
+            print("write_ef_direct            : %6.2f s %s (%.1f MB file)"
+                  % (t, "" if peak is None else "%7.1f MB peak" % peak,
+                     size))
+
+            def _ef():
+                ef = create_ef_instance(scenario_tree)
+                write_ef(ef, filename)
+            t, peak = measure(_ef)
+            size = os.path.getsize(filename) / 2.0**20
+            print("create_ef_instance+write_ef: %6.2f s %s (%.1f MB file)"
+                  % (t, "" if peak is None else "%7.1f MB peak" % peak,
+                     size))
+    os.remove(filename)
@@ -0,0 +1,44 @@
+#
+# Report the memory used per variable and per constraint by a large
+# linear model.  The memory report counts the bytes of the component
+# data objects, their component dictionary entries and the numbers and
+# expressions they own; the "allocated" figure is the total memory
+# allocated while building the model (as measured by tracemalloc).
+#
+#   python model_memory.py [number of constraints]
+#
+# (e.g., python model_memory.py 5000000 for a 5M constraint model)
+#
+import sys
+import time
+import tracemalloc
+
+from pyomo.environ import ConcreteModel, RangeSet, Var, Param, Constraint
+from pyomo.util.model_size import build_model_memory_report
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+def build():
+    model = ConcreteModel()
+    model.I = RangeSet(N)
+    model.x = Var(model.I, bounds=(0, 10))
+    model.y = Var(model.I)
+    model.p = Param(model.I, initialize=lambda m, i: 0.5*i, mutable=True)
+    model.c = Constraint(
+        model.I, rule=lambda m, i: m.x[i] - 2*m.y[i] >= m.p[i])
+    return model
+
+if __name__ == "__main__":
+    tracemalloc.start()
+    start = time.time()
+    model = build()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print("build time         : %8.2f s" % (time.time() - start,))
+    report = build_model_memory_report(model)
+    for name in ('variables', 'parameters', 'constraints'):
+        info = report[name]
+        print("%-19s: %8d objects %8.1f bytes/object"
+              % (name, info.count, info.bytes_per_object))
+    print("reported           : %8.1f MB" % (report.total_bytes / 1e6,))
+    print("allocated          : %8.1f MB" % (allocated / 1e6,))
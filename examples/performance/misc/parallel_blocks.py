@@ -0,0 +1,64 @@
+#
+# Compare the time needed to construct an indexed Block serially and
+# in parallel (Block(..., parallel=N)) when the block members are
+# independent (e.g., one block per scenario or time period).  The
+# block rule includes some (pure Python) data processing, which is
+# typical of rules that build scenario or time period subproblems.
+# The constructed blocks are pickled to transfer them from the worker
+# processes, so parallel construction only pays off when building a
+# block costs more than pickling it.
+#
+#   python parallel_blocks.py [number of blocks] [block size]
+#
+import sys
+import time
+import multiprocessing
+
+from pyomo.environ import (ConcreteModel, RangeSet, Param, Var, Block,
+                           Constraint, Expression)
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+K = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+def coefficients(i):
+    # A stand-in for reading and processing the data for a block
+    coef = {}
+    for k in range(1, K+1):
+        val = 0.0
+        for t in range(200):
+            val += ((i*k + t) % 13) / 13.0
+        coef[k] = round(val / 200, 3)
+    return coef
+
+def block_rule(b, i):
+    m = b.model()
+    coef = coefficients(i)
+    b.x = Var(m.K, bounds=(0, m.cap[i]))
+    b.y = Var(m.K)
+    b.link = Constraint(
+        m.K, rule=lambda b, k: b.y[k] == m.z + coef[k]*b.x[k])
+    b.flow = Constraint(
+        m.K, rule=lambda b, k: Constraint.Skip if k == 1
+        else b.x[k] - b.x[k-1] <= b.y[k])
+    b.cost = Expression(expr=sum(k*b.x[k] for k in m.K))
+
+def build(parallel):
+    model = ConcreteModel()
+    model.I = RangeSet(N)
+    model.K = RangeSet(K)
+    model.cap = Param(model.I, initialize=lambda m, i: 10*i)
+    model.z = Var()
+    start = time.time()
+    model.b = Block(model.I, rule=block_rule, parallel=parallel)
+    return time.time() - start
+
+if __name__ == "__main__":
+    serial = build(None)
+    print("serial            : %6.2f s" % (serial,))
+    nproc = multiprocessing.cpu_count()
+    for n in sorted(set([2, 4, nproc])):
+        if n > nproc:
+            continue
+        t = build(n)
+        print("parallel=%-2d       : %6.2f s (speedup %4.1fx)"
+              % (n, t, serial/t))
@@ -0,0 +1,68 @@
+#
+# Time the PH variable statistics (xbar) and weight updates for a
+# two-stage problem with many scenarios, using the vectorized (numpy)
+# updates and the scalar loops.  Only the data used by the updates is
+# created (there are no scenario instances or solves).
+#
+#   python ph_statistics.py [number of scenarios] [number of variables]
+#
+import sys
+import time
+import random
+
+import pyomo.pysp.ph
+from pyomo.core import minimize
+
+S = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+N = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+class Bunch(object):
+    def __init__(self, **kwds):
+        self.__dict__.update(kwds)
+
+def build():
+    rng = random.Random(0)
+    ids = ['x[%d]' % i for i in range(N)]
+    root = Bunch(_name='RootNode', _probability=1.0,
+                 _standard_variable_ids=set(ids), _variable_ids=set(ids),
+                 _xbars=dict.fromkeys(ids, 0.0),
+                 _averages=dict.fromkeys(ids, 0.0),
+                 _minimums={}, _maximums={}, _wbars={},
+                 _blend=dict.fromkeys(ids, 1), _scenarios=[])
+    for s in range(S):
+        root._scenarios.append(Bunch(
+            _probability=1.0/S, _instance=None,
+            _x={'RootNode': dict((i, rng.uniform(0, 100)) for i in ids)},
+            _w={'RootNode': dict.fromkeys(ids, 0.0)},
+            _rho={'RootNode': dict.fromkeys(ids, 1.0)}))
+    ph = pyomo.pysp.ph.ProgressiveHedging.__new__(
+        pyomo.pysp.ph.ProgressiveHedging)
+    ph._scenario_tree = Bunch(_stages=[Bunch(_tree_nodes=[root]),
+                                       Bunch(_tree_nodes=[])])
+    ph._overrelax = False
+    ph._nu = 1.0
+    ph._current_iteration = 1
+    ph._ph_xbar_updates_enabled = True
+    ph._dual_mode = False
+    ph._objective_sense = minimize
+    ph._output_times = False
+    ph._cumulative_xbar_time = 0.0
+    ph._cumulative_weight_time = 0.0
+    return ph
+
+if __name__ == "__main__":
+    ph = build()
+    print("%d scenarios x %d variables" % (S, N))
+    numpy_available = pyomo.pysp.ph.numpy_available
+    for use_numpy in (False, True):
+        if use_numpy and not numpy_available:
+            continue
+        pyomo.pysp.ph.numpy_available = use_numpy
+        start = time.time()
+        ph.update_variable_statistics()
+        middle = time.time()
+        ph.update_weights()
+        end = time.time()
+        print("%-7s: statistics %6.2f s, weights %6.2f s"
+              % ('numpy' if use_numpy else 'loops',
+                 middle - start, end - middle))
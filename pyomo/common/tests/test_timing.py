@@ -0,0 +1,124 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import json
+
+import pyutilib.th as unittest
+from six import StringIO
+
+from pyomo.common import timing
+from pyomo.common.log import LoggingIntercept
+from pyomo.common.timing import ConstructionProfiler, tracemalloc_available
+from pyomo.environ import ConcreteModel, RangeSet, Var, Constraint, Block
+
+def _build():
+    m = ConcreteModel()
+    m.I = RangeSet(3)
+    m.x = Var(m.I)
+    m.c = Constraint(m.I, rule=lambda m, i: m.x[i] >= i)
+    def b_rule(b, j):
+        b.y = Var(m.I)
+        b.d = Constraint(m.I, rule=lambda b, i: b.y[i] <= m.x[i])
+    m.b = Block([1, 2], rule=b_rule)
+    return m
+
+class TestConstructionProfiler(unittest.TestCase):
+    def test_profile(self):
+        with ConstructionProfiler(memory=False) as profiler:
+            _build()
+        self.assertIsNone(timing._construction_profiler)
+
+        records = dict((r['name'], r) for r in profiler.to_json())
+        self.assertEqual(sorted(records),
+                         ['ConcreteModel', 'I', 'b', 'b_index', 'c', 'x'])
+        self.assertEqual(records['c']['type'], 'Constraint')
+        self.assertEqual(records['c']['data_objects'], 3)
+        self.assertEqual(records['c']['rule_calls'], 3)
+        self.assertIsNone(records['c']['memory'])
+        self.assertEqual(records['b']['rule_calls'], 2)
+        self.assertEqual(
+            [(c['name'], c['block'], c['rule_calls'])
+             for c in records['b']['children']],
+            [('b[1].y', 'b[1]', 0), ('b[1].d', 'b[1]', 3),
+             ('b[2].y', 'b[2]', 0), ('b[2].d', 'b[2]', 3)])
+        b = records['b']
+        self.assertAlmostEqual(
+            b['self_time'], b['time'] - sum(
+                c['time'] for c in b['children']))
+
+        by_block = profiler.by_block()
+        self.assertEqual(by_block['b[1]']['data_objects'], 6)
+        self.assertEqual(by_block['b[1]']['rule_calls'], 3)
+
+        OUT = StringIO()
+        profiler.write_json(OUT)
+        self.assertEqual(json.loads(OUT.getvalue()), profiler.to_json())
+
+        OUT = StringIO()
+        profiler.write_folded(OUT)
+        self.assertEqual(
+            [line.split()[0] for line in OUT.getvalue().splitlines()],
+            ['ConcreteModel', 'I', 'x', 'c', 'b_index', 'b',
+             'b;b[1].y', 'b;b[1].d', 'b;b[2].y', 'b;b[2].d'])
+        with self.assertRaisesRegexp(ValueError, "unknown metric 'rules'"):
+            profiler.write_folded(OUT, metric='rules')
+
+        OUT = StringIO()
+        profiler.report(ostream=OUT, limit=2)
+        self.assertEqual(len(OUT.getvalue().splitlines()), 3)
+
+    def test_failed_construction(self):
+        def bad_rule(m):
+            raise RuntimeError("bad rule")
+        def b_rule(b):
+            b.y = Var()
+            b.bad = Constraint(rule=bad_rule)
+        m = ConcreteModel()
+        OUT = StringIO()
+        with ConstructionProfiler(memory=False) as profiler:
+            with LoggingIntercept(OUT, 'pyomo.core'):
+                with self.assertRaisesRegexp(RuntimeError, "bad rule"):
+                    m.bad = Constraint(rule=bad_rule)
+                with self.assertRaisesRegexp(RuntimeError, "bad rule"):
+                    m.b = Block(rule=b_rule)
+            m.after = Var()
+        self.assertIn("Constructing component 'bad'", OUT.getvalue())
+        self.assertEqual(profiler._stack, [])
+
+        self.assertEqual(
+            [(r['name'], [c['name'] for c in r['children']])
+             for r in profiler.to_json()],
+            [('bad', []), ('b', ['b.y', 'b.bad']), ('after', [])])
+        self.assertIsNone(profiler.to_json()[0]['time'])
+        OUT = StringIO()
+        profiler.write_folded(OUT)
+        self.assertEqual(
+            [line.split()[0] for line in OUT.getvalue().splitlines()],
+            ['bad', 'b', 'b;b.y', 'b;b.bad', 'after'])
+
+    def test_rules_outside_profiler(self):
+        profiler = ConstructionProfiler(memory=False)
+        _build()
+        self.assertEqual(profiler.records, [])
+
+    @unittest.skipIf(not tracemalloc_available, "tracemalloc not available")
+    def test_profile_memory(self):
+        with ConstructionProfiler() as profiler:
+            _build()
+        records = dict((r['name'], r) for r in profiler.to_json())
+        self.assertGreater(records['c']['memory'], 0)
+        self.assertGreater(records['b']['memory'],
+                           records['b']['self_memory'])
+        OUT = StringIO()
+        profiler.write_folded(OUT, metric='memory')
+        self.assertEqual(len(OUT.getvalue().splitlines()), 10)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,14 @@
 import sys
+import json
 import logging
 from pyutilib.misc.timing import TicTocTimer
 
+try:
+    import tracemalloc
+    tracemalloc_available = True
+except ImportError:                               #pragma:nocover
+    tracemalloc_available = False
+
 _logger = logging.getLogger('pyomo.common.timing')
 _logger.propagate = False
 _logger.setLevel(logging.WARNING)
@@ -20,29 +27,38 @@ def report_timing(stream=True):
         for h in _logger.handlers:
             _logger.removeHandler(h)
 
+def _component_name(obj):
+    try:
+        return obj.name
+    except RuntimeError:
+        try:
+            return obj.local_name
+        except RuntimeError:
+            return '(unknown)'
+
 _construction_logger = logging.getLogger('pyomo.common.timing.construction')
 class ConstructionTimer(object):
     fmt = "%%6.%df seconds to construct %s %s; %d %s total"
     def __init__(self, obj):
         self.obj = obj
+        if _construction_profiler is None:
+            self.profile = None
+        else:
+            self.profile = _construction_profiler.begin(obj)
         self.timer = TicTocTimer()
 
     def report(self):
         # Record the elapsed time, as some log handlers may not
         # immediately generate the messge string
         self.timer = self.timer.toc(msg="")
+        if self.profile is not None:
+            self.profile.profiler.end(self.profile, self.obj, self.timer)
         _construction_logger.info(self)
 
     def __str__(self):
         total_time = self.timer
         idx = len(self.obj.index_set())
-        try:
-            name = self.obj.name
-        except RuntimeError:
-            try:
-                name = self.obj.local_name
-            except RuntimeError:
-                name = '(unknown)'
+        name = _component_name(self.obj)
         try:
             return self.fmt % ( 2 if total_time>=0.005 else 0,
                                 self.obj.type().__name__,
@@ -57,6 +73,254 @@ class ConstructionTimer(object):
                 self.timer.toc("") )
 
 
+#
+# The active ConstructionProfiler (if any).  ConstructionTimer and
+# apply_indexed_rule() report to it.
+#
+_construction_profiler = None
+
+def construction_failed(obj):
+    """Notify the active ConstructionProfiler (if any) that the
+    construction of a component raised an exception"""
+    if _construction_profiler is not None:
+        _construction_profiler.abort(obj)
+
+class _ConstructionRecord(object):
+    """The construction statistics for one component"""
+
+    __slots__ = ('profiler', 'name', 'ctype', 'block', 'time',
+                 'data_objects', 'memory', 'rule_calls', 'children',
+                 '_memory_start', '_component')
+
+    def __init__(self, profiler, obj):
+        self.profiler = profiler
+        self.name = _component_name(obj)
+        self.ctype = obj.type().__name__
+        block = obj.parent_block()
+        self.block = None if block is None else _component_name(block)
+        self.time = None
+        self.data_objects = None
+        self.memory = None
+        self.rule_calls = 0
+        self.children = []
+        self._memory_start = None
+        # the component being constructed (cleared when it ends)
+        self._component = obj
+
+    def self_time(self):
+        """The construction time, excluding nested constructions"""
+        if self.time is None:
+            return None
+        return self.time - sum(c.time for c in self.children
+                               if c.time is not None)
+
+    def self_memory(self):
+        """The memory allocated, excluding nested constructions"""
+        if self.memory is None:
+            return None
+        return self.memory - sum(c.memory for c in self.children
+                                 if c.memory is not None)
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'type': self.ctype,
+            'block': self.block,
+            'time': self.time,
+            'self_time': self.self_time(),
+            'data_objects': self.data_objects,
+            'memory': self.memory,
+            'self_memory': self.self_memory(),
+            'rule_calls': self.rule_calls,
+            'children': [c.to_dict() for c in self.children],
+        }
+
+
+class ConstructionProfiler(object):
+    """Profile the construction of model components.
+
+    While the profiler is active (between start() and stop(), or
+    within a ``with`` block), it records, for each component
+    constructed, the construction time, the number of data objects,
+    the net memory allocated (if memory=True and tracemalloc is
+    available) and the number of rule calls.  Components constructed
+    while another component is being constructed (e.g., by a Block
+    rule) are recorded as its children.
+
+    Note that tracing memory allocations slows down construction;
+    profile with memory=False for accurate timing.
+
+    Example:
+
+        with ConstructionProfiler() as profiler:
+            instance = model.create_instance(data)
+        profiler.report()
+        profiler.write_json(open('construction.json', 'w'))
+        profiler.write_folded(open('construction.folded', 'w'))
+    """
+
+    def __init__(self, memory=True):
+        self.memory = memory and tracemalloc_available
+        self.records = []
+        self._stack = []
+        self._previous = None
+        self._stop_tracemalloc = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, et, ev, tb):
+        self.stop()
+
+    def start(self):
+        """Start recording component construction"""
+        global _construction_profiler
+        self._previous = _construction_profiler
+        _construction_profiler = self
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._stop_tracemalloc = True
+
+    def stop(self):
+        """Stop recording component construction"""
+        global _construction_profiler
+        _construction_profiler = self._previous
+        self._previous = None
+        if self._stop_tracemalloc:
+            tracemalloc.stop()
+            self._stop_tracemalloc = False
+
+    def begin(self, obj):
+        """Record that the construction of a component has started"""
+        record = _ConstructionRecord(self, obj)
+        if self._stack:
+            self._stack[-1].children.append(record)
+        else:
+            self.records.append(record)
+        self._stack.append(record)
+        if self.memory:
+            record._memory_start = tracemalloc.get_traced_memory()[0]
+        return record
+
+    def end(self, record, obj, elapsed):
+        """Record that the construction of a component has finished"""
+        if self.memory and tracemalloc.is_tracing():
+            record.memory = \
+                tracemalloc.get_traced_memory()[0] - record._memory_start
+        record.time = elapsed
+        data = getattr(obj, '_data', None)
+        if data is not None:
+            record.data_objects = len(data)
+        # Constructions that raised an exception without calling
+        # abort() never end: drop them from the stack along with this
+        # record.
+        while self._stack:
+            if self._stack.pop() is record:
+                break
+        record._component = None
+
+    def abort(self, obj):
+        """Record that the construction of a component raised an
+        exception
+
+        The record for the component (and any records nested under it
+        that did not end) is removed from the stack of active
+        constructions, so that components constructed afterwards are
+        not recorded as its children.  The record is kept, with no
+        time.
+        """
+        if not any(r._component is obj for r in self._stack):
+            return
+        while self._stack:
+            record = self._stack.pop()
+            found = record._component is obj
+            record._component = None
+            if found:
+                break
+
+    def rule_call(self):
+        """Record a call to a construction rule"""
+        if self._stack:
+            self._stack[-1].rule_calls += 1
+
+    def _all_records(self):
+        stack = list(reversed(self.records))
+        while stack:
+            record = stack.pop()
+            yield record
+            stack.extend(reversed(record.children))
+
+    def by_block(self):
+        """Return the construction statistics aggregated by block
+
+        The result maps each block name to a dict with the total
+        (self) time, data objects, memory and rule calls of the
+        components constructed on that block.
+        """
+        ans = {}
+        for record in self._all_records():
+            stats = ans.setdefault(record.block, {
+                'time': 0., 'data_objects': 0, 'memory': 0,
+                'rule_calls': 0})
+            stats['time'] += record.self_time() or 0.
+            stats['data_objects'] += record.data_objects or 0
+            stats['memory'] += record.self_memory() or 0
+            stats['rule_calls'] += record.rule_calls
+        return ans
+
+    def to_json(self):
+        """Return the construction records as a JSON-compatible list"""
+        return [record.to_dict() for record in self.records]
+
+    def write_json(self, ostream, **kwds):
+        """Write the construction records as JSON"""
+        json.dump(self.to_json(), ostream, **kwds)
+
+    def write_folded(self, ostream, metric='time'):
+        """Write the construction records as folded stacks
+
+        Each line holds the semicolon-separated names of the nested
+        constructions and the self time (in microseconds, for
+        metric='time') or self memory (in bytes, for metric='memory').
+        This is the input format of flame graph tools (e.g.,
+        flamegraph.pl or speedscope).
+        """
+        if metric == 'time':
+            value = lambda r: int(round((r.self_time() or 0.) * 1e6))
+        elif metric == 'memory':
+            value = lambda r: max(r.self_memory() or 0, 0)
+        else:
+            raise ValueError(
+                "ConstructionProfiler.write_folded(): unknown metric "
+                "'%s' (expected 'time' or 'memory')" % (metric,))
+        stack = [((r.name,), r) for r in reversed(self.records)]
+        while stack:
+            path, record = stack.pop()
+            ostream.write("%s %d\n" % (";".join(path), value(record)))
+            stack.extend(
+                (path + (c.name,), c) for c in reversed(record.children))
+
+    def report(self, ostream=None, limit=None):
+        """Print the components, sorted by (self) construction time"""
+        if ostream is None:
+            ostream = sys.stdout
+        records = sorted(self._all_records(),
+                         key=lambda r: -(r.self_time() or 0.))
+        if limit is not None:
+            records = records[:limit]
+        ostream.write("%10s %12s %14s %10s  %s\n" % (
+            'time (s)', 'data objects', 'memory (bytes)', 'rule calls',
+            'component'))
+        for r in records:
+            memory = r.self_memory()
+            ostream.write("%10.4f %12s %14s %10d  %s %s\n" % (
+                r.self_time() or 0.,
+                '-' if r.data_objects is None else r.data_objects,
+                '-' if memory is None else memory,
+                r.rule_calls, r.ctype, r.name))
+
+
 _transform_logger = logging.getLogger('pyomo.common.timing.transformation')
 class TransformationTimer(object):
     fmt = "%%6.%df seconds to apply Transformation %s%s"
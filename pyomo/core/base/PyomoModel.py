@@ -39,6 +39,7 @@ import pyomo.common
 from pyomo.common.deprecation import deprecation_warning
 from pyomo.common.plugin import ExtensionPoint
 from pyomo.common._task import pyomo_api
+from pyomo.common.timing import construction_failed
 from pyomo.common.deprecation import deprecation_warning
 
 from pyomo.core.expr import expr_common
@@ -53,7 +54,7 @@ from pyomo.core.base.indexed_component import IndexedComponent
 from pyomo.dataportal import DataPortal
 from pyomo.core.base.plugin import *
 from pyomo.core.base.numvalue import *
-from pyomo.core.base.block import SimpleBlock
+from pyomo.core.base.block import Block, SimpleBlock
 from pyomo.core.base.sets import Set
 from pyomo.core.base.component import Component, ComponentUID
 from pyomo.core.base.plugin import ModelComponentFactory, TransformationFactory
@@ -422,7 +423,13 @@ class ModelSolutions(object):
             smap = self.symbol_map[smap_id]
             for name in ['problem', 'objective', 'variable', 'constraint']:
                 tmp = soln._entry[name]
-                for symb, val in iteritems(getattr(solution, name)):
+                # Iterate over the symbol-keyed entries without
+                # expanding any index-aligned values (handled below)
+                if name in ('variable', 'constraint'):
+                    entries = solution._entries(name)
+                else:
+                    entries = getattr(solution, name)
+                for symb, val in iteritems(entries):
                     if symb in smap.bySymbol:
                         obj = smap.bySymbol[symb]
                     elif symb in smap.aliases:
@@ -440,6 +447,30 @@ class ModelSolutions(object):
 
                     tmp[id(obj())] = (obj, val)
             #
+            # Map values that the results reader stored by column
+            # (row) index rather than by symbol (see
+            # Solution.set_indexed_values)
+            #
+            bySymbol = smap.bySymbol
+            for name in ('variable', 'constraint'):
+                indexed = solution.get_indexed_values(name)
+                if indexed is None:
+                    continue
+                prefix, key, values = indexed
+                tmp = soln._entry[name]
+                for i, val in enumerate(values):
+                    obj = bySymbol.get(prefix + str(i), None)
+                    if obj is None:
+                        continue
+                    id_ = id(obj())
+                    if id_ in tmp:
+                        # do not modify the entry owned by the results
+                        entry = dict(tmp[id_][1])
+                        entry[key] = val
+                        tmp[id_] = (obj, entry)
+                    else:
+                        tmp[id_] = (obj, {key: val})
+            #
             # Wrap up
             #
             if delete_symbol_map:
@@ -600,6 +631,7 @@ use the AbstractModel or ConcreteModel class instead.""")
         self.config = PyomoConfig()
         self.solutions = ModelSolutions(self)
         self.config.preprocessor = 'pyomo.model.simple_preprocessor'
+        self._deferred_construction = None
 
     def compute_statistics(self, active=True):
         """
@@ -633,7 +665,7 @@ use the AbstractModel or ConcreteModel class instead.""")
     def create_instance( self, filename=None, data=None, name=None,
                          namespace=None, namespaces=None,
                          profile_memory=0, report_timing=False,
-                         **kwds ):
+                         lazy=False, **kwds ):
         """
         Create a concrete instance of an abstract model, possibly using data
         read in from a file.
@@ -656,6 +688,12 @@ use the AbstractModel or ConcreteModel class instead.""")
             A number that indicates the profiling level.
         report_timing: `bool`, optional     
             Report timing statistics during construction.
+        lazy: `bool`, optional
+            Defer the construction of the top-level Block, Constraint
+            and Objective components.  Deferred components are
+            constructed when they are first indexed or iterated over,
+            when the instance is written or sent to a solver (active
+            components only), or by calling construct_deferred().
 
         """
         #
@@ -732,7 +770,8 @@ arguments (which have been ignored):"""
 
         instance.load( data,
                        namespaces=_namespaces,
-                       profile_memory=profile_memory )
+                       profile_memory=profile_memory,
+                       lazy=lazy )
 
         #
         # Preprocess the new model
@@ -782,7 +821,8 @@ arguments (which have been ignored):"""
                 preprocessor = self.config.preprocessor
             pyomo.common.PyomoAPIFactory(preprocessor)(self.config, model=self)
 
-    def load(self, arg, namespaces=[None], profile_memory=0, report_timing=None):
+    def load(self, arg, namespaces=[None], profile_memory=0,
+             report_timing=None, lazy=False):
         """
         Load the model with data from a file, dictionary or DataPortal object.
         """
@@ -815,7 +855,8 @@ from solvers are immediately loaded into the original model instance.""")
             raise ValueError(msg % str( type(arg) ))
         self._load_model_data(dp,
                               namespaces,
-                              profile_memory=profile_memory)
+                              profile_memory=profile_memory,
+                              lazy=lazy)
 
     def _tuplize(self, data, setobj):
         if data is None:            #pragma:nocover
@@ -849,6 +890,9 @@ from solvers are immediately loaded into the original model instance.""")
             # out the limit.
             #
             profile_memory = kwds.get('profile_memory', 0)
+            lazy = kwds.get('lazy', False)
+            if lazy and getattr(self, '_deferred_construction', None) is None:
+                self._deferred_construction = OrderedDict()
 
             if (pympler_available is True) and (profile_memory >= 2):
                 mem_used = muppy.get_size(muppy.get_objects())
@@ -879,6 +923,12 @@ from solvers are immediately loaded into the original model instance.""")
                 if component.type() is Model:
                     continue
 
+                if lazy and component.type() in _deferred_ctypes:
+                    self._deferred_construction[component_name] = \
+                        self._component_data(
+                            modeldata, namespaces, component_name)
+                    continue
+
                 self._initialize_component(modeldata, namespaces, component_name, profile_memory)
                 if False:
                     total_time = time.time() - start_time
@@ -909,6 +959,10 @@ from solvers are immediately loaded into the original model instance.""")
                 print("")
 
     def _initialize_component(self, modeldata, namespaces, component_name, profile_memory):
+        data = self._component_data(modeldata, namespaces, component_name)
+        self._construct_component(component_name, data, profile_memory)
+
+    def _component_data(self, modeldata, namespaces, component_name):
         declaration = self.component(component_name)
 
         if component_name in modeldata._default:
@@ -925,6 +979,10 @@ from solvers are immediately loaded into the original model instance.""")
                     data = modeldata._data[namespace][component_name]
             if not data is None:
                 break
+        return data
+
+    def _construct_component(self, component_name, data, profile_memory):
+        declaration = self.component(component_name)
 
         if __debug__ and logger.isEnabledFor(logging.DEBUG):
             _blockName = "Model" if self.parent_block() is None \
@@ -936,6 +994,7 @@ from solvers are immediately loaded into the original model instance.""")
             declaration.construct(data)
         except:
             err = sys.exc_info()[1]
+            construction_failed(declaration)
             logger.error(
                 "Constructing component '%s' from data=%s failed:\n    %s: %s",
                 str(declaration.name), str(data).strip(),
@@ -958,6 +1017,34 @@ from solvers are immediately loaded into the original model instance.""")
             print("      Total memory = %d bytes following construction of component=%s (after garbage collection)" % (mem_used, component_name))
 
 
+    def _construct_deferred_component(self, component_name):
+        data = self._deferred_construction.pop(component_name)
+        self._construct_component(component_name, data, 0)
+        component = self.component(component_name)
+        if not component.active:
+            # deactivated before it was constructed
+            component.deactivate()
+
+    def construct_deferred(self, active=True):
+        """
+        Construct the components deferred by create_instance(lazy=True).
+
+        Components are constructed in declaration order.  If active is
+        True, deactivated components are left unconstructed.
+        """
+        deferred = self._deferred_construction
+        if not deferred:
+            return
+        for name in list(deferred):
+            if name not in deferred:
+                # Constructed while constructing an earlier component
+                continue
+            component = self.component(name)
+            if component is None:
+                del deferred[name]
+            elif not active or component.active:
+                self._construct_deferred_component(name)
+
     def create(self, filename=None, **kwargs):
         """
         Create a concrete instance of this Model, possibly using data
@@ -989,6 +1076,14 @@ transformation to the model instance.""" % (name,name,) )
         return xfrm.apply_to(self, **kwds)
 
 
+#
+# The component types whose construction can be deferred by
+# Model.create_instance(lazy=True).  Sets, Params and Vars are always
+# constructed, as the deferred components depend on them.
+#
+_deferred_ctypes = (Block, Constraint, Objective)
+
+
 @ModelComponentFactory.register('A concrete optimization model that does not defer construction of components.')
 class ConcreteModel(Model):
     """
@@ -13,18 +13,24 @@ __all__ = ['Block', 'TraversalStrategy', 'SortComponents',
            'components_data']
 
 import copy
+import os
 import sys
 import weakref
 import logging
+import traceback
+import types
+import multiprocessing
+from io import BytesIO
 from inspect import isclass
 from operator import itemgetter, attrgetter
+from pyutilib.misc import PauseGC
 from six import iteritems, iterkeys, itervalues, StringIO, string_types, \
     advance_iterator, PY3
 
-from pyomo.common.timing import ConstructionTimer
+from pyomo.common.timing import ConstructionTimer, construction_failed
 from pyomo.core.base.plugin import *  # ModelComponentFactory
-from pyomo.core.base.component import Component, ActiveComponentData, \
-    ComponentUID
+from pyomo.core.base.component import Component, ComponentData, \
+    ActiveComponentData, ComponentUID
 from pyomo.core.base.sets import Set,  _SetDataBase
 from pyomo.core.base.var import Var
 from pyomo.core.base.misc import apply_indexed_rule
@@ -36,6 +42,11 @@ import collections
 from pyomo.opt.base import ProblemFormat, guess_format
 from pyomo.opt import WriterFactory
 
+try:
+    import cPickle as pickle
+except ImportError:                         #pragma:nocover
+    import pickle
+
 logger = logging.getLogger('pyomo.core')
 
 
@@ -252,6 +263,264 @@ class _BlockConstruction(object):
     data = {}
 
 
+class _ExternalReferences(object):
+    """
+    Pickle support for transferring a block that was constructed in
+    a worker process back to the parent process.
+
+    The block is pickled by value, but references to components
+    outside of the block (e.g., Sets, Params and Vars declared on the
+    model, or the indexed Block that owns the block) are replaced by
+    their ComponentUID, which is resolved against the model in the
+    parent process.  Component rules that cannot be pickled by
+    reference (e.g., lambda rules for components declared within the
+    block rule) are dropped: they are only used to construct the
+    components, which has already happened when the block is
+    transferred.  Other functions that cannot be pickled by reference
+    (e.g., a lambda used as a Set filter) are still needed after
+    construction, so they raise an exception.
+    """
+
+    def __init__(self, block):
+        self._block = block
+        self._model = block.model()
+        # id(obj) -> persistent id (or None for objects pickled by value)
+        self._cache = {}
+        self._found = {}
+        # ids of the component rules that may be dropped
+        self._rules = set()
+
+    def _find_rules(self):
+        for comp in self._block.component_objects(descend_into=True):
+            if getattr(comp, '_dense', True) is False:
+                # sparse components call their rules when members
+                # are added after construction
+                continue
+            for attr in _construction_rules:
+                rule = comp.__dict__.get(attr, None)
+                if rule.__class__ is types.FunctionType:
+                    self._rules.add(id(rule))
+
+    def persistent_id(self, obj):
+        # This is called for every object in the block, so we quickly
+        # skip the types that are always pickled by value
+        if obj.__class__ in _pickled_by_value:
+            return None
+        if not isinstance(obj, (Component, ComponentData)):
+            if isinstance(obj, types.FunctionType):
+                if '<' in getattr(obj, '__qualname__', obj.__name__):
+                    if id(obj) in self._rules:
+                        return ('local',)
+                    raise ValueError(
+                        "Cannot transfer the function '%s' from a block "
+                        "constructed in parallel: only the rules used "
+                        "to construct components can be local functions "
+                        "(or lambdas).  Declare the function at the "
+                        "module level." % (obj.__name__,))
+            else:
+                _pickled_by_value.add(obj.__class__)
+            return None
+        _id = id(obj)
+        if _id in self._cache:
+            return self._cache[_id]
+        pid = None
+        parent = obj
+        while parent is not None:
+            if parent is self._block:
+                break
+            if parent is self._model:
+                if obj is self._model:
+                    pid = ('model',)
+                else:
+                    pid = ('cuid', ComponentUID(obj))
+                break
+            parent = parent.parent_block()
+        self._cache[_id] = pid
+        return pid
+
+    def persistent_load(self, pid):
+        if pid in self._found:
+            return self._found[pid]
+        if pid[0] == 'local':
+            obj = None
+        elif pid[0] == 'model':
+            obj = self._model
+        else:
+            obj = pid[1].find_component_on(self._model)
+            if obj is None:
+                raise RuntimeError(
+                    "Cannot resolve the reference to component '%s' in a "
+                    "block constructed in parallel.  Blocks constructed "
+                    "in parallel can only reference their own components "
+                    "and components that exist on the model before the "
+                    "Block is constructed." % (pid[1],))
+        self._found[pid] = obj
+        return obj
+
+    def dumps(self):
+        buf = BytesIO()
+        pickler = pickle.Pickler(buf, pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = self.persistent_id
+        self._find_rules()
+        with PauseGC():
+            pickler.dump(self._block)
+        return buf.getvalue()
+
+    def loads(self, data):
+        unpickler = pickle.Unpickler(BytesIO(data))
+        unpickler.persistent_load = self.persistent_load
+        # Unpickling creates many (cyclically referenced) objects,
+        # which would otherwise repeatedly trigger the garbage collector
+        with PauseGC():
+            return unpickler.load()
+
+
+# Types (other than components) that _ExternalReferences pickles by value
+_pickled_by_value = set()
+
+# The component attributes that hold the rules that are only used
+# when the component is constructed
+_construction_rules = (
+    '_rule',                # Block, Param, Suffix
+    'rule',                 # Constraint, Objective
+    '_init_rule',           # Expression
+    'initialize',           # Set
+    '_value_init_rule',     # Var
+    '_domain_init_rule',    # Var
+    '_bounds_init_rule',    # Var
+)
+
+
+# The types that copy.deepcopy does not copy
+_atomic_types = set([type(None), int, float, bool, complex, type,
+                     types.FunctionType, types.BuiltinFunctionType])
+_atomic_types.update(string_types)
+if PY3:
+    _atomic_types.add(bytes)
+else:                                       #pragma:nocover
+    _atomic_types.update((long, str))
+
+def _is_atomic_tuple(obj):
+    """Return True if copy.deepcopy would not copy the tuple obj."""
+    for x in obj:
+        if x.__class__ not in _atomic_types:
+            if x.__class__ is not tuple or not _is_atomic_tuple(x):
+                return False
+    return True
+
+
+class _CloneReferences(object):
+    """
+    Clone a block by pickling and unpickling it (see Block.clone()).
+
+    This implements the deepcopy semantics of Block.clone(): the
+    components and component data beneath the block are copied, and
+    references to components outside of the block (and to functions,
+    such as rules) are preserved.  The references are replaced by
+    persistent ids (their position in a list of referenced objects)
+    when pickling, and restored when unpickling.  As the (C) pickler
+    does not recurse through Python for every object, this is
+    considerably faster than copy.deepcopy.
+
+    Tuples of immutable objects are also preserved, as deepcopy does
+    not copy them (some are used as sentinels, e.g., Set.SortedOrder).
+    Objects that implement their own __deepcopy__ in Python (other
+    than components, e.g., IndexTemplate) are not supported, and raise
+    a PickleError.
+    """
+
+    def __init__(self, block):
+        self._block = block
+        # id(block) -> True if the block is beneath the cloned block
+        self._scope = {id(block): True, id(None): False}
+        self._refs = []
+        # id(obj) -> position in _refs
+        self._ref_ids = {}
+        # Types (other than components) that are pickled by value
+        self._by_value = set()
+
+    def persistent_id(self, obj):
+        if obj.__class__ in self._by_value:
+            return None
+        if obj.__class__ is tuple:
+            if not _is_atomic_tuple(obj):
+                return None
+        elif isinstance(obj, (Component, ComponentData)):
+            _scope = self._scope
+            _id = id(obj)
+            if _id not in _scope:
+                _new = []
+                _block = obj
+                while id(_block) not in _scope:
+                    _new.append(id(_block))
+                    _block = _block.parent_block()
+                _in_scope = _scope[id(_block)]
+                for _id in _new:
+                    _scope[_id] = _in_scope
+                _id = id(obj)
+            if _scope[_id]:
+                return None
+        elif not isinstance(obj, types.FunctionType):
+            _deepcopy = getattr(obj.__class__, '__deepcopy__', None)
+            if hasattr(_deepcopy, '__code__') or \
+               hasattr(_deepcopy, '__func__'):
+                raise pickle.PickleError(
+                    "Cannot clone objects of type %s by pickling"
+                    % (obj.__class__.__name__,))
+            self._by_value.add(obj.__class__)
+            return None
+        _id = id(obj)
+        if _id not in self._ref_ids:
+            self._ref_ids[_id] = len(self._refs)
+            self._refs.append(obj)
+        return self._ref_ids[_id]
+
+    def persistent_load(self, pid):
+        return self._refs[pid]
+
+    def clone(self):
+        buf = BytesIO()
+        pickler = pickle.Pickler(buf, pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = self.persistent_id
+        # Unpickling creates many (cyclically referenced) objects,
+        # which would otherwise repeatedly trigger the garbage collector
+        with PauseGC():
+            pickler.dump(self._block)
+            buf.seek(0)
+            unpickler = pickle.Unpickler(buf)
+            unpickler.persistent_load = self.persistent_load
+            return unpickler.load()
+
+# The Block (with the list of indices and the construction data) being
+# constructed in parallel.  This is inherited by the forked worker
+# processes.
+_parallel_construction = None
+
+def _construct_block_member(pos):
+    """Construct a block member in a worker process."""
+    component, indices, data = _parallel_construction
+    try:
+        _block = component._construct_member(indices[pos], data)
+        return pos, _ExternalReferences(_block).dumps(), None
+    except Exception:
+        return pos, None, traceback.format_exc()
+
+def _fork_context():
+    """
+    Return the multiprocessing context for forked worker processes
+    (or None if processes cannot be forked on this platform).
+    """
+    try:
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            return None
+        return multiprocessing.get_context('fork')
+    except AttributeError:                  #pragma:nocover
+        # Python 2 always forks (except on Windows)
+        if os.name == 'nt':
+            return None
+        return multiprocessing
+
+
 class PseudoMap(object):
     """
     This class presents a "mock" dict interface to the internal
@@ -475,6 +744,11 @@ class _BlockData(ActiveComponentData):
     """
     _Block_reserved_words = set()
 
+    # The cached traversals of the block tree rooted at this block (see
+    # _tree_blocks).  The cache is discarded when this block or any of
+    # its descendants is modified.
+    _tree_cache = None
+
     def __init__(self, component):
         #
         # BLOCK DATA ELEMENTS
@@ -530,6 +804,9 @@ class _BlockData(ActiveComponentData):
         # Note sure why we are deleting these...
         if '_repn' in ans:
             del ans['_repn']
+        # The cached traversals refer to the blocks in this tree
+        if '_tree_cache' in ans:
+            del ans['_tree_cache']
         return ans
 
     #
@@ -932,6 +1209,7 @@ component, use the block del_component() and add_component() methods.
             idx_info[2] += 1
         else:
             self._ctypes[_type] = [_new_idx, _new_idx, 1]
+        self._invalidate_tree_cache()
         #
         # Propagate properties to sub-blocks:
         #   suppressed ctypes
@@ -1008,6 +1286,7 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                 val.construct(data)
             except:
                 err = sys.exc_info()[1]
+                construction_failed(val)
                 logger.error(
                     "Constructing component '%s' from data=%s failed:\n%s: %s",
                     str(val.name), str(data).strip(),
@@ -1048,6 +1327,7 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         ctype_info[2] -= 1
         if ctype_info[2] == 0:
             del self._ctypes[obj.type()]
+        self._invalidate_tree_cache()
 
         # Clear the _parent attribute
         obj._parent = None
@@ -1086,6 +1366,7 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             return
 
         idx = self._decl[name]
+        self._invalidate_tree_cache()
 
         # Update the ctype linked lists
         ctype_info = self._ctypes[obj.type()]
@@ -1133,6 +1414,33 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             self._decl_order[prev] = (self._decl_order[prev][0], idx)
             self._decl_order[idx] = (obj, tmp)
 
+    def activate(self):
+        """Set the active attribute to True"""
+        super(_BlockData, self).activate()
+        self._invalidate_tree_cache()
+
+    def deactivate(self):
+        """Set the active attribute to False"""
+        super(_BlockData, self).deactivate()
+        self._invalidate_tree_cache()
+
+    def _invalidate_tree_cache(self):
+        """
+        Discard the cached traversals of this block and its ancestors
+        (whose trees contain this block).
+        """
+        _block = self
+        while _block is not None:
+            if _block._tree_cache is not None:
+                _block._tree_cache = None
+            try:
+                _block = _block.parent_block()
+            except AttributeError:
+                # Components may be added to scalar blocks (e.g.,
+                # Disjuncts) before the block itself is initialized
+                # (and added to a tree)
+                return
+
     def clone(self):
         """
         TODO
@@ -1151,13 +1459,21 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         # NonNegativeReals, etc) that are not "owned" by any blocks and
         # should be preserved as singletons.
         #
+        # The block is cloned by pickling it (see _CloneReferences),
+        # which is faster than deepcopy.  If that fails (e.g., because
+        # the block contains objects that cannot be pickled), we fall
+        # back on deepcopy.
+        #
         save_parent, self._parent = self._parent, None
         try:
-            new_block = copy.deepcopy(
-                self, {
-                    '__block_scope__': {id(self): True, id(None): False},
-                    '__paranoid__': False,
-                    })
+            try:
+                new_block = _CloneReferences(self).clone()
+            except Exception:
+                new_block = copy.deepcopy(
+                    self, {
+                        '__block_scope__': {id(self): True, id(None): False},
+                        '__paranoid__': False,
+                        })
         except:
             new_block = copy.deepcopy(
                 self, {
@@ -1260,6 +1576,9 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             #    _items = comp.iteritems()
             # except AttributeError:
             #    _items = [ (None, comp) ]
+            if comp._constructed is False:
+                # construction deferred by create_instance(lazy=True)
+                comp._construct_deferred()
             if comp.is_indexed():
                 _items = comp.iteritems()
             # This is a hack (see _NOTE_ above).
@@ -1311,7 +1630,8 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
             for x in self.component_map(ctype, active, sort).itervalues():
                 yield x
             return
-        for _block in self.block_data_objects(active, sort, descend_into, descent_order):
+        for _block in self._descendant_blocks(
+                ctype, active, sort, descend_into, descent_order):
             for x in _block.component_map(ctype, active, sort).itervalues():
                 yield x
 
@@ -1328,11 +1648,8 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
         descends into sub-blocks.
         """
         if descend_into:
-            block_generator = self.block_data_objects(
-                active=active,
-                sort=sort,
-                descend_into=descend_into,
-                descent_order=descent_order)
+            block_generator = self._descendant_blocks(
+                ctype, active, sort, descend_into, descent_order)
         else:
             block_generator = (self,)
 
@@ -1358,11 +1675,8 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
 
         """
         if descend_into:
-            block_generator = self.block_data_objects(
-                active=active,
-                sort=sort,
-                descend_into=descend_into,
-                descent_order=descent_order)
+            block_generator = self._descendant_blocks(
+                ctype, active, sort, descend_into, descent_order)
         else:
             block_generator = (self,)
 
@@ -1403,18 +1717,114 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
                 return ().__iter__()
             else:
                 return (self,).__iter__()
-        #
-        # Rely on the _tree_iterator:
-        #
+        return self._descendant_blocks(
+            None, active, sort, descend_into, descent_order)
+
+    def _descendant_blocks(self, ctype, active, sort, descend_into,
+                           descent_order):
+        """
+        Return a generator over the blocks returned by
+        block_data_objects() that may hold components of the
+        specified ctype.  Prefix depth-first traversals are cached (see
+        _tree_blocks), in which case blocks that do not declare any
+        component of the ctype (a component type) are skipped.
+        """
         if descend_into is True:
             descend_into = (Block,)
         elif isclass(descend_into):
             descend_into = (descend_into,)
+        # Note: the test for tuple excludes SubclassOf, which cannot
+        # be hashed (or iterated over)
+        if (descent_order is None or
+            descent_order == TraversalStrategy.PrefixDepthFirstSearch) \
+            and type(descend_into) is tuple \
+            and all(isclass(x) for x in descend_into):
+            if active is not None and self.active != active:
+                return ().__iter__()
+            if not isclass(ctype):
+                ctype = None
+            return self._tree_blocks(ctype, active, sort, descend_into)
+        #
+        # Rely on the _tree_iterator:
+        #
         return self._tree_iterator(ctype=descend_into,
                                    active=active,
                                    sort=sort,
                                    traversal=descent_order)
 
+    def _tree_blocks(self, ctype, active, sort, descend_into):
+        """
+        Generator implementing a cached prefix order depth-first
+        search (see _prefix_dfs_iterator).  If ctype is not None, only
+        the blocks that declare components of that ctype are returned.
+
+        The first traversal of the tree records the blocks it returns
+        in the _tree_cache of this block, and subsequent traversals
+        iterate over the recorded blocks.  Any change to the tree
+        (adding, removing or reclassifying components, adding block
+        data, or (de)activating blocks) discards the cache of the
+        modified block and its ancestors.  If the tree is modified
+        while iterating over the cached blocks, the search continues
+        on the modified tree (as _prefix_dfs_iterator would).
+        """
+        key = (ctype, active, SortComponents.sort_names(sort),
+               SortComponents.sort_indices(sort), descend_into)
+        cache = self._tree_cache
+        if cache is None:
+            cache = self._tree_cache = {}
+        blocks = cache.get(key, None)
+        if blocks is None:
+            if ctype is None:
+                walker = self._prefix_dfs_iterator(descend_into, active, sort)
+            else:
+                walker = (_block for _block in self._tree_blocks(
+                              None, active, sort, descend_into)
+                          if ctype in _block._ctypes)
+            blocks = []
+            for _block in walker:
+                blocks.append(_block)
+                yield _block
+            # Only record complete traversals of an unmodified tree
+            if self._tree_cache is cache:
+                cache[key] = tuple(blocks)
+            return
+        for _block in blocks:
+            if self._tree_cache is not cache:
+                for _block in self._resume_prefix_dfs(
+                        _last, descend_into, active, sort):
+                    if ctype is None or ctype in _block._ctypes:
+                        yield _block
+                return
+            yield _block
+            _last = _block
+
+    def _resume_prefix_dfs(self, last, ctype, active, sort):
+        """
+        Continue a prefix order depth-first search of the tree rooted
+        at this block after the block 'last' (that is, return the
+        descendants of last and then the blocks following last and its
+        ancestors).
+        """
+        _walker = last._prefix_dfs_iterator(ctype, active, sort)
+        advance_iterator(_walker)
+        for _block in _walker:
+            yield _block
+        while last is not self:
+            _parent = last.parent_block()
+            if _parent is None:
+                # last was removed from the tree
+                return
+            _siblings = _parent.component_data_objects(
+                ctype=ctype, active=active, sort=sort, descend_into=False)
+            for _block in _siblings:
+                if _block is last:
+                    break
+            for _sibling in _siblings:
+                for _block in _sibling._prefix_dfs_iterator(
+                        ctype, active, sort):
+                    yield _block
+            last = _parent
+
     def _tree_iterator(self,
                        ctype=None,
                        active=None,
@@ -1710,6 +2120,9 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
 
         if solver_capability is None:
             def solver_capability(x): return True
+        _model = self.model()
+        if getattr(_model, '_deferred_construction', None):
+            _model.construct_deferred()
         (filename, smap) = problem_writer(self,
                                           filename,
                                           solver_capability,
@@ -1746,6 +2159,20 @@ class Block(ActiveIndexedComponent):
     that they contain except blocks.  Blocks contained by other
     blocks use their local attribute to determine whether construction
     is deferred.
+
+    The members of an indexed Block can be constructed in worker
+    processes with the 'parallel' option (the number of processes, or
+    True to use one process per CPU).  This requires that the members
+    are independent: the rule for a member may only add or modify
+    components on that member, and may only reference components
+    outside of the member (e.g., Sets and Params on the model) that
+    exist before the Block is constructed.  The constructed members
+    are pickled and transferred back to the parent process, where the
+    references to external components are restored (component rules
+    that are local functions, such as lambdas, are not transferred;
+    other local functions, e.g., Set filters, are an error).  Parallel
+    construction uses forked processes, and falls back to serial
+    construction on platforms that do not support fork.
     """
 
     _ComponentDataClass = _BlockData
@@ -1763,6 +2190,7 @@ class Block(ActiveIndexedComponent):
         self._suppress_ctypes = set()
         self._rule = kwargs.pop('rule', None)
         self._options = kwargs.pop('options', None)
+        self._parallel = kwargs.pop('parallel', None)
         _concrete = kwargs.pop('concrete', False)
         kwargs.setdefault('ctype', Block)
         ActiveIndexedComponent.__init__(self, *args, **kwargs)
@@ -1775,6 +2203,38 @@ class Block(ActiveIndexedComponent):
     def _getitem_when_not_present(self, idx):
         return self._setitem_when_not_present(idx, None)
 
+    def _setitem_when_not_present(self, index, value):
+        ans = super(Block, self)._setitem_when_not_present(index, value)
+        self._invalidate_parent_tree_cache()
+        return ans
+
+    def __delitem__(self, index):
+        super(Block, self).__delitem__(index)
+        self._invalidate_parent_tree_cache()
+
+    def clear(self):
+        super(Block, self).clear()
+        self._invalidate_parent_tree_cache()
+
+    def activate(self):
+        """Set the active attribute to True"""
+        super(Block, self).activate()
+        self._invalidate_parent_tree_cache()
+
+    def deactivate(self):
+        """Set the active attribute to False"""
+        super(Block, self).deactivate()
+        self._invalidate_parent_tree_cache()
+
+    def _invalidate_parent_tree_cache(self):
+        """
+        Discard the cached traversals of the blocks that contain this
+        component (see _BlockData._tree_blocks).
+        """
+        _parent = self.parent_block()
+        if _parent is not None:
+            _parent._invalidate_tree_cache()
+
     def find_component(self, label_or_component):
         """
         Return a block component given a name.
@@ -1824,31 +2284,87 @@ class Block(ActiveIndexedComponent):
         #    (_BlockConstruction.data) that the individual blocks'
         #    add_component() can refer back to to handle component
         #    construction.
-        for idx in self._index:
-            _block = self[idx]
-            if data is not None and idx in data:
-                _BlockConstruction.data[id(_block)] = data[idx]
-            obj = apply_indexed_rule(
-                self, self._rule, _block, idx, self._options)
-            if id(_block) in _BlockConstruction.data:
-                del _BlockConstruction.data[id(_block)]
-
-            if isinstance(obj, _BlockData) and obj is not _block:
-                # If the user returns a block, use their block instead
-                # of the empty one we just created.
-                for c in list(obj.component_objects(descend_into=False)):
-                    obj.del_component(c)
-                    _block.add_component(c.local_name, c)
-                # transfer over any other attributes that are not components
-                for name, val in iteritems(obj.__dict__):
-                    if not hasattr(_block, name) and not hasattr(self, name):
-                        super(_BlockData, _block).__setattr__(name, val)
-
-            # TBD: Should we allow skipping Blocks???
-            # if obj is Block.Skip and idx is not None:
-            #   del self._data[idx]
+        if self._parallel and self.is_indexed() and len(self._index) > 1:
+            self._construct_parallel(data)
+        else:
+            for idx in self._index:
+                self._construct_member(idx, data)
         timer.report()
 
+    def _construct_member(self, idx, data):
+        """Apply the rule to construct the block with index idx."""
+        _block = self[idx]
+        if data is not None and idx in data:
+            _BlockConstruction.data[id(_block)] = data[idx]
+        obj = apply_indexed_rule(
+            self, self._rule, _block, idx, self._options)
+        if id(_block) in _BlockConstruction.data:
+            del _BlockConstruction.data[id(_block)]
+
+        if isinstance(obj, _BlockData) and obj is not _block:
+            # If the user returns a block, use their block instead
+            # of the empty one we just created.
+            for c in list(obj.component_objects(descend_into=False)):
+                obj.del_component(c)
+                _block.add_component(c.local_name, c)
+            # transfer over any other attributes that are not components
+            for name, val in iteritems(obj.__dict__):
+                if not hasattr(_block, name) and not hasattr(self, name):
+                    super(_BlockData, _block).__setattr__(name, val)
+
+        # TBD: Should we allow skipping Blocks???
+        # if obj is Block.Skip and idx is not None:
+        #   del self._data[idx]
+        return _block
+
+    def _construct_parallel(self, data):
+        """
+        Construct the block members in forked worker processes (see
+        the 'parallel' option).
+        """
+        global _parallel_construction
+        context = _fork_context()
+        if context is None:
+            logger.warning(
+                "Parallel construction of Block '%s' requires forking "
+                "processes, which is not supported on this platform.  "
+                "Constructing the Block serially." % (self.name,))
+            for idx in self._index:
+                self._construct_member(idx, data)
+            return
+        if self._parallel is True:
+            num_processes = multiprocessing.cpu_count()
+        else:
+            num_processes = int(self._parallel)
+        indices = list(self._index)
+        num_processes = max(1, min(num_processes, len(indices)))
+        references = _ExternalReferences(self)
+        _parallel_construction = (self, indices, data)
+        pool = context.Pool(num_processes)
+        try:
+            results = pool.imap(
+                _construct_block_member,
+                range(len(indices)),
+                max(1, len(indices) // (4*num_processes)))
+            for pos, block_data, error in results:
+                if error is not None:
+                    logger.error(
+                        "Rule failed when constructing block %s[%s] in a "
+                        "worker process:\n%s"
+                        % (self.name, indices[pos], error))
+                    raise RuntimeError(
+                        "Parallel construction of Block '%s' failed for "
+                        "index %s" % (self.name, indices[pos]))
+                self._data[indices[pos]] = references.loads(block_data)
+            self._invalidate_parent_tree_cache()
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+            _parallel_construction = None
+
     def pprint(self, filename=None, ostream=None, verbose=False, prefix=""):
         """
         Print block information
@@ -366,6 +366,41 @@ class Component(_ComponentBase):
         self._constructed = False
         self.construct(data=data)
 
+    def _deferred_owner(self):
+        """Return the (model, name) of the pending top-level component
+        containing this component, or None if its construction was not
+        deferred by Model.create_instance(lazy=True)."""
+        comp = self
+        block = comp.parent_block()
+        while block is not None:
+            parent = block.parent_block()
+            if parent is None:
+                break
+            comp = block.parent_component()
+            block = parent
+        if block is None:
+            return None
+        deferred = getattr(block, '_deferred_construction', None)
+        if not deferred or comp.local_name not in deferred \
+           or block.component(comp.local_name) is not comp:
+            return None
+        return block, comp.local_name
+
+    def _construct_deferred(self):
+        """Construct this component if its construction was deferred
+
+        Model.create_instance(lazy=True) defers the construction of
+        some top-level components until they are first accessed.  This
+        constructs the top-level component containing this component
+        (if it is still pending) and returns True if this component is
+        now constructed.
+        """
+        owner = self._deferred_owner()
+        if owner is None:
+            return False
+        owner[0]._construct_deferred_component(owner[1])
+        return self._constructed is not False
+
     def valid_model_component(self):
         """Return True if this can be used as a model component."""
         return True
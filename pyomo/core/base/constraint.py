@@ -635,7 +635,11 @@ class Constraint(ActiveIndexedComponent):
         expr 
             A Pyomo expression for this constraint
         rule 
-            A function that is used to construct constraint expressions
+            A function that is used to construct constraint expressions.
+            For indexed constraints, this can also be a generator
+            function (called with the parent block) that yields
+            (index, expression) pairs for a sparse subset of the index
+            set.
         doc 
             A text string describing this component
         name 
@@ -771,6 +775,16 @@ class Constraint(ActiveIndexedComponent):
                     "of a constraint with a single expression" %
                     (self.name,) )
 
+            _generator = None
+            if inspect.isgeneratorfunction(_init_rule):
+                _generator = _init_rule(_self_parent)
+            elif inspect.isgenerator(_init_rule):
+                _generator = _init_rule
+            if _generator is not None:
+                self._construct_from_generator(_generator)
+                timer.report()
+                return
+
             for ndx in self._index:
                 try:
                     tmp = apply_indexed_rule(self,
@@ -790,6 +804,36 @@ class Constraint(ActiveIndexedComponent):
                 self._setitem_when_not_present(ndx, tmp)
         timer.report()
 
+    def _construct_from_generator(self, _generator):
+        """
+        Construct the constraints from a generator that yields
+        (index, expression) pairs.
+
+        This allows sparse constraints to be declared over large
+        (e.g., product) index sets without calling a rule for every
+        member of the index set.  Each index is validated against the
+        index set.
+        """
+        while True:
+            try:
+                ndx, tmp = next(_generator)
+            except StopIteration:
+                break
+            except Exception:
+                err = sys.exc_info()[1]
+                logger.error(
+                    "Rule failed when generating (index, expression) "
+                    "pairs for constraint %s:\n%s: %s"
+                    % (self.name,
+                       type(err).__name__,
+                       err))
+                raise
+            if ndx in self._data:
+                raise ValueError(
+                    "Constraint '%s': the rule generated the index %s "
+                    "more than once" % (self.name, str(ndx)))
+            self[ndx] = tmp
+
     def _pprint(self):
         """
         Return data that will be printed for this component.
@@ -935,7 +979,7 @@ class SimpleConstraint(_GeneralConstraintData, Constraint):
     @property
     def body(self):
         """Access the body of a constraint expression."""
-        if self._constructed:
+        if self._constructed or self._construct_deferred():
             if len(self._data) == 0:
                 raise ValueError(
                     "Accessing the body of SimpleConstraint "
@@ -952,7 +996,7 @@ class SimpleConstraint(_GeneralConstraintData, Constraint):
     @property
     def lower(self):
         """Access the lower bound of a constraint expression."""
-        if self._constructed:
+        if self._constructed or self._construct_deferred():
             if len(self._data) == 0:
                 raise ValueError(
                     "Accessing the lower bound of SimpleConstraint "
@@ -969,7 +1013,7 @@ class SimpleConstraint(_GeneralConstraintData, Constraint):
     @property
     def upper(self):
         """Access the upper bound of a constraint expression."""
-        if self._constructed:
+        if self._constructed or self._construct_deferred():
             if len(self._data) == 0:
                 raise ValueError(
                     "Accessing the upper bound of SimpleConstraint "
@@ -986,7 +1030,7 @@ class SimpleConstraint(_GeneralConstraintData, Constraint):
     @property
     def equality(self):
         """A boolean indicating whether this is an equality constraint."""
-        if self._constructed:
+        if self._constructed or self._construct_deferred():
             if len(self._data) == 0:
                 raise ValueError(
                     "Accessing the equality flag of SimpleConstraint "
@@ -1003,7 +1047,7 @@ class SimpleConstraint(_GeneralConstraintData, Constraint):
     @property
     def strict_lower(self):
         """A boolean indicating whether this constraint has a strict lower bound."""
-        if self._constructed:
+        if self._constructed or self._construct_deferred():
             if len(self._data) == 0:
                 raise ValueError(
                     "Accessing the strict_lower flag of SimpleConstraint "
@@ -1020,7 +1064,7 @@ class SimpleConstraint(_GeneralConstraintData, Constraint):
     @property
     def strict_upper(self):
         """A boolean indicating whether this constraint has a strict upper bound."""
-        if self._constructed:
+        if self._constructed or self._construct_deferred():
             if len(self._data) == 0:
                 raise ValueError(
                     "Accessing the strict_upper flag of SimpleConstraint "
@@ -1047,7 +1091,7 @@ class SimpleConstraint(_GeneralConstraintData, Constraint):
 
     def set_value(self, expr):
         """Set the expression on this constraint."""
-        if not self._constructed:
+        if not (self._constructed or self._construct_deferred()):
             raise ValueError(
                 "Setting the value of constraint '%s' "
                 "before the Constraint has been constructed (there "
@@ -329,12 +329,36 @@ class Expression(IndexedComponent):
         return dict((key, expression_data.expr) \
                     for key, expression_data in iteritems(self))
 
+    #
+    # A utility to extract the values of the expressions with the
+    # indices in index_order (by default, the iteration order of this
+    # component), returned as a NumPy array.  NaN is returned for
+    # undefined expressions.
+    #
+    def extract_values_array(self, index_order=None):
+        return self._values_array(
+            expression_data(exception=False)
+            for expression_data in self._data_list(index_order))
+
     #
     # takes as input a (index, value) dictionary for updating this
     # Expression.  if check=True, then both the index and value are
-    # checked through the __getitem__ method of this class.
+    # checked through the __getitem__ method of this class.  A NumPy
+    # array (or sequence) of values for the indices in index_order (by
+    # default, the iteration order of this component) may also be
+    # given.  NaN array entries make the expressions undefined.
     #
-    def store_values(self, new_values):
+    def store_values(self, new_values, index_order=None):
+
+        if index_order is not None or self._is_value_sequence(new_values):
+            expression_list = self._data_list(index_order)
+            new_values = self._value_list(new_values, len(expression_list))
+            for expression_data, new_value in zip(expression_list,
+                                                  new_values):
+                if new_value.__class__ is float and new_value != new_value:
+                    new_value = None
+                expression_data.set_value(new_value)
+            return
 
         if (self.is_indexed() is False) and \
            (not None in new_values):
@@ -429,7 +453,7 @@ class SimpleExpression(_GeneralExpressionData, Expression):
     @property
     def expr(self):
         """Return expression on this expression."""
-        if self._constructed:
+        if self._constructed or self._construct_deferred():
             return _GeneralExpressionData.expr.fget(self)
         raise ValueError(
             "Accessing the expression of expression '%s' "
@@ -457,7 +481,7 @@ class SimpleExpression(_GeneralExpressionData, Expression):
 
     def set_value(self, expr):
         """Set the expression on this expression."""
-        if self._constructed:
+        if self._constructed or self._construct_deferred():
             return _GeneralExpressionData.set_value(self, expr)
         raise ValueError(
             "Setting the expression of expression '%s' "
@@ -467,7 +491,7 @@ class SimpleExpression(_GeneralExpressionData, Expression):
 
     def is_constant(self):
         """A boolean indicating whether this expression is constant."""
-        if self._constructed:
+        if self._constructed or self._construct_deferred():
             return _GeneralExpressionData.is_constant(self)
         raise ValueError(
             "Accessing the is_constant flag of expression '%s' "
@@ -477,7 +501,7 @@ class SimpleExpression(_GeneralExpressionData, Expression):
 
     def is_fixed(self):
         """A boolean indicating whether this expression is fixed."""
-        if self._constructed:
+        if self._constructed or self._construct_deferred():
             return _GeneralExpressionData.is_fixed(self)
         raise ValueError(
             "Accessing the is_fixed flag of expression '%s' "
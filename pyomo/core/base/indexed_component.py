@@ -18,7 +18,15 @@ from pyomo.core.base.component import Component, ActiveComponent
 from pyomo.core.base.config import PyomoOptions
 from pyomo.common import DeveloperError
 
-from six import PY3, itervalues, iteritems
+from six import PY3, itervalues, iteritems, string_types
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:                         #pragma:nocover
+    numpy_available = False
+
+_nan = float('nan')
 
 UnindexedComponent_set = set([None])
 
@@ -216,15 +224,22 @@ class IndexedComponent(Component):
         Return the number of component data objects stored by this
         component.
         """
+        if self._constructed is False:
+            self._construct_deferred()
         return len(self._data)
 
     def __contains__(self, idx):
         """Return true if the index is in the dictionary"""
+        if self._constructed is False:
+            self._construct_deferred()
         return idx in self._data
 
     def __iter__(self):
         """Iterate over the keys in the dictionary"""
 
+        if self._constructed is False:
+            self._construct_deferred()
+
         if not getattr(self._index, 'concrete', True):
             #
             # If the index set is virtual (e.g., Any) then return the
@@ -260,6 +275,19 @@ You can silence this warning by one of three ways:
        where it is empty.
 """ % (self.name,) )
 
+            #
+            # Test each element of a sparse data with an ordered
+            # index set in order.  This is potentially *slow*: if
+            # the component is in fact very sparse, we could be
+            # iterating over a huge (dense) index in order to sort a
+            # small number of indices.  However, this provides a
+            # consistent ordering that the user expects.
+            #
+            def _sparse_iter_gen(self):
+                for idx in self._index.__iter__():
+                    if idx in self._data:
+                        yield idx
+
             if not hasattr(self._index, 'ordered') or not self._index.ordered:
                 #
                 # If the index set is not ordered, then return the
@@ -267,19 +295,20 @@ You can silence this warning by one of three ways:
                 # fine because the data is unordered.
                 #
                 return self._data.__iter__()
-            else:
+            elif hasattr(self._index, 'ord'):
                 #
-                # Test each element of a sparse data with an ordered
-                # index set in order.  This is potentially *slow*: if
-                # the component is in fact very sparse, we could be
-                # iterating over a huge (dense) index in order to sort a
-                # small number of indices.  However, this provides a
-                # consistent ordering that the user expects.
+                # Sort the (sparse) data by the position of each index
+                # in the ordered index set.  This avoids iterating
+                # over a huge (dense) index, e.g., a product of
+                # RangeSets, where ord() is computed arithmetically.
                 #
-                def _sparse_iter_gen(self):
-                    for idx in self._index.__iter__():
-                        if idx in self._data:
-                            yield idx
+                try:
+                    return iter(sorted(self._data, key=self._index.ord))
+                except (IndexError, KeyError, TypeError):
+                    # Some indices are not in the index set (or the
+                    # index does not support ordinal lookups)
+                    return _sparse_iter_gen(self)
+            else:
                 return _sparse_iter_gen(self)
 
     def keys(self):
@@ -435,6 +464,10 @@ You can silence this warning by one of three ways:
             del self._data[index]
 
     def _not_constructed_error(self, idx):
+        # Components whose construction was deferred by
+        # create_instance(lazy=True) are constructed on first access
+        if self._construct_deferred():
+            return
         # Generate an error because the component is not constructed
         if not self.is_indexed():
             idx_str = ''
@@ -694,6 +727,64 @@ value() function.""" % ( self.name, i ))
                  lambda k, v: [ type(v) ]
                  )
 
+    def _data_list(self, index_order=None):
+        """Return a list of the component data for a sequence of indices.
+
+        If index_order is None, the data is returned in the iteration
+        order of this component.  This is used by the bulk
+        (array-based) accessors of derived components.
+        """
+        if index_order is None:
+            index_order = self
+        _data = self._data
+        try:
+            return [_data[index] for index in index_order]
+        except (KeyError, TypeError):
+            # fall back on __getitem__ to validate the indices (and
+            # create the data for implicitly defined members)
+            return [self[index] for index in index_order]
+
+    def _values_array(self, values, dtype=float):
+        """Convert a list of values to a NumPy array.
+
+        Values that are None (undefined) are stored as NaN.  This is
+        used by the extract_values_array methods of derived
+        components.
+        """
+        if not numpy_available:
+            raise RuntimeError(
+                "Cannot extract the values of component '%s' as an array: "
+                "numpy is not available" % (self.name,))
+        return numpy.array([_nan if val is None else val for val in values],
+                           dtype=dtype)
+
+    @staticmethod
+    def _is_value_sequence(values):
+        """Return True if values is an array (or sequence) of values.
+
+        Dictionaries (anything with an items() method), strings and
+        scalars are not sequences of values.
+        """
+        return hasattr(values, '__len__') and \
+            not hasattr(values, 'items') and \
+            not isinstance(values, string_types)
+
+    def _value_list(self, values, n):
+        """Convert an array (or sequence) of n values to a list.
+
+        NumPy arrays are converted with tolist() so that the elements
+        are native Python numbers.
+        """
+        if hasattr(values, 'tolist'):
+            values = values.tolist()
+        else:
+            values = list(values)
+        if len(values) != n:
+            raise ValueError(
+                "Expected an array of %s values for component '%s' "
+                "(got %s values)" % (n, self.name, len(values)))
+        return values
+
     def id_index_map(self):
         """
         Return an dictionary id->index for
@@ -734,6 +825,10 @@ class ActiveIndexedComponent(IndexedComponent, ActiveComponent):
     def activate(self):
         """Set the active attribute to True"""
         super(ActiveIndexedComponent, self).activate()
+        if self._constructed is False and \
+           self._deferred_owner() is not None:
+            # leave deferred components unconstructed
+            return
         if self.is_indexed():
             for component_data in itervalues(self):
                 component_data.activate()
@@ -741,6 +836,11 @@ class ActiveIndexedComponent(IndexedComponent, ActiveComponent):
     def deactivate(self):
         """Set the active attribute to False"""
         super(ActiveIndexedComponent, self).deactivate()
+        if self._constructed is False and \
+           self._deferred_owner() is not None:
+            # leave deferred components unconstructed (their data is
+            # deactivated when they are constructed)
+            return
         if self.is_indexed():
             for component_data in itervalues(self):
                 component_data.deactivate()
@@ -16,6 +16,8 @@ import types
 
 from six import itervalues
 
+from pyomo.common import timing
+
 logger = logging.getLogger('pyomo.core')
 
 
@@ -51,6 +53,8 @@ def create_name(name, ndx):
 
 
 def apply_indexed_rule(obj, rule, model, index, options=None):
+    if timing._construction_profiler is not None:
+        timing._construction_profiler.rule_call()
     try:
         if options is None:
             if index.__class__ is tuple:
@@ -91,6 +95,8 @@ def apply_indexed_rule(obj, rule, model, index, options=None):
                     return rule(model, index, **options)
 
 def apply_parameterized_indexed_rule(obj, rule, model, param, index):
+    if timing._construction_profiler is not None:
+        timing._construction_profiler.rule_call()
     if index.__class__ is tuple:
         return rule(model, param, *index)
     if index is None:
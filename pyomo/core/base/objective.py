@@ -482,7 +482,7 @@ class SimpleObjective(_GeneralObjectiveData, Objective):
     @property
     def expr(self):
         """Access the expression of this objective."""
-        if self._constructed:
+        if self._constructed or self._construct_deferred():
             if len(self._data) == 0:
                 raise ValueError(
                     "Accessing the expression of SimpleObjective "
@@ -517,7 +517,7 @@ class SimpleObjective(_GeneralObjectiveData, Objective):
     @property
     def sense(self):
         """Access sense (direction) of this objective."""
-        if self._constructed:
+        if self._constructed or self._construct_deferred():
             if len(self._data) == 0:
                 raise ValueError(
                     "Accessing the sense of SimpleObjective "
@@ -548,7 +548,7 @@ class SimpleObjective(_GeneralObjectiveData, Objective):
 
     def set_value(self, expr):
         """Set the expression of this objective."""
-        if not self._constructed:
+        if not (self._constructed or self._construct_deferred()):
             raise ValueError(
                 "Setting the value of objective '%s' "
                 "before the Objective has been constructed (there "
@@ -564,7 +564,7 @@ class SimpleObjective(_GeneralObjectiveData, Objective):
 
     def set_sense(self, sense):
         """Set the sense (direction) of this objective."""
-        if self._constructed:
+        if self._constructed or self._construct_deferred():
             if len(self._data) == 0:
                 self._data[None] = self
             return _GeneralObjectiveData.set_sense(self, sense)
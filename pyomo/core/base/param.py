@@ -358,9 +358,30 @@ class Param(IndexedComponent):
             #
             return dict( self.sparse_iteritems() )
 
-    def store_values(self, new_values, check=True):
+    def extract_values_array(self, index_order=None):
         """
-        A utility to update a Param with a dictionary or scalar.
+        A utility to extract the values of the parameters with the
+        indices in index_order (by default, the iteration order of
+        this parameter), returned as a NumPy array.  NaN is returned
+        for mutable parameters without a valid value.
+        """
+        if self._mutable:
+            vals = [param_value(exception=False)
+                    for param_value in self._data_list(index_order)]
+        elif not self.is_indexed():
+            vals = [self()]
+        else:
+            vals = self._data_list(index_order)
+        # Params may have non-numeric values
+        return self._values_array(vals, dtype=None)
+
+    def store_values(self, new_values, check=True, index_order=None):
+        """
+        A utility to update a Param with a dictionary or scalar, or
+        with a NumPy array (or sequence) of values for the indices in
+        index_order (by default, the iteration order of this
+        parameter).  NaN array entries make the parameter values
+        undefined.
 
         If check=True, then both the index and value
         are checked through the __getitem__ method.  Using check=False
@@ -369,6 +390,10 @@ class Param(IndexedComponent):
         if not self._mutable:
             _raise_modifying_immutable_error(self, '*')
         #
+        if index_order is not None or self._is_value_sequence(new_values):
+            self._store_values_array(new_values, check, index_order)
+            return
+        #
         _srcType = type(new_values)
         _isDict = _srcType is dict or ( \
             hasattr(_srcType, '__getitem__')
@@ -425,6 +450,24 @@ class Param(IndexedComponent):
             # scalars have to be handled differently
             self[None] = new_values
 
+    def _store_values_array(self, new_values, check, index_order):
+        if index_order is None:
+            index_order = list(self)
+        param_list = self._data_list(index_order)
+        new_values = self._value_list(new_values, len(param_list))
+        for index, param_value, new_value in zip(index_order,
+                                                 param_list,
+                                                 new_values):
+            if new_value.__class__ is float and new_value != new_value:
+                # NaN: the value is not defined
+                param_value.clear()
+            elif check:
+                param_value.set_value(new_value, index)
+            else:
+                # Bypass the validation and set the value of the
+                # _ParamData object directly
+                param_value._value = new_value
+
     def set_default(self, val):
         """
         Perform error checks and then set the default value for this parameter.
@@ -148,6 +148,12 @@ class RangeSet(OrderedSimpleSet):
                     continue
                 yield val
 
+    def __reversed__(self):
+        if self.filter is None and self.validate is None:
+            return (self._start_val + i*self._step_val
+                    for i in xrange(self._len-1, -1, -1))
+        return reversed(list(self))
+
     def data(self):
         """The underlying set data."""
         return set(self)
@@ -178,13 +184,35 @@ class RangeSet(OrderedSimpleSet):
         if key >= 1:
             if key > self._len:
                 raise IndexError("Cannot index a RangeSet past the last element")
-            return self._start_val + (key-1)*self._step_val
+            pos = key-1
         elif key < 0:
             if self._len+key < 0:
                 raise IndexError("Cannot index a RangeSet past the first element")
-            return self._start_val + (self._len+key)*self._step_val
+            pos = self._len+key
         else:
             raise IndexError("Valid index values for sets are 1 .. len(set) or -1 .. -len(set)")
+        if self.filter is None and self.validate is None:
+            return self._start_val + pos*self._step_val
+        #
+        # Filtered sets are not arithmetic sequences
+        #
+        for i, val in enumerate(self):
+            if i == pos:
+                return val
+
+    def ord(self, match_element):
+        """
+        Return the position index of the input value.  The
+        position indices start at 1.
+        """
+        if not self._set_contains(match_element):
+            raise IndexError("Unknown input element="+str(match_element)+" provided as input to ord() method for set="+self.name)
+        if self.filter is None and self.validate is None:
+            return int(round((match_element-self._start_val)
+                             / float(self._step_val))) + 1
+        for i, val in enumerate(self):
+            if val == match_element:
+                return i + 1
 
     def _set_contains(self, element):
         """
@@ -209,9 +237,9 @@ class RangeSet(OrderedSimpleSet):
         #
         # Now see if the element if filtered or invalid.
         #
-        if self.filter is not None and not self.filter(element):
+        if self.filter is not None and not apply_indexed_rule(self, self.filter, self._parent(), element):
             return False
-        if self.validate is not None and not self.validate(self, element):
+        if self.validate is not None and not apply_indexed_rule(self, self.validate, self._parent(), element):
             return False
         return True
 
@@ -480,7 +480,7 @@ class _OrderedSetData(_SetDataBase):
         except KeyError:
             raise KeyError("Cannot obtain nextw() member of set="+self.name+"; input element="+str(match_element)+" is not a member of the set!")
         #
-        return self[(element_position+k-1) % len(self.value) + 1]
+        return self[(element_position+k-1) % len(self) + 1]
 
     def prev(self, match_element, k=1):
         """
@@ -1593,6 +1593,120 @@ class _SetProduct(_SetOperator):
             ans *= len(_set)
         return ans
 
+    def _ordered_factors(self):
+        """
+        Return the dimension of each factor of this product,
+        verifying that all the factors support ordinal lookups.
+        """
+        dimens = []
+        for _set in self.set_tuple:
+            if not _set.ordered or not hasattr(_set, 'ord') \
+               or _set.dimen is None:
+                raise TypeError(
+                    "Cannot perform ordinal operations on the product set "
+                    "'%s': all factors must be ordered sets with a fixed "
+                    "dimension" % (self.name,))
+            dimens.append(_set.dimen)
+        return dimens
+
+    def __getitem__(self, key):
+        """
+        Return the member of this (ordered) product in position key.
+        Valid positions are 1 .. len(set), or -1 .. -len(set).
+
+        The member is computed from the positions in the factors of
+        the product (the last factor varies fastest, as when
+        iterating over the product), so the product is never
+        materialized.
+        """
+        self._ordered_factors()
+        n = len(self)
+        if key >= 1:
+            if key > n:
+                raise IndexError("Cannot index a set past the last element")
+            pos = key - 1
+        elif key < 0:
+            if n+key < 0:
+                raise IndexError("Cannot index a set past the first element")
+            pos = n + key
+        else:
+            raise IndexError("Valid index values for sets are 1 .. len(set) or -1 .. -len(set)")
+        ans = []
+        for _set in reversed(self.set_tuple):
+            pos, i = divmod(pos, len(_set))
+            val = _set[i+1]
+            if _set.dimen == 1:
+                ans.append(val)
+            else:
+                ans.extend(reversed(val))
+        ans.reverse()
+        return tuple(ans)
+
+    def ord(self, match_element):
+        """
+        Return the position index of the input value in this (ordered)
+        product.  The position indices start at 1.
+        """
+        dimens = self._ordered_factors()
+        if type(match_element) is not tuple or \
+           len(match_element) != sum(dimens):
+            raise IndexError("Unknown input element="+str(match_element)+" provided as input to ord() method for set="+self.name)
+        pos = 0
+        ctr = 0
+        for _set, d in zip(self.set_tuple, dimens):
+            if d == 1:
+                val = match_element[ctr]
+            else:
+                val = match_element[ctr:ctr+d]
+            ctr += d
+            pos = pos*len(_set) + _set.ord(val) - 1
+        return pos + 1
+
+    def first(self):
+        """
+        Return the first element of the (ordered) product.
+        """
+        return self[1]
+
+    def last(self):
+        """
+        Return the last element of the (ordered) product.
+        """
+        return self[-1]
+
+    def next(self, match_element, k=1):
+        """
+        Return the next element in the (ordered) product.  If the
+        next element is beyond the end of the set, then an exception
+        is raised.
+        """
+        position = self.ord(match_element) + k
+        if position < 1 or position > len(self):
+            raise KeyError("Cannot obtain next() member of set="+self.name+"; failed to access item in position="+str(position))
+        return self[position]
+
+    def nextw(self, match_element, k=1):
+        """
+        Return the next element in the (ordered) product, wrapping
+        around to the beginning of the set.
+        """
+        return self[(self.ord(match_element)+k-1) % len(self) + 1]
+
+    def prev(self, match_element, k=1):
+        """
+        Return the previous element in the (ordered) product.  If the
+        previous element is before the start of the set, then an
+        exception is raised.
+        """
+        return self.next(match_element, k=-k)
+
+    def prevw(self, match_element, k=1):
+        """
+        Return the previous element in the (ordered) product, wrapping
+        around to the end of the set.
+        """
+        return self.nextw(match_element, k=-k)
+
     def _compute_dimen(self):
         ans=0
         for _set in self.set_tuple:
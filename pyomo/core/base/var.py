@@ -10,11 +10,15 @@
 
 __all__ = ['Var', '_VarData', '_GeneralVarData', 'VarList', 'SimpleVar']
 
+import inspect
 import logging
 from weakref import ref as weakref_ref
 
 from pyomo.common.timing import ConstructionTimer
-from pyomo.core.base.numvalue import NumericValue, value, is_fixed
+from pyomo.core.base.numvalue import (NumericValue,
+                                      value,
+                                      is_fixed,
+                                      native_numeric_types)
 from pyomo.core.base.set_types import BooleanSet, IntegerSet, RealSet, Reals
 from pyomo.core.base.plugin import ModelComponentFactory
 from pyomo.core.base.component import ComponentData
@@ -26,8 +30,16 @@ from pyomo.core.base.util import is_functor
 from six import iteritems, itervalues
 from six.moves import xrange
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:                         #pragma:nocover
+    numpy_available = False
+
 logger = logging.getLogger('pyomo.core')
 
+_nan = float('nan')
+
 class _VarData(ComponentData, NumericValue):
     """
     This class defines the data for a single variable.
@@ -475,7 +487,13 @@ class Var(IndexedComponent):
         dense (bool, optional): Instantiate all elements from
             `index_set()` when constructing the Var (True) or just the
             variables returned by `initialize`/`rule` (False).  Defaults
-            to True.
+            to True.  If `initialize` is a generator function, it is
+            called with the parent block and only the variables for the
+            (index, value) pairs that it yields are created.
+        columnar (bool, optional): Store the values, bounds, domains
+            and fixed/stale flags of an indexed Var in NumPy arrays
+            rather than on each variable data object (see
+            :class:`ColumnarIndexedVar`).  Defaults to False.
     """
 
     _ComponentDataClass = _GeneralVarData
@@ -485,6 +503,8 @@ class Var(IndexedComponent):
             return super(Var, cls).__new__(cls)
         if not args or (args[0] is UnindexedComponent_set and len(args)==1):
             return SimpleVar.__new__(SimpleVar)
+        elif kwds.get('columnar', False):
+            return ColumnarIndexedVar.__new__(ColumnarIndexedVar)
         else:
             return IndexedVar.__new__(IndexedVar)
 
@@ -498,6 +518,7 @@ class Var(IndexedComponent):
         domain = kwd.pop('domain', domain)
         bounds = kwd.pop('bounds', None)
         self._dense = kwd.pop('dense', True)
+        kwd.pop('columnar', None)
 
         #
         # Initialize the base class
@@ -559,15 +580,33 @@ class Var(IndexedComponent):
 
     extract_values = get_values
 
-    def set_values(self, new_values, valid=False):
+    def extract_values_array(self, index_order=None):
+        """
+        Return a NumPy array with the values of the variables with the
+        indices in index_order (by default, the iteration order of
+        this component).  NaN is returned for variables without a
+        value.
+        """
+        return self._values_array(
+            vardata.value for vardata in self._data_list(index_order))
+
+    def set_values(self, new_values, valid=False, index_order=None):
         """
-        Set the values of a dictionary.
+        Set the values from a dictionary, or from an array with the
+        values of the variables with the indices in index_order (by
+        default, the iteration order of this component).  NaN array
+        entries are stored as None.
 
-        The default behavior is to validate the values in the
-        dictionary.
+        The default behavior is to validate the values.
         """
-        for index, new_value in iteritems(new_values):
-            self[index].set_value(new_value, valid)
+        if hasattr(new_values, 'items'):
+            for index, new_value in iteritems(new_values):
+                self[index].set_value(new_value, valid)
+            return
+        vardata_list = self._data_list(index_order)
+        new_values = self._value_list(new_values, len(vardata_list))
+        for vardata, val in zip(vardata_list, new_values):
+            vardata.set_value(None if val != val else val, valid)
 
     def construct(self, data=None):
         """Construct this component."""
@@ -594,6 +633,8 @@ class Var(IndexedComponent):
         if not self.is_indexed():
             self._data[None] = self
             self._initialize_members((None,))
+        elif inspect.isgeneratorfunction(self._value_init_rule):
+            self._construct_from_generator()
         elif self._dense:
             # This loop is optimized for speed with pypy.
             # Calling dict.update((...) for ...) is roughly
@@ -608,6 +649,24 @@ class Var(IndexedComponent):
             self._initialize_members(self._index)
         timer.report()
 
+    def _construct_from_generator(self):
+        """
+        Construct the variables from an initialization rule that is a
+        generator function yielding (index, value) pairs.  Only the
+        variables for the generated indices are created, regardless of
+        the 'dense' option.
+        """
+        _generator = self._value_init_rule(self._parent())
+        # Variables added after construction are not initialized by
+        # the generator
+        self._value_init_rule = None
+        for ndx, val in _generator:
+            if ndx in self._data:
+                raise ValueError(
+                    "Var '%s': the initialization rule generated the "
+                    "index %s more than once" % (self.name, str(ndx)))
+            self[ndx] = val
+
     def add(self, index):
         """Add a variable with a particular index."""
         return self[index]
@@ -946,6 +1005,511 @@ class IndexedVar(Var):
     free=unfix
 
 
+class _ColumnarVarData(_VarData):
+    """
+    This class defines the data for a single variable of a
+    ColumnarIndexedVar. The variable attributes are stored in the
+    arrays of the parent component at the position of this object,
+    so that only a position needs to be stored here.
+
+    Constructor Arguments:
+        pos         The position of this variable in the arrays
+                        of the parent component.
+        component   The Var object that owns this data.
+    """
+
+    __slots__ = ('_pos',)
+
+    def __init__(self, pos, component=None):
+        self._component = weakref_ref(component) if (component is not None) \
+                          else None
+        self._pos = pos
+
+    def __getstate__(self):
+        state = super(_ColumnarVarData, self).__getstate__()
+        for i in _ColumnarVarData.__slots__:
+            state[i] = getattr(self, i)
+        return state
+
+    @property
+    def value(self):
+        """Return the value for this variable."""
+        parent = self._component()
+        # NaN is used to store None
+        return parent._number(self._pos, parent._values[self._pos])
+    @value.setter
+    def value(self, val):
+        """Set the value for this variable."""
+        self._component()._values[self._pos] = _nan if val is None else val
+
+    @property
+    def domain(self):
+        """Return the domain for this variable."""
+        parent = self._component()
+        return parent._domain_table[parent._domain_ids[self._pos]]
+    @domain.setter
+    def domain(self, domain):
+        """Set the domain for this variable."""
+        parent = self._component()
+        parent._domain_ids[self._pos] = parent._domain_id(domain)
+
+    @property
+    def lb(self):
+        """Return the lower bound for this variable."""
+        parent = self._component()
+        dlb, _ = parent._domain_table[parent._domain_ids[self._pos]].bounds()
+        lb = parent._bound_exprs.get((self._pos, 0), None)
+        if lb is not None:
+            lb = value(lb)
+        else:
+            lb = parent._number(self._pos, parent._lbs[self._pos])
+        if lb is None:
+            return dlb
+        elif dlb is None:
+            return lb
+        return max(lb, dlb)
+    @lb.setter
+    def lb(self, val):
+        raise AttributeError("Assignment not allowed. Use the setlb method")
+
+    @property
+    def ub(self):
+        """Return the upper bound for this variable."""
+        parent = self._component()
+        _, dub = parent._domain_table[parent._domain_ids[self._pos]].bounds()
+        ub = parent._bound_exprs.get((self._pos, 1), None)
+        if ub is not None:
+            ub = value(ub)
+        else:
+            ub = parent._number(self._pos, parent._ubs[self._pos])
+        if ub is None:
+            return dub
+        elif dub is None:
+            return ub
+        return min(ub, dub)
+    @ub.setter
+    def ub(self, val):
+        raise AttributeError("Assignment not allowed. Use the setub method")
+
+    @property
+    def fixed(self):
+        """Return the fixed indicator for this variable."""
+        return bool(self._component()._fixed[self._pos])
+    @fixed.setter
+    def fixed(self, val):
+        """Set the fixed indicator for this variable."""
+        self._component()._fixed[self._pos] = val
+
+    @property
+    def stale(self):
+        """Return the stale indicator for this variable."""
+        return bool(self._component()._stale[self._pos])
+    @stale.setter
+    def stale(self, val):
+        """Set the stale indicator for this variable."""
+        self._component()._stale[self._pos] = val
+
+    def setlb(self, val):
+        """
+        Set the lower bound for this variable after validating that
+        the value is fixed (or None).
+        """
+        # Note: is_fixed(None) returns True
+        if is_fixed(val):
+            self._component()._set_bound(self._pos, 0, val)
+        else:
+            raise ValueError(
+                "Non-fixed input of type '%s' supplied as variable lower "
+                "bound - legal types must be fixed expressions or variables."
+                % (type(val),))
+
+    def setub(self, val):
+        """
+        Set the upper bound for this variable after validating that
+        the value is fixed (or None).
+        """
+        # Note: is_fixed(None) returns True
+        if is_fixed(val):
+            self._component()._set_bound(self._pos, 1, val)
+        else:
+            raise ValueError(
+                "Non-fixed input of type '%s' supplied as variable upper "
+                "bound - legal types are fixed expressions or variables."
+                "parameters"
+                % (type(val),))
+
+    def fix(self, *val):
+        """
+        Set the fixed indicator to True. Value argument is optional,
+        indicating the variable should be fixed at its current value.
+        """
+        self.fixed = True
+        if len(val) == 1:
+            self.value = val[0]
+        elif len(val) > 1:
+            raise TypeError("fix expected at most 1 arguments, got %d" % (len(val)))
+
+    def unfix(self):
+        """Sets the fixed indicator to False."""
+        self.fixed = False
+
+    free = unfix
+
+
+class ColumnarIndexedVar(IndexedVar):
+    """
+    An array of variables whose values, bounds, domains and
+    fixed/stale flags are stored in NumPy arrays (one entry per
+    variable) rather than on the variable data objects. The
+    variable data objects (_ColumnarVarData) only store their
+    position in these arrays. This avoids storing a Python float for
+    each value and bound of large indexed variables and allows the
+    values to be read and updated with vectorized operations (see
+    extract_values_array, set_values, fix and unfix).
+
+    Values are stored as floats, with NaN indicating that the value
+    is None. Consequently, NaN and None are interchangeable: storing
+    NaN as a value (with the value attribute, set_values or fix) is
+    the same as storing None, and reads back as None (or as NaN from
+    extract_values_array). Bounds that are not numeric constants
+    (e.g., mutable Params) are stored separately and evaluated when
+    accessed. The value and bounds of a variable with an integer or
+    binary domain are returned as Python ints when they are integral
+    (and as floats otherwise); extract_values_array always returns
+    floats.
+
+    This class is used when a Var is declared with columnar=True.
+    """
+
+    def __init__(self, *args, **kwds):
+        if not numpy_available:
+            raise RuntimeError(
+                "Var components with columnar=True require numpy")
+        IndexedVar.__init__(self, *args, **kwds)
+        self._size = 0
+        self._values = numpy.empty(0, dtype=float)
+        self._lbs = numpy.empty(0, dtype=float)
+        self._ubs = numpy.empty(0, dtype=float)
+        self._fixed = numpy.empty(0, dtype=bool)
+        self._stale = numpy.empty(0, dtype=bool)
+        self._domain_ids = numpy.empty(0, dtype=numpy.int32)
+        # (pos, 0 or 1) -> non-constant lower (upper) bound
+        self._bound_exprs = {}
+        self._domain_table = []
+        # True for the integer and binary domains in _domain_table
+        self._integral_domains = []
+        # id(domain) -> position in _domain_table
+        self._domain_ids_by_id = {}
+        # the positions of the variable data objects in index order
+        self._positions = None
+        # (index_order, positions) for the last tuple index_order
+        self._order_positions = None
+
+    _columns = ('_values', '_lbs', '_ubs', '_fixed', '_stale', '_domain_ids')
+
+    def __getstate__(self):
+        state = super(ColumnarIndexedVar, self).__getstate__()
+        # object ids change when unpickling
+        del state['_domain_ids_by_id']
+        return state
+
+    def __setstate__(self, state):
+        state['_domain_ids_by_id'] = dict(
+            (id(domain), i) for i, domain in enumerate(state['_domain_table']))
+        super(ColumnarIndexedVar, self).__setstate__(state)
+
+    def _domain_id(self, domain):
+        """Return the position of a domain in the domain table."""
+        _id = self._domain_ids_by_id.get(id(domain), None)
+        if _id is None:
+            if not hasattr(domain, 'bounds'):
+                raise ValueError(
+                    "%s is not a valid domain. Variable domains must be an "
+                    "instance of one of %s, or an object that declares a method "
+                    "for bounds (like a Pyomo Set). Examples: NonNegativeReals, "
+                    "Integers, Binary" % (domain, (RealSet, IntegerSet, BooleanSet)))
+            _id = self._domain_ids_by_id[id(domain)] = len(self._domain_table)
+            self._domain_table.append(domain)
+            self._integral_domains.append(
+                isinstance(domain, (IntegerSet, BooleanSet)))
+        return _id
+
+    def _number(self, pos, val):
+        """Convert a stored value or bound to None, an int (for
+        integral values of integer and binary variables) or a float"""
+        if val != val:
+            return None
+        if self._integral_domains[self._domain_ids[pos]] and \
+           val.is_integer():
+            return int(val)
+        return float(val)
+
+    def _set_bound(self, pos, which, val):
+        bounds = self._ubs if which else self._lbs
+        if val is None:
+            bounds[pos] = _nan
+            self._bound_exprs.pop((pos, which), None)
+        elif val.__class__ in native_numeric_types:
+            bounds[pos] = val
+            self._bound_exprs.pop((pos, which), None)
+        else:
+            bounds[pos] = _nan
+            self._bound_exprs[pos, which] = val
+
+    def _allocate(self, n):
+        """Add n entries to the arrays, returning the first position."""
+        pos = self._size
+        if pos + n > len(self._values):
+            size = max(pos + n, 2*len(self._values))
+            for name in self._columns:
+                column = getattr(self, name)
+                new_column = numpy.empty(size, dtype=column.dtype)
+                new_column[:pos] = column[:pos]
+                setattr(self, name, new_column)
+        self._values[pos:pos+n] = _nan
+        self._lbs[pos:pos+n] = _nan
+        self._ubs[pos:pos+n] = _nan
+        self._fixed[pos:pos+n] = False
+        self._stale[pos:pos+n] = True
+        domain = self._domain_init_value
+        if domain is None:
+            # the domain is given by a rule (see _initialize_members)
+            domain = Reals
+        self._domain_ids[pos:pos+n] = self._domain_id(domain)
+        self._size += n
+        self._positions = None
+        return pos
+
+    def _index_positions(self, index_order=None):
+        """
+        Return the array positions of the variables with the indices
+        in index_order (by default, the iteration order of this
+        component).
+
+        The positions are cached for the default order and for the
+        last index_order given as a tuple, until variables are added
+        or removed.
+        """
+        if self._positions is None:
+            self._positions = numpy.fromiter(
+                (vardata._pos for vardata in self.values()),
+                dtype=numpy.int64,
+                count=len(self._data))
+            self._order_positions = None
+        if index_order is None:
+            return self._positions
+        if self._order_positions is not None and \
+           self._order_positions[0] is index_order:
+            return self._order_positions[1]
+        positions = numpy.fromiter(
+            (vardata._pos for vardata in self._data_list(index_order)),
+            dtype=numpy.int64)
+        if index_order.__class__ is tuple:
+            self._order_positions = (index_order, positions)
+        return positions
+
+    def construct(self, data=None):
+        """Construct this component."""
+        if self._constructed:
+            return
+        if not self._dense or \
+           inspect.isgeneratorfunction(self._value_init_rule):
+            return super(ColumnarIndexedVar, self).construct(data)
+        timer = ConstructionTimer(self)
+        self._constructed = True
+
+        pos = self._allocate(len(self._index))
+        self_weakref = weakref_ref(self)
+        _data = self._data
+        for ndx in self._index:
+            cdata = _ColumnarVarData(pos)
+            cdata._component = self_weakref
+            _data[ndx] = cdata
+            pos += 1
+        self._initialize_members(self._index)
+        timer.report()
+
+    def _getitem_when_not_present(self, index):
+        """Returns the default component data value."""
+        obj = self._data[index] = _ColumnarVarData(self._allocate(1),
+                                                   component=self)
+        self._initialize_members((index,))
+        return obj
+
+    def __delitem__(self, index):
+        super(ColumnarIndexedVar, self).__delitem__(index)
+        self._positions = None
+
+    def clear(self):
+        """Clear the data in this component"""
+        super(ColumnarIndexedVar, self).clear()
+        self._positions = None
+
+    def _initialize_members(self, init_set):
+        """Initialize variable data for all indices in a set."""
+        if init_set is not self._index:
+            return super(ColumnarIndexedVar, self)._initialize_members(
+                init_set)
+        #
+        # Vectorized initialization of the (dense) variables with
+        # constant values and bounds
+        #
+        value_init_value = self._value_init_value
+        bounds_init_value = self._bounds_init_value
+        vectorize_values = (self._value_init_rule is None) and \
+            (value_init_value is not None) and \
+            (value_init_value.__class__ is not dict) and \
+            (self._domain_init_rule is None)
+        vectorize_bounds = (self._bounds_init_rule is None) and \
+            (bounds_init_value is not None) and \
+            all(bound is None or bound.__class__ in native_numeric_types
+                for bound in bounds_init_value)
+        if vectorize_values:
+            val = value(value_init_value)
+            if len(self._data):
+                # all variables share the initial domain, so the
+                # value only needs to be validated once
+                next(itervalues(self._data))._valid_value(val)
+            self._value_init_value = None
+        if vectorize_bounds:
+            self._bounds_init_value = None
+        try:
+            super(ColumnarIndexedVar, self)._initialize_members(init_set)
+        finally:
+            self._value_init_value = value_init_value
+            self._bounds_init_value = bounds_init_value
+        positions = self._index_positions()
+        if vectorize_values:
+            self._values[positions] = _nan if val is None else val
+            self._stale[positions] = False
+        if vectorize_bounds:
+            lb, ub = bounds_init_value
+            self._lbs[positions] = _nan if lb is None else lb
+            self._ubs[positions] = _nan if ub is None else ub
+
+    #
+    # Vectorized accessors
+    #
+
+    def flag_as_stale(self):
+        """
+        Set the 'stale' attribute of every variable data object to True.
+        """
+        self._stale[:self._size] = True
+
+    def extract_values_array(self, index_order=None):
+        """
+        Return a NumPy array with the values of the variables with the
+        indices in index_order (by default, the iteration order of
+        this component).  NaN is returned for variables without a
+        value.
+        """
+        return self._values[self._index_positions(index_order)]
+
+    def set_values(self, new_values, valid=False, index_order=None):
+        """
+        Set the values from a dictionary, or from an array with the
+        values of the variables with the indices in index_order (by
+        default, the iteration order of this component).  NaN array
+        entries are stored as None.
+
+        The default behavior is to validate the values.
+        """
+        if hasattr(new_values, 'items'):
+            return super(ColumnarIndexedVar, self).set_values(
+                new_values, valid)
+        new_values = numpy.asarray(new_values, dtype=float)
+        positions = self._index_positions(index_order)
+        if new_values.shape != positions.shape:
+            raise ValueError(
+                "Expected an array of %s values for component '%s' "
+                "(got shape %s)" % (len(positions), self.name,
+                                    new_values.shape))
+        if not valid:
+            self._validate_values(positions, new_values)
+        self._values[positions] = new_values
+        self._stale[positions] = False
+
+    def _validate_values(self, positions, new_values):
+        domain_ids = self._domain_ids[positions]
+        for _id in numpy.unique(domain_ids):
+            domain = self._domain_table[_id]
+            if domain.__class__ is RealSet and \
+               domain.bounds() == (None, None):
+                # Reals (NaN is used to store None)
+                continue
+            for val in new_values[domain_ids == _id].tolist():
+                if val != val:
+                    continue
+                if val.is_integer():
+                    # the array stores floats, but discrete domains
+                    # only contain ints
+                    val = int(val)
+                if val not in domain:
+                    raise ValueError("Numeric value `%s` (%s) is not in "
+                                     "domain %s" % (val, type(val), domain))
+
+    def _mask_positions(self, mask):
+        positions = self._index_positions()
+        if mask is None:
+            return positions
+        mask = numpy.asarray(mask, dtype=bool)
+        if mask.shape != positions.shape:
+            raise ValueError(
+                "Expected a mask of %s values for Var '%s' (got shape %s)"
+                % (len(positions), self.name, mask.shape))
+        return positions[mask]
+
+    def fix(self, *val, **kwds):
+        """
+        Set the fixed indicator to True. Value argument is optional,
+        indicating the variables should be fixed at their current
+        values. The optional 'mask' keyword (a boolean array in index
+        order) selects the variables to fix. The value can be a
+        single value or an array with one value per selected
+        variable. The values are validated against the variable
+        domains (as in set_values).
+        """
+        positions = self._mask_positions(kwds.pop('mask', None))
+        if kwds:
+            raise TypeError("fix got unexpected keyword arguments %s"
+                            % (sorted(kwds),))
+        if len(val) > 1:
+            raise TypeError("fix expected at most 1 arguments, got %d" % (len(val)))
+        if len(val) == 1:
+            new_values = _nan if val[0] is None else val[0]
+            new_values = numpy.broadcast_to(
+                numpy.asarray(new_values, dtype=float), positions.shape)
+            self._validate_values(positions, new_values)
+            self._values[positions] = new_values
+        self._fixed[positions] = True
+
+    def unfix(self, **kwds):
+        """
+        Sets the fixed indicator to False. The optional 'mask'
+        keyword (a boolean array in index order) selects the
+        variables to unfix.
+        """
+        positions = self._mask_positions(kwds.pop('mask', None))
+        if kwds:
+            raise TypeError("unfix got unexpected keyword arguments %s"
+                            % (sorted(kwds),))
+        self._fixed[positions] = False
+
+    free = unfix
+
+    @property
+    def domain(self):
+        raise AttributeError(
+            "The domain is not an attribute for IndexedVar. It "
+            "can be set for all indices using this property setter, "
+            "but must be accessed for individual variables in this container.")
+    @domain.setter
+    def domain(self, domain):
+        """Sets the domain for all variables in this container."""
+        self._domain_ids[self._index_positions()] = self._domain_id(domain)
+
+
 @ModelComponentFactory.register("List of decision variables.")
 class VarList(IndexedVar):
     """
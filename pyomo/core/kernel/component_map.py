@@ -162,6 +162,38 @@ class ComponentMap(collections_MutableMapping):
             return self[key]
         return default
 
+    def update(*args, **kwds):
+        'D.update([E, ]**F) -> None.  Update D from mapping/iterable E and F.'
+        # The MutableMapping implementation calls __setitem__ once
+        # per item. Building the (id, (key, value)) entries in a
+        # single pass and handing them to dict.update is
+        # substantially faster when loading solver results into
+        # large maps (e.g., Suffix objects).
+        if not args:
+            raise TypeError("descriptor 'update' of 'ComponentMap' object "
+                            "needs an argument")
+        self = args[0]
+        args = args[1:]
+        if len(args) > 1:
+            raise TypeError('update expected at most 1 arguments, got %d'
+                            % len(args))
+        if args:
+            other = args[0]
+            if isinstance(other, ComponentMap):
+                self._dict.update(other._dict)
+            else:
+                if isinstance(other, collections_Mapping):
+                    items = other.items()
+                elif hasattr(other, "keys"):
+                    items = ((key, other[key]) for key in other.keys())
+                else:
+                    items = other
+                self._dict.update((id(key), (key, val))
+                                  for key, val in items)
+        if kwds:
+            self._dict.update((id(key), (key, val))
+                              for key, val in kwds.items())
+
     def setdefault(self, key, default=None):
         'D.setdefault(k[,d]) -> D.get(k,d), also set D[k]=d if k not in D'
         if key in self:
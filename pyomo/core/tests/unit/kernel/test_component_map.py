@@ -179,6 +179,25 @@ class TestComponentMap(unittest.TestCase):
         for c, val in self._components:
             self.assertEqual(cmap[c], val)
 
+    def test_update_mapping(self):
+        cmap = ComponentMap()
+        cmap.update(ComponentMap(self._components))
+        self.assertEqual(len(cmap), len(self._components))
+        for c, val in self._components:
+            self.assertEqual(cmap[c], val)
+        cmap = ComponentMap()
+        cmap.update(iter(self._components[:3]))
+        self.assertEqual(len(cmap), 3)
+        for c, val in self._components[:3]:
+            self.assertEqual(cmap[c], val)
+        # later items overwrite earlier ones
+        c, _ = self._components[0]
+        cmap.update(((c, 1), (c, 2)))
+        self.assertEqual(cmap[c], 2)
+        self.assertEqual(len(cmap), 3)
+        with self.assertRaises(TypeError):
+            cmap.update(self._components, self._components)
+
     def test_clear(self):
         cmap = ComponentMap()
         self.assertEqual(len(cmap), 0)
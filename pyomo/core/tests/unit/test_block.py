@@ -27,7 +27,9 @@ import pyutilib.services
 
 from pyomo.environ import *
 from pyomo.common.log import LoggingIntercept
-from pyomo.core.base.block import SimpleBlock, SubclassOf
+from pyomo.core.base.block import SimpleBlock, SubclassOf, \
+    _CloneReferences
+from pyomo.core.kernel.component_set import ComponentSet
 from pyomo.core.expr import current as EXPR
 from pyomo.opt import *
 
@@ -35,6 +37,12 @@ from pyomo.gdp import Disjunct
 
 solvers = check_available_solvers('glpk')
 
+try:
+    import multiprocessing
+    _fork_available = 'fork' in multiprocessing.get_all_start_methods()
+except AttributeError:
+    _fork_available = os.name != 'nt'
+
 class DerivedBlock(SimpleBlock):
     def __init__(self, *args, **kwargs):
         """Constructor"""
@@ -874,6 +882,105 @@ class TestBlock(unittest.TestCase):
         )]
         self.assertEqual(HM.BFS_block_subclass, result)
 
+    def test_cached_tree_traversal(self):
+        HM = HierarchicalModel()
+        m = HM.model
+        self.assertEqual(
+            [x.name for x in m.block_data_objects()], HM.PrefixDFS)
+        self.assertIsNotNone(m._tree_cache)
+        self.assertEqual(
+            [x.name for x in m.block_data_objects()], HM.PrefixDFS)
+        self.assertEqual(
+            [x.name for x in m.block_data_objects(
+                sort=SortComponents.indices)], HM.PrefixDFS_sortIdx)
+
+        m.a[3].e.x = Var()
+        m.b.y = Var([1,2])
+        self.assertIsNone(m._tree_cache)
+        self.assertEqual(
+            [x.name for x in m.component_data_objects(Var)],
+            ['a[3].e.x', 'b.y[1]', 'b.y[2]'])
+        self.assertEqual(
+            [x.name for x in m.component_data_objects(Var)],
+            ['a[3].e.x', 'b.y[1]', 'b.y[2]'])
+        # adding or removing components
+        m.a[1].c[4].z = Var()
+        self.assertEqual(
+            [x.name for x in m.component_objects(Var)],
+            ['a[1].c[4].z', 'a[3].e.x', 'b.y'])
+        m.a[3].e.del_component('x')
+        self.assertEqual(
+            [x.name for x in m.component_objects(Var)],
+            ['a[1].c[4].z', 'b.y'])
+        m.b.reclassify_component_type('y', Expression)
+        self.assertEqual(
+            [x.name for x in m.component_objects(Var)], ['a[1].c[4].z'])
+        m.b.reclassify_component_type('y', Var)
+        # (de)activating blocks
+        m.a[1].deactivate()
+        self.assertEqual(
+            [x.name for x in m.component_objects(Var, active=True)],
+            ['b.y'])
+        m.a.activate()
+        self.assertEqual(
+            [x.name for x in m.component_objects(Var, active=True)],
+            ['a[1].c[4].z', 'b.y'])
+        m.a.deactivate()
+        self.assertEqual(
+            [x.name for x in m.block_data_objects(active=True)],
+            ['unknown', 'c', 'b'])
+        m.a.activate()
+        # adding block data
+        m.g = Block(Any)
+        self.assertEqual(
+            [x.name for x in m.block_data_objects()], HM.PrefixDFS)
+        m.g[1].w = Var()
+        self.assertEqual(
+            [x.name for x in m.component_objects(Var)],
+            ['a[1].c[4].z', 'b.y', 'g[1].w'])
+        del m.g[1]
+        self.assertEqual(
+            [x.name for x in m.component_objects(Var)],
+            ['a[1].c[4].z', 'b.y'])
+        # sub-blocks have their own cache
+        self.assertEqual(
+            [x.name for x in m.a[1].block_data_objects()],
+            ['a[1]', 'a[1].d', 'a[1].c[5]', 'a[1].c[4]'])
+        m.a[1].d.q = Block()
+        self.assertIsNone(m.a[1]._tree_cache)
+        self.assertIsNone(m._tree_cache)
+        # the cache is not cloned (or pickled)
+        list(m.block_data_objects())
+        self.assertNotIn('_tree_cache', m.clone().__dict__)
+
+    def test_cached_tree_modified_while_iterating(self):
+        def traverse(m, cached):
+            if cached:
+                # record the traversal
+                list(m.block_data_objects())
+                walker = m.block_data_objects()
+            else:
+                walker = m._tree_iterator()
+            names = []
+            for b in walker:
+                names.append(b.name)
+                if b.name == 'a[1].d':
+                    b.parent_block().d2 = Block()
+                    m.a[3].f[7].g = Block()
+                    m.c.g = Block()
+                    m.h = Block()
+                elif b.name == 'a[3].e':
+                    m.a[3].del_component('f')
+            return names
+        HM = HierarchicalModel()
+        ref = traverse(HM.model, False)
+        self.assertEqual(
+            ref, ['unknown', 'c', 'a[1]', 'a[1].d', 'a[1].c[5]',
+                  'a[1].c[4]', 'a[1].d2', 'a[2]', 'a[3]', 'a[3].e',
+                  'b', 'h'])
+        HM = HierarchicalModel()
+        self.assertEqual(traverse(HM.model, True), ref)
+
 
     def test_add_remove_component_byname(self):
         m = Block()
@@ -1885,6 +1992,35 @@ class TestBlock(unittest.TestCase):
             sorted(id(x) for x in (m.x, m.y[1], nb.x, nb.y[1])),
         )
 
+    def test_clone_by_pickling(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3,1,2], ordered=Set.SortedOrder)
+        m.x = Var(m.I, bounds=lambda m, i: (0, i))
+        m.b = Block()
+        m.b.y = Var(m.I, within=NonNegativeIntegers)
+        m.b.c = Constraint(m.I, rule=lambda b, i: b.y[i] <= m.x[i])
+
+        # Block.clone() pickles the block
+        nb = _CloneReferences(m.b).clone()
+        self.assertIs(nb.y.index_set(), m.I)
+        self.assertEqual(nb.y[1].domain.name, 'NonNegativeIntegers')
+        self.assertIs(nb.c.rule, m.b.c.rule)
+        self.assertEqual(
+            [id(x) for x in EXPR.identify_variables(nb.c[2].body)],
+            [id(nb.y[2]), id(m.x[2])])
+
+        m.b.del_component('c')
+        n = m.clone()
+        self.assertIs(n.I.ordered, Set.SortedOrder)
+        self.assertIs(n.x._bounds_init_rule, m.x._bounds_init_rule)
+        self.assertIsNot(n.b.y.index_set(), m.I)
+        self.assertIs(n.b.y.index_set(), n.I)
+        OUT1 = StringIO()
+        OUT2 = StringIO()
+        m.pprint(ostream=OUT1)
+        n.pprint(ostream=OUT2)
+        self.assertEqual(OUT1.getvalue(), OUT2.getvalue())
+
     def test_clone_unclonable_attribute(self):
         class foo(object):
             def __deepcopy__(bogus):
@@ -2262,6 +2398,113 @@ class TestBlock(unittest.TestCase):
             m.write(format="bogus")
 
 
+    @unittest.skipIf(not _fork_available, "Parallel construction requires fork")
+    def test_parallel_construction(self):
+        def make(parallel):
+            m = ConcreteModel()
+            m.I = RangeSet(6)
+            m.J = Set(initialize=['a','b'])
+            m.p = Param(m.I, initialize=lambda m,i: 2*i, mutable=True)
+            m.y = Var()
+            m.b = Block(m.I, rule=_parallel_block_rule, parallel=parallel)
+            return m
+        serial = make(None)
+        m = make(3)
+        OUT1 = StringIO()
+        OUT2 = StringIO()
+        serial.pprint(ostream=OUT1)
+        m.pprint(ostream=OUT2)
+        self.assertEqual(OUT1.getvalue(), OUT2.getvalue())
+        self.assertEqual(list(m.b.keys()), list(serial.b.keys()))
+
+        # references to the model components are restored
+        for i in m.I:
+            self.assertIs(m.b[i].parent_component(), m.b)
+            self.assertIs(m.b[i].model(), m)
+            self.assertIs(m.b[i].x.index_set(), m.J)
+            self.assertIs(m.b[i].sub.parent_block(), m.b[i])
+            vars = ComponentSet(EXPR.identify_variables(m.b[i].c.body))
+            self.assertEqual(len(vars), 3)
+            self.assertIn(m.y, vars)
+            self.assertIn(m.b[i].x['a'], vars)
+        m.p[1] = 10
+        self.assertEqual(m.b[1].x['a'].ub, 10)
+
+    @unittest.skipIf(not _fork_available, "Parallel construction requires fork")
+    def test_parallel_construction_errors(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        def rule(b, i):
+            if i == 2:
+                raise ValueError("bad index")
+        OUT = StringIO()
+        with LoggingIntercept(OUT, 'pyomo.core'):
+            with self.assertRaisesRegexp(
+                    RuntimeError, "Parallel construction of Block 'b' "
+                    "failed for index 2"):
+                m.b = Block(m.I, rule=rule, parallel=2)
+        self.assertIn("ValueError: bad index", OUT.getvalue())
+
+        # a block cannot reference components that are not on the
+        # model in the parent process
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        def rule(b, i):
+            b.model().q = Param(initialize=i)
+            b.x = Var(bounds=(0, b.model().q))
+        with self.assertRaisesRegexp(
+                RuntimeError, "Cannot resolve the reference to component"):
+            m.b = Block(m.I, rule=rule, parallel=2)
+
+    @unittest.skipIf(not _fork_available, "Parallel construction requires fork")
+    def test_parallel_construction_local_functions(self):
+        # local rules are dropped, as they are only used to construct
+        # the components
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        def rule(b, i):
+            b.S = Set(initialize=lambda b: range(2*i), filter=_even,
+                      validate=_even)
+            b.x = Var(b.S, initialize=lambda b, j: j)
+            b.c = Constraint(b.S, rule=lambda b, j: b.x[j] >= 0)
+        m.b = Block(m.I, rule=rule, parallel=2)
+        self.assertEqual(list(m.b[3].S), [0, 2, 4])
+        self.assertEqual(m.b[3].x[4].value, 4)
+        self.assertEqual(len(m.b[2].c), 2)
+        # the validation rule is still used after construction
+        with self.assertRaises(ValueError):
+            m.b[3].S.add(7)
+        m.b[3].S.add(6)
+        self.assertIn(6, m.b[3].S)
+
+        # other local functions cannot be transferred
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        def rule(b, i):
+            b.S = Set(initialize=range(4), filter=lambda b, j: j % 2)
+        OUT = StringIO()
+        with LoggingIntercept(OUT, 'pyomo.core'):
+            with self.assertRaisesRegexp(
+                    RuntimeError, "Parallel construction of Block 'b' "
+                    "failed"):
+                m.b = Block(m.I, rule=rule, parallel=2)
+        self.assertIn("Cannot transfer the function '<lambda>'",
+                      OUT.getvalue())
+
+
+def _even(b, j):
+    return j % 2 == 0
+
+
+def _parallel_block_rule(b, i):
+    m = b.model()
+    b.x = Var(m.J, bounds=(0, m.p[i]), initialize=i)
+    b.c = Constraint(expr=m.y + sum(b.x[j] for j in m.J) >= i)
+    b.e = Expression(expr=sum(i*b.x[j] for j in m.J))
+    b.sub = Block()
+    b.sub.z = Var(initialize=i)
+    b.sub.c = Constraint(expr=b.sub.z <= b.x['a'])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -857,6 +857,38 @@ class TestArrayCon(unittest.TestCase):
         self.assertEqual(model.c[1](), 8)
         self.assertEqual(len(model.c), 2)
 
+    def test_rule_generator(self):
+        model = self.create_model()
+        model.B = RangeSet(1,1000)
+        model.x = Var(model.B, initialize=2)
+        def f(model):
+            for i in model.A:
+                if i%2 == 0:
+                    yield (i, 3), Constraint.Skip
+                else:
+                    yield (i, 3*i), model.x[i] >= i
+        model.c = Constraint(model.A, model.B, rule=f)
+
+        self.assertEqual(len(model.c), 2)
+        self.assertEqual(sorted(model.c.keys()), [(1,3), (3,9)])
+        self.assertEqual(model.c[3,9].lower, 3)
+        self.assertIs(model.c[3,9].body, model.x[3])
+
+    def test_rule_generator_errors(self):
+        model = self.create_model()
+        model.x = Var()
+        def f(model):
+            yield 5, model.x >= 0
+        self.assertRaisesRegexp(
+            KeyError, "Index '5' is not valid",
+            setattr, model, 'c', Constraint(model.A, rule=f))
+        def g(model):
+            yield 1, model.x >= 0
+            yield 1, model.x <= 1
+        self.assertRaisesRegexp(
+            ValueError, "generated the index 1 more than once",
+            setattr, model, 'd', Constraint(model.A, rule=g))
+
     def test_dim(self):
         model = self.create_model()
         model.c = Constraint(model.A)
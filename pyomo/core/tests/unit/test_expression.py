@@ -22,6 +22,12 @@ from pyomo.core.base.expression import _GeneralExpressionData
 
 import six
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 class TestExpressionData(unittest.TestCase):
 
     def test_exprdata_get_set(self):
@@ -427,6 +433,29 @@ E : Size=2
         with self.assertRaises(KeyError):
             model.E.store_values({3: 3.0})
 
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_extract_values_array_store_values_array(self):
+        model = ConcreteModel()
+        model.x = Var([1,2,3], initialize=1)
+        model.E = Expression([1,2,3])
+        model.E[1] = model.x[1] + 1
+        self.assertEqual(
+            numpy.isnan(model.E.extract_values_array()).tolist(),
+            [False, True, True])
+        self.assertEqual(model.E.extract_values_array((1,)).tolist(), [2])
+        model.E.store_values(numpy.array([3.0, 4.0]), index_order=[2, 3])
+        self.assertEqual(model.E.extract_values_array([3, 2, 1]).tolist(),
+                         [4, 3, 2])
+        with self.assertRaisesRegexp(ValueError, "Expected an array of 2"):
+            model.E.store_values([1.0], index_order=[2, 3])
+        # NaN entries make the expressions undefined
+        model.E.store_values(numpy.array([numpy.nan, 5.0]),
+                             index_order=[2, 3])
+        self.assertIsNone(model.E[2].expr)
+        self.assertEqual(
+            numpy.isnan(model.E.extract_values_array()).tolist(),
+            [False, True, False])
+
     def test_setitem(self):
         model = ConcreteModel()
         model.E = Expression([1])
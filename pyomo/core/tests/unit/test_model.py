@@ -744,6 +744,37 @@ class Test(unittest.TestCase):
             join(currdir,"solve_with_store8.out"),
             join(currdir,"solve_with_store4.txt"))
 
+    def test_load_from_indexed_values(self):
+        model = ConcreteModel()
+        model.x = Var([1,2,3])
+        model.c = Constraint(expr=model.x[1] + model.x[2] >= 1)
+        model.dual = Suffix(direction=Suffix.IMPORT)
+        model.rc = Suffix(direction=Suffix.IMPORT)
+        smap = SymbolMap()
+        smap.addSymbols([(model.x[1], 'v0'),
+                         (model.x[2], 'v1'),
+                         (model.c, 'c0')])
+        results = pyomo.opt.SolverResults()
+        results.solver.status = pyomo.opt.SolverStatus.ok
+        soln = results.solution.add()
+        soln.variable['v1'] = {'rc': 3.0}
+        soln.set_indexed_values('variable', 'v', 'Value', [1.5, -2.0])
+        soln.set_indexed_values('constraint', 'c', 'Dual', [0.5])
+        results._smap = smap
+        model.solutions.load_from(results)
+        # loading does not expand the index-aligned values
+        self.assertEqual(soln.get_indexed_values('constraint'),
+                         ('c', 'Dual', [0.5]))
+        self.assertEqual(model.x[1].value, 1.5)
+        self.assertFalse(model.x[1].stale)
+        self.assertEqual(model.x[2].value, -2.0)
+        self.assertFalse(model.x[2].stale)
+        self.assertEqual(model.x[3].value, None)
+        self.assertTrue(model.x[3].stale)
+        self.assertEqual(model.dual[model.c], 0.5)
+        self.assertEqual(model.rc[model.x[2]], 3.0)
+        self.assertEqual(len(model.rc), 1)
+        self.assertEqual(soln.variable['v1'], {'rc': 3.0, 'Value': -2.0})
 
     def test_create_concrete_from_rule(self):
         def make(m):
@@ -787,6 +818,96 @@ class Test(unittest.TestCase):
                           ['y','I','x','c'] )
         self.assertEqual( len(list(EXPR.identify_variables(instance.c.body))), 3 )
 
+    def test_create_lazy_instance(self):
+        model = AbstractModel()
+        model.I = Set(initialize=[1,2,3])
+        model.p = Param(model.I, initialize={1:1, 2:2, 3:3})
+        model.x = Var(model.I)
+        model.c = Constraint(model.I, rule=lambda m,i: m.x[i] >= m.p[i])
+        model.d = Constraint(rule=lambda m: sum(m.x[i] for i in m.I) <= 1)
+        model.o = Objective(rule=lambda m: m.x[1])
+        def b_rule(b, i):
+            b.y = Var()
+            b.e = Constraint(expr=b.y == b.model().x[i])
+        model.b = Block(model.I, rule=b_rule)
+
+        instance = model.create_instance(lazy=True)
+        self.assertTrue(instance.x.is_constructed())
+        self.assertEqual(len(instance.x), 3)
+        self.assertEqual(list(instance._deferred_construction),
+                         ['c', 'd', 'o', 'b'])
+        for name in ('c', 'd', 'o', 'b'):
+            self.assertFalse(instance.component(name).is_constructed())
+
+        # Deferred components are constructed on first access
+        self.assertEqual(instance.c[2].lower, 2)
+        self.assertTrue(instance.c.is_constructed())
+        self.assertEqual(list(instance.b), [1,2,3])
+        self.assertIs(instance.b[2].e.body.args[0], instance.b[2].y)
+        self.assertEqual(list(instance._deferred_construction), ['d', 'o'])
+
+        # ... or when the instance is written
+        instance.d.deactivate()
+        OUTPUT = join(currdir, "test_create_lazy_instance.lp")
+        instance.write(OUTPUT)
+        os.remove(OUTPUT)
+        self.assertTrue(instance.o.is_constructed())
+        self.assertFalse(instance.d.is_constructed())
+        self.assertEqual(list(instance._deferred_construction), ['d'])
+
+        instance.construct_deferred(active=False)
+        self.assertTrue(instance.d.is_constructed())
+        self.assertEqual(len(instance._deferred_construction), 0)
+        self.assertEqual(instance.d.upper, 1)
+
+    def test_create_lazy_instance_access(self):
+        model = AbstractModel()
+        model.I = Set(initialize=[1,2,3])
+        model.p = Param(model.I, initialize={1:1, 2:2, 3:3}, mutable=True)
+        model.x = Var(model.I, initialize=1)
+        model.c = Constraint(model.I, rule=lambda m,i: m.x[i] >= m.p[i])
+        model.d = Constraint(rule=lambda m: sum(m.x[i] for i in m.I) <= 1)
+        model.e = Constraint(model.I, rule=lambda m,i: m.x[i] <= 2*m.p[i])
+        model.o = Objective(rule=lambda m: m.x[1])
+
+        def deferred(instance):
+            return [name for name in ('c', 'd', 'e', 'o')
+                    if not instance.component(name).is_constructed()]
+
+        # len() and "in" construct the component
+        instance = model.create_instance(lazy=True)
+        self.assertEqual(len(instance.c), 3)
+        self.assertTrue(2 in instance.e)
+        self.assertEqual(deferred(instance), ['d', 'o'])
+
+        # so do the scalar component accessors
+        self.assertEqual(value(instance.o), 1)
+        self.assertEqual(value(instance.d.body), 3)
+        self.assertEqual(deferred(instance), [])
+
+        # component_data_objects constructs active components
+        instance = model.create_instance(lazy=True)
+        self.assertEqual(
+            [o.name for o in instance.component_data_objects(Objective)],
+            ['o'])
+        instance.c.deactivate()
+        self.assertEqual(
+            [c.name for c in instance.component_data_objects(
+                Constraint, active=True)],
+            ['d', 'e[1]', 'e[2]', 'e[3]'])
+        self.assertEqual(deferred(instance), ['c'])
+
+        # deactivating a deferred component does not construct it,
+        # but its data is deactivated once it is constructed
+        self.assertFalse(instance.c.active)
+        self.assertEqual(
+            [c.name for c in instance.component_data_objects(
+                Constraint, active=None) if not c.active],
+            ['c[1]', 'c[2]', 'c[3]'])
+        self.assertTrue(instance.c.is_constructed())
+        self.assertEqual(
+            [c.active for c in instance.c.values()], [False]*3)
+
     def test_error1(self):
         model = ConcreteModel()
         model.x = Var()
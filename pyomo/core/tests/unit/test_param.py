@@ -30,6 +30,12 @@ from pyomo.core.base.param import _NotValid
 
 from six import iteritems, itervalues, StringIO
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 class ParamTester(object):
 
     def setUp(self, **kwds):
@@ -1491,6 +1497,79 @@ assignTestsNonIndexedParamTests(MiscNonIndexedParamBehaviorTests,instrinsic_test
 
 class MiscIndexedParamBehaviorTests(unittest.TestCase):
 
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_extract_values_array(self):
+        model = ConcreteModel()
+        model.A = Set(initialize=[1,2,3], ordered=True)
+        model.P = Param(model.A, initialize={1: 10, 3: 30}, default=0)
+        self.assertEqual(model.P.extract_values_array().tolist(),
+                         [10, 0, 30])
+        self.assertEqual(model.P.extract_values_array([3, 1]).tolist(),
+                         [30, 10])
+        model.Q = Param(model.A, mutable=True, initialize={1: 1.5})
+        self.assertEqual(model.Q.extract_values_array([1]).tolist(), [1.5])
+        self.assertTrue(numpy.isnan(model.Q.extract_values_array([2])[0]))
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_store_values_array(self):
+        model = ConcreteModel()
+        model.A = Set(initialize=[1,2,3], ordered=True)
+        model.P = Param(model.A, mutable=True, within=NonNegativeReals,
+                        default=0)
+        model.x = Var()
+        model.CON = Constraint(expr=model.P[2] <= model.x)
+        model.P.store_values(numpy.array([1.0, 2.0, 3.0]))
+        self.assertEqual(model.P.extract_values(), {1: 1, 2: 2, 3: 3})
+        self.assertEqual(value(model.CON.lower), 2)
+        model.P.store_values(numpy.array([5.0, 4.0]), index_order=[3, 2])
+        self.assertEqual(model.P.extract_values_array().tolist(),
+                         [1, 4, 5])
+        self.assertEqual(value(model.CON.lower), 4)
+        with self.assertRaises(ValueError):
+            model.P.store_values(numpy.array([-1.0]), index_order=[1])
+        model.P.store_values(numpy.array([-1.0]), check=False,
+                             index_order=[1])
+        self.assertEqual(value(model.P[1]), -1)
+        with self.assertRaisesRegexp(ValueError, "Expected an array of 3"):
+            model.P.store_values(numpy.array([1.0]))
+        model.Q = Param(model.A)
+        with self.assertRaises(TypeError):
+            model.Q.store_values(numpy.array([1.0, 2.0, 3.0]))
+
+    def test_store_values_sequence(self):
+        model = ConcreteModel()
+        model.A = Set(initialize=[1,2,3], ordered=True)
+        model.P = Param(model.A, mutable=True, within=NonNegativeReals,
+                        initialize=0)
+        model.P.store_values([1, 2, 3])
+        self.assertEqual(model.P.extract_values(), {1: 1, 2: 2, 3: 3})
+        model.P.store_values((5, 4), index_order=[3, 2])
+        self.assertEqual(model.P.extract_values(), {1: 1, 2: 4, 3: 5})
+        # NaN entries make the values undefined (with or without checks)
+        model.P.store_values([float('nan'), 2, 3])
+        self.assertIsNone(model.P[1](exception=False))
+        model.P.store_values([1, float('nan')], check=False,
+                             index_order=[1, 2])
+        self.assertEqual(value(model.P[1]), 1)
+        self.assertIsNone(model.P[2](exception=False))
+        # scalars are still stored for every index
+        model.P.store_values(7)
+        self.assertEqual(model.P.extract_values(), {1: 7, 2: 7, 3: 7})
+
+    def test_extract_values_array_no_numpy(self):
+        import pyomo.core.base.indexed_component as indexed_component
+        model = ConcreteModel()
+        model.P = Param([1,2], initialize=1)
+        _numpy_available = indexed_component.numpy_available
+        indexed_component.numpy_available = False
+        try:
+            with self.assertRaisesRegexp(
+                    RuntimeError, "component 'P' as an array: numpy is "
+                    "not available"):
+                model.P.extract_values_array()
+        finally:
+            indexed_component.numpy_available = _numpy_available
+
     # Test that indexed params are mutable
     def test_mutable_self1(self):
         model = ConcreteModel()
@@ -671,6 +671,27 @@ class TestRangeSetMisc(unittest.TestCase):
         self.assertEqual(tmp, list(range(1,11,2)))
         self.assertEqual( instance.d.bounds(), (1,9))
 
+    def test_ordinal(self):
+        a=RangeSet(3,30,3)
+        a.construct()
+        self.assertEqual(a.ord(3), 1)
+        self.assertEqual(a.ord(30), 10)
+        self.assertEqual(a[4], 12)
+        self.assertEqual(a.next(6), 9)
+        self.assertEqual(a.prev(9, 2), 3)
+        self.assertEqual(a.nextw(30), 3)
+        self.assertEqual(a.prevw(3), 30)
+        self.assertEqual(list(reversed(a)), list(range(30,0,-3)))
+        with self.assertRaises(IndexError):
+            a.ord(4)
+        m=ConcreteModel()
+        m.b=RangeSet(1,10,filter=lambda m, i: i % 3 == 0)
+        b=m.b
+        self.assertEqual(list(b), [3,6,9])
+        self.assertEqual(b.ord(9), 3)
+        self.assertEqual(b[2], 6)
+        self.assertEqual(list(reversed(b)), [9,6,3])
+
 class SimpleSetB(SimpleSetA):
 
     def setUp(self):
@@ -3431,5 +3452,65 @@ class TestNestedSetOperations(unittest.TestCase):
         self.assertEqual(sorted(inst.product3),
                          sorted(prod3))
 
+class TestOrderedSetProduct(unittest.TestCase):
+
+    def setUp(self):
+        self.model = ConcreteModel()
+        self.model.A = RangeSet(3,9,3)
+        self.model.B = Set(initialize=['b','a'], ordered=True)
+        self.model.C = Set(initialize=[(1,2),(3,4)], ordered=True)
+        self.model.P = self.model.A*self.model.B*self.model.C
+
+    def test_getitem_ord(self):
+        P = self.model.P
+        members = list(P)
+        self.assertEqual(len(members), 12)
+        self.assertEqual(members[0], (3,'b',1,2))
+        for i, x in enumerate(members, 1):
+            self.assertEqual(P[i], x)
+            self.assertEqual(P.ord(x), i)
+        self.assertEqual(P[-1], (9,'a',3,4))
+        self.assertEqual(P.first(), (3,'b',1,2))
+        self.assertEqual(P.last(), (9,'a',3,4))
+        with self.assertRaises(IndexError):
+            P[13]
+        with self.assertRaises(IndexError):
+            P.ord((3,'b'))
+        with self.assertRaises(KeyError):
+            P.ord((3,'c',1,2))
+
+    def test_next_prev(self):
+        P = self.model.P
+        self.assertEqual(P.next((3,'a',3,4)), (6,'b',1,2))
+        self.assertEqual(P.prev((6,'b',1,2)), (3,'a',3,4))
+        self.assertEqual(P.nextw((9,'a',3,4)), (3,'b',1,2))
+        self.assertEqual(P.prevw((3,'b',1,2)), (9,'a',3,4))
+        with self.assertRaises(KeyError):
+            P.next((9,'a',3,4))
+
+    def test_unordered_factor(self):
+        model = self.model
+        model.D = Set(initialize=[1,2])
+        model.Q = model.A*model.D
+        with self.assertRaises(TypeError):
+            model.Q.ord((3,1))
+        with self.assertRaises(TypeError):
+            model.Q[1]
+
+    def test_large_sparse_component(self):
+        # neither the product nor the iteration over the sparse
+        # component should materialize the 10^18 index tuples
+        model = self.model
+        model.R = RangeSet(10**6)*RangeSet(10**6)*RangeSet(10**6)
+        self.assertEqual(len(model.R), 10**18)
+        self.assertEqual(model.R.ord((2,1,1)), 10**12+1)
+        self.assertEqual(model.R[10**12+1], (2,1,1))
+        model.x = Var(model.R, dense=False)
+        model.x[3,4,5] = 1
+        model.x[10**6,1,1] = 2
+        model.x[1,2,3] = 3
+        self.assertEqual(list(model.x.keys()),
+                         [(1,2,3), (3,4,5), (10**6,1,1)])
+
 if __name__ == "__main__":
     unittest.main()
@@ -18,11 +18,20 @@ import os
 from os.path import abspath, dirname
 currdir = dirname(abspath(__file__))+os.sep
 
+import pickle
+
 import pyutilib.th as unittest
 
 from pyomo.core.base import IntegerSet
+from pyomo.core.base.var import ColumnarIndexedVar, _ColumnarVarData
 from pyomo.environ import *
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 class PyomoModel(unittest.TestCase):
 
     def setUp(self):
@@ -1329,6 +1338,50 @@ class MiscVarTests(unittest.TestCase):
         self.assertTrue( newIdx in model.s[1] )
         self.assertTrue( newIdx in model.x )
 
+    def test_initialize_with_generator(self):
+        model = ConcreteModel()
+        model.I = RangeSet(1000)
+        model.J = RangeSet(1000)
+        def x_init(model):
+            for i in range(1, 1001, 100):
+                yield (i, i), i
+        model.x = Var(model.I, model.J, initialize=x_init, bounds=(0, 500))
+        self.assertEqual(len(model.x), 10)
+        self.assertEqual(model.x[101,101].value, 101)
+        self.assertEqual(model.x[101,101].ub, 500)
+        # members added later are not initialized by the generator
+        self.assertEqual(model.x[1,2].value, None)
+        self.assertEqual(model.x[1,2].ub, 500)
+        self.assertEqual(len(model.x), 11)
+        def bad_init(model):
+            yield 1, 600
+        self.assertRaisesRegexp(
+            ValueError, "not in domain",
+            setattr, model, 'y', Var(model.I, within=Binary,
+                                     initialize=bad_init))
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_values_array(self):
+        model = ConcreteModel()
+        model.I = Set(initialize=['c','a','b'], ordered=True)
+        model.x = Var(model.I, within=NonNegativeIntegers)
+        model.x['a'] = 1
+        self.assertEqual(
+            numpy.isnan(model.x.extract_values_array()).tolist(),
+            [True, False, True])
+        model.x.set_values(numpy.array([3, 1, 2]))
+        self.assertEqual(model.x.extract_values_array().tolist(), [3, 1, 2])
+        self.assertFalse(model.x['b'].stale)
+        model.x.set_values(numpy.array([5, 4]), index_order=['b', 'c'])
+        self.assertEqual(model.x.extract_values_array(['c', 'b']).tolist(),
+                         [4, 5])
+        with self.assertRaisesRegexp(ValueError, "not in domain"):
+            model.x.set_values([1, -1, 2])
+        model.x.set_values([1, numpy.nan, 2])
+        self.assertIsNone(model.x['a'].value)
+        with self.assertRaisesRegexp(ValueError, "Expected an array of 3"):
+            model.x.set_values([1, 2])
+
     def test_abstract_index(self):
         model = AbstractModel()
         model.A = Set()
@@ -1337,5 +1390,179 @@ class MiscVarTests(unittest.TestCase):
         model.x = Var(model.C)
 
 
+@unittest.skipIf(not numpy_available, "numpy is not available")
+class TestColumnarVar(unittest.TestCase):
+
+    def test_construct(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], columnar=True, initialize=2, bounds=(0,5))
+        self.assertIs(type(m.x), ColumnarIndexedVar)
+        self.assertEqual(len(m.x), 3)
+        for i in m.x:
+            self.assertIs(type(m.x[i]), _ColumnarVarData)
+            self.assertEqual(m.x[i].value, 2)
+            self.assertEqual(m.x[i].lb, 0)
+            self.assertEqual(m.x[i].ub, 5)
+            self.assertFalse(m.x[i].fixed)
+            self.assertFalse(m.x[i].stale)
+        m.y = Var([1,2,3], columnar=True)
+        self.assertEqual([m.y[i].value for i in m.y], [None]*3)
+        self.assertEqual([m.y[i].bounds for i in m.y], [(None,None)]*3)
+        self.assertEqual([m.y[i].stale for i in m.y], [True]*3)
+
+    def test_construct_rules(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], columnar=True,
+                  initialize={1: 1, 2: 2},
+                  bounds=lambda m, i: (i, 10*i),
+                  within=lambda m, i: Integers if i == 1 else Reals)
+        self.assertEqual([m.x[i].value for i in m.x], [1, 2, None])
+        self.assertEqual([m.x[i].bounds for i in m.x],
+                         [(1,10), (2,20), (3,30)])
+        self.assertTrue(m.x[1].is_integer())
+        self.assertTrue(m.x[2].is_continuous())
+        with self.assertRaises(ValueError):
+            m.y = Var([1,2], columnar=True, within=Binary, initialize=2)
+
+    def test_integer_values(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], columnar=True, initialize=1, bounds=(0,5),
+                  within=lambda m, i: Reals if i == 3 else Integers)
+        m.x[2].value = 1.5
+        m.y = Var([1], columnar=True, within=Binary, initialize=1)
+        self.assertEqual([type(m.x[i].value) for i in m.x],
+                         [int, float, float])
+        self.assertEqual([type(m.x[i].ub) for i in m.x], [int, int, float])
+        self.assertIs(type(m.y[1].value), int)
+        self.assertEqual(m.y[1].bounds, (0, 1))
+        self.assertEqual(m.x.extract_values_array().dtype, float)
+
+    def test_mutable_bounds(self):
+        m = ConcreteModel()
+        m.p = Param(mutable=True, initialize=1)
+        m.x = Var([1,2], columnar=True, within=NonNegativeReals)
+        m.x[1].setlb(m.p)
+        m.x[2].setub(m.p)
+        self.assertEqual(m.x[1].lb, 1)
+        self.assertEqual(m.x[2].lb, 0)
+        self.assertEqual(m.x[2].ub, 1)
+        m.p = -3
+        self.assertEqual(m.x[1].lb, 0)
+        self.assertEqual(m.x[2].ub, -3)
+        m.x[1].setlb(None)
+        m.p = 2
+        self.assertEqual(m.x[1].lb, 0)
+        with self.assertRaises(ValueError):
+            m.x[1].setlb(m.x[2])
+
+    def test_values_array(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=['c','a','b'], ordered=True)
+        m.x = Var(m.I, columnar=True, within=NonNegativeIntegers)
+        m.x['a'] = 1
+        self.assertEqual(
+            numpy.isnan(m.x.extract_values_array()).tolist(),
+            [True, False, True])
+        m.x.set_values([3, 1, 2])
+        self.assertEqual(m.x.extract_values_array().tolist(), [3, 1, 2])
+        self.assertEqual(value(m.x['c']), 3)
+        self.assertFalse(m.x['b'].stale)
+        with self.assertRaisesRegexp(ValueError, "not in domain"):
+            m.x.set_values([1, -1, 2])
+        self.assertEqual(value(m.x['a']), 1)
+        m.x.set_values([1, -1, 2], valid=True)
+        self.assertEqual(value(m.x['a']), -1)
+        with self.assertRaisesRegexp(ValueError, "Expected an array of 3"):
+            m.x.set_values([1, 2])
+        m.x.set_values({'c': 5})
+        self.assertEqual(value(m.x['c']), 5)
+        order = ('b', 'c')
+        m.x.set_values([7, 8], index_order=order)
+        self.assertEqual(m.x.extract_values_array(order).tolist(), [7, 8])
+        self.assertEqual(m.x.extract_values_array().tolist(), [8, -1, 7])
+
+    def test_fix_mask(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], columnar=True, initialize=1)
+        m.x.fix(mask=[True, False, True])
+        self.assertEqual([m.x[i].fixed for i in m.x], [True, False, True])
+        m.x.fix(4, mask=[False, True, False])
+        self.assertEqual([m.x[i].value for i in m.x], [1, 4, 1])
+        m.x.unfix(mask=[True, False, False])
+        self.assertEqual([m.x[i].fixed for i in m.x], [False, True, True])
+        m.x.unfix()
+        self.assertEqual([m.x[i].fixed for i in m.x], [False]*3)
+        m.x[2].fix(0)
+        self.assertTrue(m.x[2].fixed)
+        self.assertEqual(m.x[2].value, 0)
+        with self.assertRaisesRegexp(ValueError, "Expected a mask of 3"):
+            m.x.fix(mask=[True])
+
+    def test_fix_validation(self):
+        m = ConcreteModel()
+        m.x = Var([1,2,3], columnar=True, within=Binary)
+        with self.assertRaisesRegexp(ValueError, "is not in domain Binary"):
+            m.x.fix(2, mask=[True, False, True])
+        # nothing is fixed if the validation fails
+        self.assertEqual([m.x[i].fixed for i in m.x], [False]*3)
+        self.assertEqual([m.x[i].value for i in m.x], [None]*3)
+        m.x.fix([1, 0], mask=[True, False, True])
+        self.assertEqual([m.x[i].value for i in m.x], [1, None, 0])
+        self.assertEqual([m.x[i].fixed for i in m.x], [True, False, True])
+
+    def test_nan_is_none(self):
+        m = ConcreteModel()
+        m.x = Var([1,2], columnar=True, initialize=1)
+        m.x[1].value = float('nan')
+        self.assertIsNone(m.x[1].value)
+        m.x.set_values([2, float('nan')])
+        self.assertEqual(m.x[1].value, 2)
+        self.assertIsNone(m.x[2].value)
+        m.x.fix(None)
+        self.assertTrue(all(v != v for v in m.x.extract_values_array()))
+
+    def test_domain(self):
+        m = ConcreteModel()
+        m.x = Var([1,2], columnar=True)
+        m.x.domain = Binary
+        self.assertTrue(m.x[1].is_binary())
+        m.x[2].domain = Reals
+        self.assertFalse(m.x[2].is_binary())
+        self.assertEqual(m.x[1].bounds, (0,1))
+
+    def test_initialize_with_generator(self):
+        m = ConcreteModel()
+        def x_init(m):
+            yield 3, 0.5
+            yield 1, 1.5
+        m.x = Var([1,2,3], columnar=True, initialize=x_init)
+        self.assertEqual(len(m.x), 2)
+        self.assertEqual(m.x[3].value, 0.5)
+        self.assertEqual(m.x[1].value, 1.5)
+
+    def test_sparse(self):
+        m = ConcreteModel()
+        m.x = Var(Any, dense=False, columnar=True, bounds=(0,1))
+        self.assertEqual(len(m.x), 0)
+        for i in range(10):
+            m.x[i] = i/10.0
+        self.assertEqual(len(m.x), 10)
+        self.assertEqual(m.x[7].value, 0.7)
+        self.assertEqual(m.x[7].bounds, (0,1))
+        del m.x[3]
+        self.assertEqual(len(m.x.extract_values_array()), 9)
+
+    def test_clone_and_pickle(self):
+        m = ConcreteModel()
+        m.x = Var([1,2], columnar=True, initialize=3, within=Integers)
+        m.c = Constraint(expr=m.x[1] + m.x[2] >= 1)
+        for i in (m.clone(), pickle.loads(pickle.dumps(m))):
+            self.assertEqual(i.x.extract_values_array().tolist(), [3, 3])
+            self.assertTrue(i.x[1].is_integer())
+            i.x[1] = 5
+            self.assertEqual(value(i.c.body), 8)
+            self.assertEqual(value(m.c.body), 6)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -142,6 +142,9 @@ class SolverFactoryClass(Factory):
         if _name is None:
             return self
         _name=str(_name)
+        # The arguments used to create the solver (so that an
+        # equivalent solver can be created in another process)
+        factory_args = (_name, dict(kwds))
         if ':' in _name:
             _name, subsolver = _name.split(':',1)
             kwds['solver'] = subsolver
@@ -179,6 +182,8 @@ class SolverFactoryClass(Factory):
         if opt is None:
             opt = UnknownSolver( type=_name, **kwds )
             opt.name = _name
+        else:
+            opt._factory_args = factory_args
         return opt
 
 SolverFactory = SolverFactoryClass('solver type')
@@ -509,6 +514,42 @@ class OptSolver(object):
     def solve(self, *args, **kwds):
         """ Solve the problem """
 
+        _model, orig_options = self._solve_setup(args, kwds)
+        try:
+
+            # we're good to go.
+            initial_time = time.time()
+
+            self._presolve(*args, **kwds)
+
+            presolve_completion_time = time.time()
+            if self._report_timing:
+                print("      %6.2f seconds required for presolve" % (presolve_completion_time - initial_time))
+
+            if not _model is None:
+                self._initialize_callbacks(_model)
+
+            _status = self._apply_solver()
+            result = self._solve_finish(_model,
+                                        _status,
+                                        presolve_completion_time)
+        finally:
+            #
+            # Reset the options dict
+            #
+            self.options = orig_options
+
+        return result
+
+    def _solve_setup(self, args, kwds):
+        """
+        Validate the solve arguments, collect the model import
+        suffixes into kwds and apply the ephemeral solver options.
+        Returns the model being solved (or None) and the original
+        options dictionary that must be restored once the solve is
+        complete.
+        """
+
         self.available(exception_flag=True)
         #
         # If the inputs are models, then validate that they have been
@@ -522,6 +563,9 @@ class OptSolver(object):
         for arg in args:
             if isinstance(arg, (_BlockData, IBlock)):
                 if isinstance(arg, _BlockData):
+                    _top = arg.model()
+                    if getattr(_top, '_deferred_construction', None):
+                        _top.construct_deferred()
                     if not arg.is_constructed():
                         raise RuntimeError(
                             "Attempting to solve model=%s with unconstructed "
@@ -561,88 +605,78 @@ class OptSolver(object):
         self.options.update(kwds.pop('options', {}))
         self.options.update(
             self._options_string_to_dict(kwds.pop('options_string', '')))
-        try:
 
-            # we're good to go.
-            initial_time = time.time()
-
-            self._presolve(*args, **kwds)
-
-            presolve_completion_time = time.time()
-            if self._report_timing:
-                print("      %6.2f seconds required for presolve" % (presolve_completion_time - initial_time))
+        return _model, orig_options
 
-            if not _model is None:
-                self._initialize_callbacks(_model)
+    def _solve_finish(self, _model, _status, presolve_completion_time):
+        """
+        Check the status returned by _apply_solver, perform
+        the solve post-processing and load the results into
+        the model (if requested). Returns the results object.
+        """
+        from pyomo.core.kernel.block import IBlock
 
-            _status = self._apply_solver()
-            if hasattr(self, '_transformation_data'):
-                del self._transformation_data
-            if not hasattr(_status, 'rc'):
-                logger.warning(
-                    "Solver (%s) did not return a solver status code.\n"
-                    "This is indicative of an internal solver plugin error.\n"
-                    "Please report this to the Pyomo developers." )
-            elif _status.rc:
+        if hasattr(self, '_transformation_data'):
+            del self._transformation_data
+        if not hasattr(_status, 'rc'):
+            logger.warning(
+                "Solver (%s) did not return a solver status code.\n"
+                "This is indicative of an internal solver plugin error.\n"
+                "Please report this to the Pyomo developers." )
+        elif _status.rc:
+            logger.error(
+                "Solver (%s) returned non-zero return code (%s)"
+                % (self.name, _status.rc,))
+            if self._tee:
                 logger.error(
-                    "Solver (%s) returned non-zero return code (%s)"
-                    % (self.name, _status.rc,))
-                if self._tee:
-                    logger.error(
-                        "See the solver log above for diagnostic information." )
-                elif hasattr(_status, 'log') and _status.log:
-                    logger.error("Solver log:\n" + str(_status.log))
-                raise pyutilib.common.ApplicationError(
-                    "Solver (%s) did not exit normally" % self.name)
-            solve_completion_time = time.time()
-            if self._report_timing:
-                print("      %6.2f seconds required for solver" % (solve_completion_time - presolve_completion_time))
-
-            result = self._postsolve()
-            result._smap_id = self._smap_id
-            result._smap = None
-            if _model:
-                if isinstance(_model, IBlock):
-                    if len(result.solution) == 1:
-                        result.solution(0).symbol_map = \
-                            getattr(_model, "._symbol_maps")[result._smap_id]
-                        result.solution(0).default_variable_value = \
-                            self._default_variable_value
-                        if self._load_solutions:
-                            _model.load_solution(result.solution(0))
-                    else:
-                        assert len(result.solution) == 0
-                    # see the hack in the write method
-                    # we don't want this to stick around on the model
-                    # after the solve
-                    assert len(getattr(_model, "._symbol_maps")) == 1
-                    delattr(_model, "._symbol_maps")
-                    del result._smap_id
-                    if self._load_solutions and \
-                       (len(result.solution) == 0):
-                        logger.error("No solution is available")
-                else:
+                    "See the solver log above for diagnostic information." )
+            elif hasattr(_status, 'log') and _status.log:
+                logger.error("Solver log:\n" + str(_status.log))
+            raise pyutilib.common.ApplicationError(
+                "Solver (%s) did not exit normally" % self.name)
+        solve_completion_time = time.time()
+        if self._report_timing:
+            print("      %6.2f seconds required for solver" % (solve_completion_time - presolve_completion_time))
+
+        result = self._postsolve()
+        result._smap_id = self._smap_id
+        result._smap = None
+        if _model:
+            if isinstance(_model, IBlock):
+                if len(result.solution) == 1:
+                    result.solution(0).symbol_map = \
+                        getattr(_model, "._symbol_maps")[result._smap_id]
+                    result.solution(0).default_variable_value = \
+                        self._default_variable_value
                     if self._load_solutions:
-                        _model.solutions.load_from(
-                            result,
-                            select=self._select_index,
-                            default_variable_value=self._default_variable_value)
-                        result._smap_id = None
-                        result.solution.clear()
-                    else:
-                        result._smap = _model.solutions.symbol_map[self._smap_id]
-                        _model.solutions.delete_symbol_map(self._smap_id)
-            postsolve_completion_time = time.time()
-
-            if self._report_timing:
-                print("      %6.2f seconds required for postsolve"
-                      % (postsolve_completion_time - solve_completion_time))
+                        _model.load_solution(result.solution(0))
+                else:
+                    assert len(result.solution) == 0
+                # see the hack in the write method
+                # we don't want this to stick around on the model
+                # after the solve
+                assert len(getattr(_model, "._symbol_maps")) == 1
+                delattr(_model, "._symbol_maps")
+                del result._smap_id
+                if self._load_solutions and \
+                   (len(result.solution) == 0):
+                    logger.error("No solution is available")
+            else:
+                if self._load_solutions:
+                    _model.solutions.load_from(
+                        result,
+                        select=self._select_index,
+                        default_variable_value=self._default_variable_value)
+                    result._smap_id = None
+                    result.solution.clear()
+                else:
+                    result._smap = _model.solutions.symbol_map[self._smap_id]
+                    _model.solutions.delete_symbol_map(self._smap_id)
+        postsolve_completion_time = time.time()
 
-        finally:
-            #
-            # Reset the options dict
-            #
-            self.options = orig_options
+        if self._report_timing:
+            print("      %6.2f seconds required for postsolve"
+                  % (postsolve_completion_time - solve_completion_time))
 
         return result
 
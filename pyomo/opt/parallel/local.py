@@ -12,12 +12,29 @@
 __all__ = ()
 
 import time
+import traceback
+import multiprocessing
+from collections import deque
+try:
+    import cPickle as pickle
+except ImportError:                         #pragma:nocover
+    import pickle
 
 try:
     from collections import OrderedDict
 except ImportError:                         #pragma:nocover
     from ordereddict import OrderedDict
 
+try:
+    from multiprocessing.connection import wait as _wait_connections
+except ImportError:                         #pragma:nocover
+    # Python 2
+    def _wait_connections(connections):
+        while True:
+            ready = [conn for conn in connections if conn.poll(0.01)]
+            if ready:
+                return ready
+
 import pyomo.opt
 from pyomo.opt.parallel.manager import (ActionManagerError,
                                         ActionStatus,
@@ -25,7 +42,7 @@ from pyomo.opt.parallel.manager import (ActionManagerError,
 from pyomo.opt.parallel.async_solver import AsynchronousSolverManager, SolverManagerFactory
 
 import six
-from six import string_types
+from six import string_types, iteritems
 
 
 @SolverManagerFactory.register("serial", doc="Synchronously execute solvers locally")
@@ -80,3 +97,276 @@ class SolverManager_Serial(AsynchronousSolverManager):
                             explanation=("No queued evaluations available in "
                                          "the 'serial' solver manager, which "
                                          "executes solvers synchronously"))
+
+
+def _relabel_solutions(results):
+    """
+    Replace the solver symbols in the solutions of a results object
+    by the names of the corresponding model components, so that the
+    solutions can be loaded into another copy of the model.
+    """
+    smap = results.__dict__.get('_smap', None)
+    results._smap = None
+    results._smap_id = None
+    if smap is None:
+        return
+    for solution in results.solution:
+        solution._cuid = False
+        for name in ('problem', 'objective', 'variable', 'constraint'):
+            entries = getattr(solution, name)
+            relabeled = {}
+            for symb, val in iteritems(entries):
+                obj = smap.bySymbol.get(symb, None)
+                if obj is None:
+                    obj = smap.aliases.get(symb, None)
+                    if obj is None:
+                        continue
+                relabeled[obj().name] = val
+            entries.clear()
+            entries.update(relabeled)
+
+
+def _pool_worker(conn):
+    """
+    The main loop of a SolverManager_Pool worker process. Solves
+    are received over the connection until None is received. The
+    solver plugins are kept (and reused) for the lifetime of the
+    worker.
+    """
+    import pyomo.environ
+    solvers = {}
+    try:
+        while True:
+            task = conn.recv_bytes()
+            if not task:
+                break
+            ah_id, solver_type, factory_kwds, options, args, kwds = \
+                pickle.loads(task)
+            try:
+                time_start = time.time()
+                key = (solver_type, repr(sorted(factory_kwds.items())))
+                opt = solvers.get(key, None)
+                if opt is None:
+                    opt = pyomo.opt.SolverFactory(solver_type,
+                                                  **factory_kwds)
+                    solvers[key] = opt
+                if hasattr(opt, 'set_instance') and len(args):
+                    # persistent solver interfaces
+                    opt.set_instance(args[0])
+                results = opt.solve(*args,
+                                    options=options,
+                                    load_solutions=False,
+                                    **kwds)
+                _relabel_solutions(results)
+                results.pyomo_solve_time = time.time()-time_start
+                task = (ah_id, results, None)
+            except Exception:
+                task = (ah_id, None, traceback.format_exc())
+            conn.send_bytes(pickle.dumps(task, pickle.HIGHEST_PROTOCOL))
+    finally:
+        conn.close()
+
+
+@SolverManagerFactory.register("pool", doc="Execute solvers in a pool of local worker processes")
+class SolverManager_Pool(AsynchronousSolverManager):
+    """
+    A solver manager that dispatches solves to a pool of long-lived
+    worker processes. Each worker keeps the solver plugins it
+    creates (e.g., direct or persistent solver interfaces holding a
+    solver environment and license) for its lifetime, so the per-solve
+    cost is limited to shipping the (pickled) model to the worker and
+    the results back. Models must be picklable.
+
+    The solver is given by name (with the optional 'solver_io' and
+    'executable' keywords) or as a solver instance. A solver instance
+    is not shipped to the workers: the workers create an equivalent
+    solver with the name and keywords that were passed to the
+    SolverFactory (and the executable set on the instance) and use
+    the options of the instance. Other settings of the instance are
+    not used. Every solve ships a new copy of the model, so persistent
+    solver interfaces are kept (along with their solver environment)
+    but call set_instance() for every solve.
+
+    The solutions are loaded into the model passed to queue() (unless
+    load_solutions=False) when the corresponding results are
+    collected with one of the wait methods. The number of workers is
+    set with the 'num_workers' keyword (default: the number of
+    CPUs). The workers are started on the first queue() and are
+    stopped by close() (or on exiting a 'with' block).
+    """
+
+    def __init__(self, **kwds):
+        self._num_workers = kwds.pop('num_workers', None)
+        if self._num_workers is None:
+            self._num_workers = multiprocessing.cpu_count()
+        self._workers = []
+        self._idle = deque()
+        self._busy = {}
+        self._pending = deque()
+        self._tasks = {}
+        self._completed = deque()
+        super(SolverManager_Pool, self).__init__(**kwds)
+
+    def clear(self):
+        """
+        Clear manager state
+        """
+        super(SolverManager_Pool, self).clear()
+        self.results = OrderedDict()
+        self._pending.clear()
+        self._tasks = {}
+        self._completed.clear()
+
+    def close(self):
+        """
+        Stop the worker processes.
+        """
+        for process, conn in self._workers:
+            try:
+                conn.send_bytes(b'')
+            except (IOError, OSError):
+                pass
+        for process, conn in self._workers:
+            process.join(1)
+            if process.is_alive():
+                process.terminate()
+            conn.close()
+        self._workers = []
+        self._idle.clear()
+        self._busy = {}
+
+    def __exit__(self, t, v, traceback):
+        self.close()
+
+    def _start_workers(self):
+        while len(self._workers) < self._num_workers:
+            conn, worker_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_pool_worker,
+                                              args=(worker_conn,))
+            process.daemon = True
+            process.start()
+            worker_conn.close()
+            self._workers.append((process, conn))
+            self._idle.append(conn)
+
+    def _dispatch(self):
+        while self._idle and self._pending:
+            conn = self._idle.popleft()
+            ah_id, task = self._pending.popleft()
+            conn.send_bytes(task)
+            self._busy[conn] = ah_id
+
+    def _perform_queue(self, ah, *args, **kwds):
+        """
+        Perform the queue operation.  This method returns the ActionHandle,
+        and the ActionHandle status indicates whether the queue was successful.
+        """
+
+        opt = kwds.pop('solver', kwds.pop('opt', None))
+        if opt is None:
+            raise ActionManagerError(
+                "No solver passed to %s, use keyword option 'solver'"
+                % (type(self).__name__) )
+        #
+        # The solver is constructed in the worker, based on the
+        # arguments used to create it and its options
+        #
+        options = {}
+        if isinstance(opt, string_types):
+            solver_type = opt
+            factory_kwds = {}
+            for key in ('solver_io', 'executable'):
+                if kwds.get(key, None) is not None:
+                    factory_kwds[key] = kwds.pop(key)
+        else:
+            solver_type, factory_kwds = getattr(
+                opt, '_factory_args', (opt.type, {}))
+            factory_kwds = dict(factory_kwds)
+            executable = getattr(opt, '_user_executable', None)
+            if executable is not None:
+                factory_kwds['executable'] = executable
+            for key in opt.options:
+                options[key] = opt.options[key]
+        options.update(kwds.pop('options', {}))
+
+        #
+        # The solutions are loaded here (into the original model)
+        #
+        load_solutions = kwds.pop('load_solutions', True)
+        select = kwds.pop('select', 0)
+        default_variable_value = kwds.pop('default_variable_value', None)
+
+        task = pickle.dumps((ah.id, solver_type, factory_kwds, options,
+                             args, kwds),
+                            pickle.HIGHEST_PROTOCOL)
+        self._tasks[ah.id] = (args,
+                              load_solutions,
+                              select,
+                              default_variable_value)
+        self._pending.append((ah.id, task))
+        self._start_workers()
+        self._dispatch()
+
+        return ah
+
+    def _perform_wait_any(self):
+        """
+        Perform the wait_any operation.  This method returns an
+        ActionHandle with the results of waiting.  If None is returned
+        then the ActionManager assumes that it can call this method again.
+        Note that an ActionHandle can be returned with a dummy value,
+        to indicate an error.
+        """
+        if len(self._completed) > 0:
+            return self.event_handle[self._completed.popleft()]
+        if len(self._busy) == 0:
+            return ActionHandle(error=True,
+                                explanation=("No queued evaluations available "
+                                             "in the 'pool' solver manager"))
+        for conn in _wait_connections(list(self._busy)):
+            self._collect(conn)
+        self._dispatch()
+        return None
+
+    def _collect(self, conn):
+        ah_id = self._busy.pop(conn)
+        ah = self.event_handle[ah_id]
+        (args,
+         load_solutions,
+         select,
+         default_variable_value) = self._tasks.pop(ah_id)
+        try:
+            ah_id_, results, error = pickle.loads(conn.recv_bytes())
+        except EOFError:
+            # replace the worker
+            for worker in self._workers:
+                if worker[1] is conn:
+                    self._workers.remove(worker)
+                    worker[0].join(1)
+                    break
+            conn.close()
+            self._start_workers()
+            ah.status = ActionStatus.error
+            raise ActionManagerError(
+                "The %s worker solving action %s terminated unexpectedly"
+                % (type(self).__name__, ah_id))
+        self._idle.append(conn)
+        assert ah_id_ == ah_id
+        if error is not None:
+            ah.status = ActionStatus.error
+            raise ActionManagerError(
+                "The %s worker failed to solve action %s:\n%s"
+                % (type(self).__name__, ah_id, error))
+
+        from pyomo.core.base.block import _BlockData
+        if load_solutions and len(args) and \
+           isinstance(args[0], _BlockData):
+            args[0].solutions.load_from(
+                results,
+                select=select,
+                default_variable_value=default_variable_value)
+            results.solution.clear()
+
+        self.results[ah_id] = results
+        ah.status = ActionStatus.done
+        self._completed.append(ah_id)
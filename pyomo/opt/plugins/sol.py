@@ -25,6 +25,15 @@ from pyomo.opt import (SolverResults,
 
 from six.moves import xrange
 
+def _read_values(fin, count):
+    """
+    Read the next 'count' lines of a *.sol file, each of which
+    holds a single number, and return the values as a list of
+    floats.
+    """
+    readline = fin.readline
+    return [float(readline()) for i in xrange(count)]
+
 
 @results.ReaderFactory.register(str(ResultsFormat.sol))
 class ResultsReader_sol(results.AbstractResultsReader):
@@ -37,6 +46,12 @@ class ResultsReader_sol(results.AbstractResultsReader):
         results.AbstractResultsReader.__init__(self,ResultsFormat.sol)
         if not name is None:
             self.name = name
+        # When False, the primal (and dual) values are stored on
+        # the solution as lists indexed by the NL column (row) id
+        # (see Solution.set_indexed_values) rather than expanded
+        # into 'v<i>' ('c<i>') entries of the solution variable
+        # (constraint) maps.
+        self.store_solution = True
 
     def __call__(self, filename, res=None, soln=None, suffixes=[]):
         """
@@ -86,18 +101,8 @@ class ResultsReader_sol(results.AbstractResultsReader):
             raise ValueError("no Options line found")
         n = z[nopts + 3] # variables
         m = z[nopts + 1] # constraints
-        x = []
-        y = []
-        i = 0
-        while i < m:
-            line = fin.readline()
-            y.append(float(line))
-            i += 1
-        i = 0
-        while i < n:
-            line = fin.readline()
-            x.append(float(line))
-            i += 1
+        y = _read_values(fin, m)
+        x = _read_values(fin, n)
         objno = [0,0]
         line = fin.readline()
         if line:                    # WEH - when is this true?
@@ -167,14 +172,18 @@ class ResultsReader_sol(results.AbstractResultsReader):
             soln.message = msg.strip()
             soln.message = res.solver.message.replace("\n","; ")
             soln_variable = soln.variable
-            i = 0
-            for var_value in x:
-                soln_variable["v"+str(i)] = {"Value" : var_value}
-                i = i + 1
             soln_constraint = soln.constraint
-            if any(re.match(suf,"dual") for suf in suffixes):
-                for i in xrange(0,len(y)):
-                    soln_constraint["c"+str(i)] = {"Dual" : y[i]}
+            load_duals = any(re.match(suf,"dual") for suf in suffixes)
+            if self.store_solution:
+                soln_variable.update(("v%d" % i, {"Value" : var_value})
+                                     for i, var_value in enumerate(x))
+                if load_duals:
+                    soln_constraint.update(("c%d" % i, {"Dual" : dual_value})
+                                           for i, dual_value in enumerate(y))
+            else:
+                soln.set_indexed_values("variable", "v", "Value", x)
+                if load_duals:
+                    soln.set_indexed_values("constraint", "c", "Dual", y)
 
             ### Read suffixes ###
             line = fin.readline()
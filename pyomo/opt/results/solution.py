@@ -73,6 +73,67 @@ class Solution(MapContainer):
         self.declare('constraint', value={})
 
         self._option = default_print_options
+        self._indexed_values = {}
+
+    def set_indexed_values(self, name, prefix, key, values):
+        """
+        Store a sequence of values for the 'variable' or 'constraint'
+        entries of this solution by position rather than by symbol.
+        The i-th value is associated with the symbol prefix+str(i)
+        (e.g., 'v0', 'v1', ... for NL file variables) and stored
+        under the given key (e.g., 'Value' or 'Dual').
+
+        Values stored this way can be mapped directly onto model
+        components through a symbol map (see
+        ModelSolutions.add_solution). The symbol-keyed entries are
+        only created when the 'variable' or 'constraint' map is
+        accessed or the solution is written or printed.
+        """
+        assert name in ('variable', 'constraint')
+        self._indexed_values[name] = (prefix, key, values)
+
+    def get_indexed_values(self, name):
+        """
+        Return the (prefix, key, values) tuple stored with
+        set_indexed_values for the 'variable' or 'constraint'
+        entries (or None if there are no such values).
+        """
+        indexed_values = self.__dict__.get('_indexed_values', None)
+        if not indexed_values:
+            return None
+        return indexed_values.get(name, None)
+
+    def _entries(self, name):
+        """
+        Return the symbol-keyed entry dictionary for the 'problem',
+        'objective', 'variable' or 'constraint' map of this solution
+        without expanding any indexed values into it.
+        """
+        return dict.__getitem__(self, self._convert(name)).value
+
+    def _expand_indexed_values(self):
+        indexed_values = self.__dict__.get('_indexed_values', None)
+        if not indexed_values:
+            return
+        self._indexed_values = {}
+        for name, (prefix, key, values) in iteritems(indexed_values):
+            entries = self._entries(name)
+            for i, val in enumerate(values):
+                symb = prefix + str(i)
+                if symb in entries:
+                    entries[symb][key] = val
+                else:
+                    entries[symb] = {key: val}
+
+    def __getitem__(self, name):
+        if self.__dict__.get('_indexed_values', None) and \
+           (self._convert(name) in ('Variable', 'Constraint')):
+            self._expand_indexed_values()
+        return MapContainer.__getitem__(self, name)
+
+    def _repn_(self, option):
+        self._expand_indexed_values()
+        return MapContainer._repn_(self, option)
 
     def load(self, repn):
         # delete key from dictionary, call base class load, handle variable loading.
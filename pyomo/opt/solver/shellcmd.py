@@ -13,8 +13,11 @@ __all__ = ['SystemCallSolver']
 import os
 import sys
 import time
+import shlex
 import logging
 
+import six
+
 import pyutilib.misc
 from pyutilib.common import ApplicationError, WindowsError
 from pyutilib.misc import Bunch
@@ -28,6 +31,95 @@ from pyomo.opt.results import SolverStatus, SolverResults
 logger = logging.getLogger('pyomo.opt')
 
 
+class _DetachedTempfiles(object):
+    """
+    The TempfileManager context of a solve_async() call.
+
+    The TempfileManager keeps a single (global) stack of temporary file
+    contexts: _presolve() pushes the context for a solve and
+    _postsolve() pops it.  While the subprocess of an asynchronous
+    solve runs, other solves may push and pop their own contexts, so
+    the context of the asynchronous solve is taken off the stack and
+    put back on top of the stack when the subprocess exits.  The
+    TempfileManager has no public API for this, so this class is the
+    only place that manipulates its stack directly.
+    """
+
+    def __init__(self):
+        # detach the current (top) context
+        self._files = TempfileManager._tempfiles.pop()
+        if not TempfileManager._tempfiles:
+            # TempfileManager.pop() always leaves a (base) context
+            TempfileManager._tempfiles = [[]]
+
+    def attach(self):
+        """Put the context back on top of the stack"""
+        TempfileManager._tempfiles.append(self._files)
+
+    def release(self, remove=True):
+        """
+        Pop the context if it is still on top of the stack (i.e., the
+        solve failed before _postsolve() popped it).
+        """
+        if TempfileManager._tempfiles[-1] is self._files:
+            TempfileManager.pop(remove=remove)
+
+
+def _run_command_async(cmd, loop, callback, script=None, env=None,
+                       timelimit=None, tee=False):
+    """
+    Execute the command as an asyncio subprocess, calling
+    callback(rc, log) once it exits (or callback(None, None,
+    exception) if it could not be executed).  The solver output is
+    captured and echoed (with tee=True) once the subprocess exits.
+    """
+    import asyncio
+
+    if isinstance(cmd, six.string_types):
+        cmd = shlex.split(cmd, posix=(os.name != 'nt'))
+    if script is not None:
+        script = script.encode()
+        stdin = asyncio.subprocess.PIPE
+    else:
+        stdin = None
+
+    def _started(task):
+        try:
+            process = task.result()
+        except (OSError, WindowsError):
+            err = sys.exc_info()[1]
+            msg = 'Could not execute the command: %s\tError message: %s'
+            callback(None, None, ApplicationError(msg % (cmd, err)))
+            return
+        timer = None
+        if timelimit is not None:
+            timer = loop.call_later(timelimit, process.kill)
+        asyncio.ensure_future(process.communicate(script), loop=loop).\
+            add_done_callback(lambda task: _exited(task, process, timer))
+
+    def _exited(task, process, timer):
+        if timer is not None:
+            timer.cancel()
+        try:
+            output = task.result()[0]
+        except Exception as e:
+            callback(None, None, e)
+            return
+        log = output.decode(errors='replace')
+        if tee:
+            sys.stdout.write(log)
+            sys.stdout.flush()
+        callback(process.returncode, log)
+
+    asyncio.ensure_future(
+        asyncio.create_subprocess_exec(*cmd,
+                                       stdin=stdin,
+                                       stdout=asyncio.subprocess.PIPE,
+                                       stderr=asyncio.subprocess.STDOUT,
+                                       env=env),
+        loop=loop).add_done_callback(_started)
+
+
 class SystemCallSolver(OptSolver):
     """ A generic command line solver """
 
@@ -39,12 +131,15 @@ class SystemCallSolver(OptSolver):
 
         OptSolver.__init__(self, **kwargs)
         self._keepfiles  = False
+        self._lean_results = False
         self._results_file = None
         self._timer      = ''
         self._user_executable = None
         # broadly useful for reporting, and in cases where
         # a solver plugin may not report execution time.
         self._last_solve_time = None
+        # the future of the solve_async() call in progress (if any)
+        self._async_solve = None
 
         if executable is not None:
             self.set_executable(name=executable, validate=validate)
@@ -196,9 +291,22 @@ class SystemCallSolver(OptSolver):
         TempfileManager.push()
 
         self._keepfiles = kwds.pop("keepfiles", False)
+        self._lean_results = kwds.pop("lean_results", False)
 
         OptSolver._presolve(self, *args, **kwds)
 
+        #
+        # With lean_results=True, results readers that support it
+        # (e.g., the *.sol reader) store solution values by column
+        # index instead of building a symbol-keyed entry per
+        # variable.  The solution is still loaded into the model (and
+        # the symbol-keyed entries are built if the results are
+        # accessed).
+        #
+        if self._lean_results and \
+           (self._results_reader is not None):
+            self._results_reader.store_solution = False
+
         #
         # Verify that the input problems exists
         #
@@ -224,6 +332,13 @@ class SystemCallSolver(OptSolver):
             os.remove(self._soln_file)
 
     def _apply_solver(self):
+        self._prepare_execution()
+        sys.stdout.flush()
+        self._rc, self._log = self._execute_command(self._command)
+        sys.stdout.flush()
+        return Bunch(rc=self._rc, log=self._log)
+
+    def _prepare_execution(self):
         if registered_executable('timer'):
             self._timer = registered_executable('timer').get_path()
         #
@@ -242,10 +357,102 @@ class SystemCallSolver(OptSolver):
             if self._problem_files is not []:
                 print("Solver problem files: %s" % str(self._problem_files))
 
-        sys.stdout.flush()
-        self._rc, self._log = self._execute_command(self._command)
-        sys.stdout.flush()
-        return Bunch(rc=self._rc, log=self._log)
+    def solve_async(self, *args, **kwds):
+        """
+        Solve the problem without blocking on the solver executable.
+
+        The problem files are written and the solver command is
+        started as an asyncio subprocess before this method
+        returns. The returned asyncio Future is resolved with the
+        solver results once the subprocess exits, at which point the
+        results are processed (and loaded into the model) exactly as
+        they are by solve(). This allows a single process to keep
+        many solver subprocesses busy, e.g.,
+
+            futures = [SolverFactory('glpk').solve_async(m)
+                       for m in models]
+            loop.run_until_complete(asyncio.gather(*futures))
+
+        The event loop can be specified with the 'loop' keyword
+        (default: asyncio.get_event_loop()). On POSIX systems, it
+        must be the current event loop of the main thread so that
+        the subprocess exit is detected. Only one solve can be in
+        progress for a given solver instance at a time, so a
+        separate solver instance is required for each concurrent
+        solve. Solver output is only echoed (tee=True) once the
+        subprocess exits. Requires Python 3.4 or later.
+        """
+        try:
+            import asyncio
+        except ImportError:
+            raise RuntimeError(
+                "solve_async() requires the asyncio module "
+                "(Python 3.4 or later)")
+        loop = kwds.pop('loop', None)
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        if self._async_solve is not None:
+            raise RuntimeError(
+                "Solver (%s) already has a solve in progress. A separate "
+                "solver instance is required for each concurrent solve."
+                % (self.name,))
+
+        _model, orig_options = self._solve_setup(args, kwds)
+        try:
+            initial_time = time.time()
+            self._presolve(*args, **kwds)
+            presolve_completion_time = time.time()
+            if self._report_timing:
+                print("      %6.2f seconds required for presolve"
+                      % (presolve_completion_time - initial_time))
+            if not _model is None:
+                self._initialize_callbacks(_model)
+            self._prepare_execution()
+            solve_options = self.options
+        finally:
+            self.options = orig_options
+
+        # other solves may use the TempfileManager while this one runs
+        tempfiles = _DetachedTempfiles()
+        future = asyncio.Future(loop=loop)
+        self._async_solve = future
+
+        def _finish(rc, log, err=None):
+            self._async_solve = None
+            tempfiles.attach()
+            try:
+                if err is not None:
+                    raise err
+                self._rc, self._log = rc, log
+                self.options = solve_options
+                result = self._solve_finish(_model,
+                                            Bunch(rc=rc, log=log),
+                                            presolve_completion_time)
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+            finally:
+                self.options = orig_options
+                tempfiles.release(remove=not self._keepfiles)
+
+        if type(self)._execute_command is not \
+           SystemCallSolver._execute_command:
+            # A plugin that customizes command execution (e.g., the
+            # mock solvers used for testing) is run as is.
+            def _execute():
+                try:
+                    rc, log = self._execute_command(self._command)
+                except Exception as e:
+                    _finish(None, None, e)
+                else:
+                    _finish(rc, log)
+            loop.call_soon(_execute)
+        else:
+            self._execute_command_async(self._command, loop, _finish)
+        return future
 
     def _postsolve(self):
 
@@ -318,6 +525,28 @@ class SystemCallSolver(OptSolver):
 
         return [rc,log]
 
+    def _execute_command_async(self, command, loop, callback):
+        """
+        Execute the command as an asyncio subprocess, calling
+        callback(rc, log) once it exits (or callback(None, None,
+        exception) if it could not be executed).
+        """
+        start_time = time.time()
+        timelimit = self._timelimit if self._timelimit is None else \
+                    self._timelimit + max(1, 0.01*self._timelimit)
+
+        def _exited(rc, log, err=None):
+            if err is None:
+                self._last_solve_time = time.time() - start_time
+            callback(rc, log, err)
+
+        _run_command_async(command.cmd, loop, _exited,
+                           script=command.script if 'script' in command
+                           else None,
+                           env=command.env,
+                           timelimit=timelimit,
+                           tee=self._tee)
+
     def process_output(self, rc):
         """
         Process the output files.
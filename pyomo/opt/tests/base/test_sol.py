@@ -49,6 +49,48 @@ class Test(unittest.TestCase):
             soln.write(filename=currdir+"factory.txt", format='json')
             self.assertMatchesJsonBaseline(currdir+"factory.txt", currdir+"test4_sol.jsn")
 
+    def test_values(self):
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            if reader is None:
+                raise IOError("Reader 'sol' is not registered")
+            soln = reader(currdir+"test4_sol.sol").solution(0)
+            self.assertEqual(len(soln.variable), 32)
+            self.assertEqual(len(soln.constraint), 0)
+            soln = reader(currdir+"test4_sol.sol",
+                          suffixes=["dual"]).solution(0)
+            self.assertEqual(len(soln.variable), 32)
+            self.assertEqual(len(soln.constraint), 24)
+            self.assertEqual(sorted(soln.variable['v0']), ['Value'])
+            self.assertEqual(sorted(soln.constraint['c0']), ['Dual'])
+
+    def test_store_solution(self):
+        with pyomo.opt.ReaderFactory("sol") as reader:
+            if reader is None:
+                raise IOError("Reader 'sol' is not registered")
+            result = reader(currdir+"test4_sol.sol", suffixes=["dual"])
+            soln = result.solution(0)
+            self.assertEqual(len(soln.variable), 32)
+            self.assertEqual(len(soln.constraint), 24)
+            reader.store_solution = False
+            result = reader(currdir+"test4_sol.sol", suffixes=["dual"])
+            lean_soln = result.solution(0)
+            self.assertEqual(len(lean_soln._entries('variable')), 0)
+            self.assertEqual(len(lean_soln._entries('constraint')), 0)
+            self.assertEqual(
+                lean_soln.get_indexed_values('variable'),
+                ('v', 'Value',
+                 [soln.variable["v%d" % i]["Value"] for i in range(32)]))
+            self.assertEqual(
+                lean_soln.get_indexed_values('constraint'),
+                ('c', 'Dual',
+                 [soln.constraint["c%d" % i]["Dual"] for i in range(24)]))
+            # the symbol-keyed entries are created on demand
+            self.assertEqual(lean_soln.variable, soln.variable)
+            self.assertEqual(lean_soln.constraint, soln.constraint)
+            self.assertEqual(lean_soln.get_indexed_values('variable'), None)
+            self.assertEqual(result.problem.number_of_variables, 32)
+            self.assertEqual(result.problem.number_of_constraints, 24)
+
     def test_infeasible1(self):
         with pyomo.opt.ReaderFactory("sol") as reader:
             if reader is None:
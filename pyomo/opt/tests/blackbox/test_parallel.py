@@ -12,6 +12,8 @@
 #
 
 import os
+import sys
+import multiprocessing
 from os.path import abspath, dirname
 pyomodir = dirname(dirname(dirname(dirname(abspath(__file__)))))
 pyomodir += os.sep
@@ -25,6 +27,13 @@ import pyomo.opt.blackbox
 
 old_tempdir = pyutilib.services.TempfileManager.tempdir
 
+# The test solver used with the 'pool' manager is registered in this
+# process, so it is only available to forked worker processes
+if sys.version_info[0] >= 3:
+    fork_available = multiprocessing.get_start_method() == 'fork'
+else:
+    fork_available = os.name != 'nt'
+
 
 class TestProblem1(pyomo.opt.blackbox.MixedIntOptProblem):
 
@@ -109,6 +118,39 @@ class SolverManager_DelayedSerial(pyomo.opt.parallel.AsynchronousSolverManager):
             return self._ah_list.pop()
 
 
+class _PoolTestSolver(pyomo.opt.OptSolver):
+    """A solver that sets all variables to a multiple of their upper bound"""
+
+    def __init__(self, **kwds):
+        kwds['type'] = '_pool_test'
+        self.label = kwds.pop('label', None)
+        self._user_executable = kwds.pop('executable', None)
+        pyomo.opt.OptSolver.__init__(self, **kwds)
+
+    def set_executable(self, name=None, validate=True):
+        self._user_executable = name
+
+    def solve(self, model, **kwds):
+        from pyomo.core import Var
+        from pyomo.core.expr.symbol_map import SymbolMap
+        options = kwds.pop('options', {})
+        if options.get('fail', False):
+            raise ValueError("Forced failure")
+        if options.get('exit', False):
+            os._exit(1)
+        results = pyomo.opt.SolverResults()
+        results.solver.status = pyomo.opt.SolverStatus.ok
+        results.solver.message = str(os.getpid())
+        results.solver.name = '%s %s' % (self.label, self._user_executable)
+        soln = results.solution.add()
+        smap = SymbolMap()
+        for i, var in enumerate(model.component_data_objects(Var)):
+            smap.addSymbol(var, 'x%d' % i)
+            soln.variable['x%d' % i] = {'Value': options['scale']*var.ub}
+        results._smap = smap
+        return results
+
+
 class Test(unittest.TestCase):
 
     @classmethod
@@ -179,6 +221,78 @@ class Test(unittest.TestCase):
         if os.path.exists(currdir+"test_solve2.log"):
             os.remove(currdir+"test_solve2.log")
 
+    @unittest.skipIf(not fork_available, "Requires the 'fork' start method")
+    def test_pool(self):
+        """ Test Pool SolverManager """
+        from pyomo.environ import ConcreteModel, Var
+        pyomo.opt.SolverFactory.register('_pool_test')(_PoolTestSolver)
+        try:
+            models = []
+            for i in range(5):
+                model = ConcreteModel()
+                model.x = Var([1,2], bounds=(0,i))
+                models.append(model)
+            with pyomo.opt.SolverManagerFactory("pool", num_workers=2) as mngr:
+                ahs = [mngr.queue(model,
+                                  solver='_pool_test',
+                                  options={'scale': 2})
+                       for model in models]
+                mngr.wait_all(ahs)
+                pids = set()
+                for i, (ah, model) in enumerate(zip(ahs, models)):
+                    results = mngr.get_results(ah)
+                    self.assertEqual(len(results.solution), 0)
+                    self.assertEqual(model.x[1].value, 2*i)
+                    self.assertEqual(model.x[2].value, 2*i)
+                    pids.add(results.solver.message)
+                # the workers are reused
+                self.assertEqual(len(pids), 2)
+
+                opt = pyomo.opt.SolverFactory('_pool_test')
+                opt.options.scale = 3
+                results = mngr.solve(models[1], opt=opt, load_solutions=False)
+                self.assertEqual(len(results.solution), 1)
+                self.assertEqual(results.solution(0).variable['x[1]']['Value'], 3)
+                self.assertEqual(models[1].x[1].value, 2)
+                models[1].solutions.load_from(results)
+                self.assertEqual(models[1].x[1].value, 3)
+
+                ah = mngr.queue(models[0], solver='_pool_test',
+                                options={'fail': True})
+                with self.assertRaisesRegexp(
+                        pyomo.opt.parallel.manager.ActionManagerError,
+                        "Forced failure"):
+                    mngr.wait_for(ah)
+                # the workers remain available after a failure
+                results = mngr.solve(models[4], opt=opt)
+                self.assertEqual(models[4].x[2].value, 12)
+                if mngr.wait_any() != pyomo.opt.parallel.manager.FailedActionHandle:
+                    self.fail("Expected a failed action")
+
+                # the arguments used to create the solver (and its
+                # executable) are passed to the workers
+                opt = pyomo.opt.SolverFactory('_pool_test', label='abc')
+                opt.options.scale = 1
+                opt.set_executable('/no/such/exe', validate=False)
+                results = mngr.solve(models[2], opt=opt)
+                self.assertEqual(results.solver.name, 'abc /no/such/exe')
+
+                # a worker that dies is replaced
+                workers = list(mngr._workers)
+                ah = mngr.queue(models[0], solver='_pool_test',
+                                options={'exit': True})
+                with self.assertRaisesRegexp(
+                        pyomo.opt.parallel.manager.ActionManagerError,
+                        "terminated unexpectedly"):
+                    mngr.wait_for(ah)
+                self.assertEqual(len(mngr._workers), 2)
+                self.assertEqual(
+                    len([w for w in mngr._workers if w in workers]), 1)
+                results = mngr.solve(models[3], opt=opt)
+                self.assertEqual(models[3].x[2].value, 3)
+        finally:
+            pyomo.opt.SolverFactory.unregister('_pool_test')
+
     def test_solver_manager_factory(self):
         """
         Testing the pyomo.opt solver factory
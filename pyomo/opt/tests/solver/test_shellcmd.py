@@ -12,13 +12,23 @@
 #
 
 import os
+import sys
 
 import pyutilib.th as unittest
 from pyutilib.common import ApplicationError
+from pyutilib.misc import Bunch
+from pyutilib.services import TempfileManager
+
+try:
+    import asyncio
+    asyncio_available = True
+except ImportError:
+    asyncio_available = False
 
 from pyomo.opt.base import UnknownSolver
 from pyomo.opt.base.solvers import SolverFactory
 from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.results import SolverResults
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
 exedirname = "exe_dir"
@@ -284,5 +294,96 @@ class TestSystemCallSolver(unittest.TestCase):
                 self.assertEqual(opt._user_executable, isexe_abspath)
                 self.assertEqual(opt.executable(), isexe_abspath)
 
+    def test_lean_results(self):
+        opt = _EchoSolver()
+        self.assertFalse(opt._lean_results)
+        opt.options.message = 'lean'
+        results = opt.solve(lean_results=True)
+        self.assertTrue(opt._lean_results)
+        self.assertEqual(results.solver.message, 'lean')
+        opt.solve()
+        self.assertFalse(opt._lean_results)
+
+
+class _EchoSolver(SystemCallSolver):
+    """A solver whose executable prints its (script) input"""
+
+    def __init__(self, **kwds):
+        kwds['type'] = '_echo'
+        SystemCallSolver.__init__(self, **kwds)
+        self._problem_files = [os.path.abspath(__file__)]
+
+    def executable(self):
+        return sys.executable
+
+    def create_command_line(self, executable, problem_files):
+        return Bunch(cmd=[executable, '-c',
+                          'import sys; print(sys.stdin.read())'],
+                     script=self.options.message,
+                     log_file=None,
+                     env=None)
+
+    def process_soln_file(self, results):
+        results.solver.message = self._log.strip()
+        return results
+
+
+@unittest.skipIf(not asyncio_available, "asyncio is not available")
+class TestSystemCallSolverAsync(unittest.TestCase):
+
+    def setUp(self):
+        # the subprocess child watcher is attached to the
+        # current event loop
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def test_solve_async(self):
+        loop = self.loop
+        solvers = [_EchoSolver() for i in range(3)]
+        futures = [opt.solve_async(options={'message': 'solve %d' % i})
+                   for i, opt in enumerate(solvers)]
+        # one solve at a time per solver instance
+        with self.assertRaises(RuntimeError):
+            solvers[0].solve_async()
+        results = loop.run_until_complete(asyncio.gather(*futures))
+        self.assertEqual([res.solver.message for res in results],
+                         ['solve 0', 'solve 1', 'solve 2'])
+        for opt in solvers:
+            self.assertEqual(opt._rc, 0)
+            self.assertIs(opt._async_solve, None)
+            # the ephemeral options are reset
+            self.assertNotIn('message', opt.options)
+        # the same results are obtained with solve()
+        opt = _EchoSolver()
+        opt.options.message = 'solve 0'
+        self.assertEqual(opt.solve().solver.message, 'solve 0')
+
+    def test_solve_async_nonzero_rc(self):
+        opt = _EchoSolver()
+        opt.create_command_line = lambda exe, files: Bunch(
+            cmd=[exe, '-c', 'import sys; sys.exit(3)'],
+            script=None, log_file=None, env=None)
+        tempfiles = list(TempfileManager._tempfiles)
+        future = opt.solve_async(loop=self.loop)
+        with self.assertRaisesRegexp(ApplicationError,
+                                     "did not exit normally"):
+            self.loop.run_until_complete(future)
+        self.assertEqual(opt._rc, 3)
+        self.assertIs(opt._async_solve, None)
+        # the context of the failed solve was popped
+        self.assertEqual(TempfileManager._tempfiles, tempfiles)
+
+    def test_solve_async_error(self):
+        opt = _EchoSolver()
+        opt.executable = lambda: os.path.join(thisdir, 'no_such_solver')
+        future = opt.solve_async(loop=self.loop)
+        with self.assertRaises(ApplicationError):
+            self.loop.run_until_complete(future)
+        self.assertIs(opt._async_solve, None)
+
 if __name__ == "__main__":
     unittest.main()
@@ -335,7 +335,8 @@ def _convert_external_setup_without_cleanup(
         basename,
         file_format,
         enforce_derived_nonanticipativity,
-        io_options):
+        io_options,
+        return_sto_entries=False):
     import pyomo.environ
     assert os.path.exists(output_directory)
     assert file_format in ('lp', 'mps')
@@ -743,6 +744,12 @@ def _convert_external_setup_without_cleanup(
     #
     modified_constraint_lb = ComponentMap()
     modified_constraint_ub = ComponentMap()
+    # the location of each entry in the .sto file, in the form
+    # (column label, row label, locator), where the locator
+    # identifies the model data for the entry by name so that its
+    # value can be computed on other scenarios (see
+    # _convert_external_sto_values)
+    sto_entries = []
     stochastic_rhs_count = 0
     stochastic_matrix_count = 0
     stochastic_cost_count = 0
@@ -791,6 +798,7 @@ def _convert_external_setup_without_cleanup(
                         body_constant = 0.0
                     symbols = constraint_symbols[con]
                     assert len(symbols) > 0
+                    con_name = con.getname(True, constraint_name_buffer)
                     for con_label in symbols:
                         if con_label.startswith('c_e_') or \
                            con_label.startswith('c_l_'):
@@ -803,6 +811,9 @@ def _convert_external_setup_without_cleanup(
                                              value(con.lower) - \
                                              value(body_constant))))
                             f_coords.write("RHS %s\n" % (con_label))
+                            sto_entries.append(
+                                ("RHS", con_label,
+                                 ("rhs", con_name, "lower")))
                             # We are going to rewrite the core problem file
                             # with all stochastic values set to zero. This will
                             # allow an easy test for missing user annotations.
@@ -821,6 +832,9 @@ def _convert_external_setup_without_cleanup(
                                                  value(con.lower) - \
                                                  value(body_constant))))
                                 f_coords.write("RHS %s\n" % (con_label))
+                                sto_entries.append(
+                                    ("RHS", con_label,
+                                     ("rhs", con_name, "lower")))
                                 # We are going to rewrite the core problem file
                                 # with all stochastic values set to zero. This will
                                 # allow an easy test for missing user annotations.
@@ -836,6 +850,9 @@ def _convert_external_setup_without_cleanup(
                                              value(con.upper) - \
                                              value(body_constant))))
                             f_coords.write("RHS %s\n" % (con_label))
+                            sto_entries.append(
+                                ("RHS", con_label,
+                                 ("rhs", con_name, "upper")))
                             # We are going to rewrite the core problem file
                             # with all stochastic values set to zero. This will
                             # allow an easy test for missing user annotations.
@@ -851,6 +868,9 @@ def _convert_external_setup_without_cleanup(
                                                  value(con.upper) - \
                                                  value(body_constant))))
                                 f_coords.write("RHS %s\n" % (con_label))
+                                sto_entries.append(
+                                    ("RHS", con_label,
+                                     ("rhs", con_name, "upper")))
                                 # We are going to rewrite the core problem file
                                 # with all stochastic values set to zero. This will
                                 # allow an easy test for missing user annotations.
@@ -892,6 +912,7 @@ def _convert_external_setup_without_cleanup(
                         var_list = constraint_repn.linear_vars
                     assert len(var_list) > 0
                     symbols = constraint_symbols[con]
+                    con_name = con.getname(True, constraint_name_buffer)
                     # sort the variable list by the column ordering
                     # so that we have deterministic output
                     var_list = list(var_list)
@@ -928,6 +949,10 @@ def _convert_external_setup_without_cleanup(
                                            con_label,
                                            _no_negative_zero(value(var_coef))))
                             f_coords.write("%s %s\n" % (var_label, con_label))
+                            sto_entries.append(
+                                (var_label, con_label,
+                                 ("matrix", con_name,
+                                  var.getname(True, variable_name_buffer))))
 
                     constraint_repn.linear_coefs = tuple(new_coefs)
 
@@ -999,6 +1024,10 @@ def _convert_external_setup_without_cleanup(
                     f_coords.write("%s %s\n"
                                    % (var_label,
                                       stochastic_objective_label))
+                    sto_entries.append(
+                        (var_label, stochastic_objective_label,
+                         ("objective",
+                          var.getname(True, variable_name_buffer))))
 
                 objective_repn.linear_coefs = tuple(new_coefs)
                 if include_constant:
@@ -1016,6 +1045,9 @@ def _convert_external_setup_without_cleanup(
                     f_coords.write("%s %s\n"
                                    % ("ONE_VAR_CONSTANT",
                                       stochastic_objective_label))
+                    sto_entries.append(
+                        ("ONE_VAR_CONSTANT", stochastic_objective_label,
+                         ("objective_constant",)))
 
     #
     # Write the deterministic part of the LP/MPS-file to its own
@@ -1040,13 +1072,99 @@ def _convert_external_setup_without_cleanup(
     for con, upper in iteritems(modified_constraint_ub):
         con._upper = as_numeric(upper)
 
-    return (firststage_variable_count,
-            secondstage_variable_count,
-            firststage_constraint_count,
-            secondstage_constraint_count,
-            stochastic_cost_count,
-            stochastic_rhs_count,
-            stochastic_matrix_count)
+    counts = (firststage_variable_count,
+              secondstage_variable_count,
+              firststage_constraint_count,
+              secondstage_constraint_count,
+              stochastic_cost_count,
+              stochastic_rhs_count,
+              stochastic_matrix_count)
+    if return_sto_entries:
+        return counts, sto_entries
+    return counts
+
+def _convert_external_sto_values(worker, scenario, sto_entries):
+    """Computes the values of the .sto file entries located by
+    _convert_external_setup on the reference scenario for the
+    given scenario. Only the constraints and objective holding
+    stochastic data are compiled."""
+    import pyomo.environ
+    instance = scenario._instance
+    objective_object = scenario._instance_objective
+    assert objective_object is not None
+    repn_cache = {}
+
+    def _get_repn(con_name):
+        if con_name not in repn_cache:
+            if con_name is None:
+                obj, name = objective_object, objective_object.name
+            else:
+                obj, name = instance.find_component(con_name), con_name
+            if (obj is None) or \
+               (con_name is not None and \
+                not isinstance(obj, _ConstraintData)):
+                raise ValueError(
+                    "The stochastic constraint %s found on the "
+                    "reference scenario does not exist on scenario %s. "
+                    "The SMPS format requires the same constraints on "
+                    "all scenarios." % (con_name, scenario.name))
+            # compiled as in build_repns so that 0*var terms
+            # are kept
+            if con_name is None:
+                repn = generate_standard_repn(obj.expr,
+                                              compute_values=False)
+            elif obj._linear_canonical_form:
+                repn = obj.canonical_form(compute_values=False)
+            else:
+                repn = generate_standard_repn(obj.body,
+                                              compute_values=False)
+            if not repn.is_linear():
+                raise RuntimeError("Only linear constraints and objectives "
+                                   "are accepted for conversion to SMPS "
+                                   "format. %s is not linear on scenario %s."
+                                   % (name, scenario.name))
+            coefs = dict((id(var), coef) for var, coef
+                         in zip(repn.linear_vars, repn.linear_coefs))
+            repn_cache[con_name] = (obj, repn, coefs)
+        return repn_cache[con_name]
+
+    def _get_coef(con_name, var_name):
+        obj, repn, coefs = _get_repn(con_name)
+        var = instance.find_component(var_name)
+        if (var is None) or (id(var) not in coefs):
+            raise ValueError(
+                "The variable %s does not appear in %s on scenario %s, "
+                "but it has a stochastic coefficient there on the "
+                "reference scenario. This suggests that the set of "
+                "variables appearing in some expression declared as "
+                "stochastic is changing across scenarios."
+                % (var_name, obj.name, scenario.name))
+        return coefs[id(var)]
+
+    values = []
+    for _, _, locator in sto_entries:
+        if locator[0] == "rhs":
+            _, con_name, bound = locator
+            con, repn, _ = _get_repn(con_name)
+            if bound == "lower":
+                val = value(con.lower)
+            else:
+                assert bound == "upper"
+                val = value(con.upper)
+            if repn.constant is not None:
+                val -= value(repn.constant)
+        elif locator[0] == "matrix":
+            val = _get_coef(locator[1], locator[2])
+        elif locator[0] == "objective":
+            val = _get_coef(None, locator[1])
+        else:
+            assert locator[0] == "objective_constant"
+            _, repn, _ = _get_repn(None)
+            val = repn.constant
+            if val is None:
+                val = 0.0
+        values.append(_no_negative_zero(value(val)))
+    return values
 
 def convert_external(output_directory,
                      basename,
@@ -1057,7 +1175,8 @@ def convert_external(output_directory,
                      disable_consistency_checks=False,
                      keep_scenario_files=False,
                      keep_auxiliary_files=False,
-                     verbose=False):
+                     verbose=False,
+                     reference_core_only=False):
     import pyomo.environ
     import pyomo.solvers.plugins.smanager.phpyro
 
@@ -1083,26 +1202,52 @@ def convert_external(output_directory,
     if not os.path.exists(scenario_directory):
         os.mkdir(scenario_directory)
 
-    counts = scenario_tree_manager.invoke_function(
-        "_convert_external_setup",
-        thisfile,
-        invocation_type=InvocationType.PerScenario,
-        function_args=(scenario_directory,
-                       basename,
-                       core_format,
-                       enforce_derived_nonanticipativity,
-                       io_options))
-
     reference_scenario = scenario_tree.scenarios[0]
     reference_scenario_name = reference_scenario.name
 
+    if reference_core_only:
+        #
+        # Only the reference scenario is written to file. The .sto
+        # entries for every scenario are computed directly from
+        # the stochastic constraints and objective, using the
+        # entry locations found on the reference scenario.
+        #
+        counts, sto_entries = scenario_tree_manager.invoke_function(
+            "_convert_external_setup",
+            thisfile,
+            invocation_type=InvocationType.OnScenario(
+                reference_scenario_name),
+            function_args=(scenario_directory,
+                           basename,
+                           core_format,
+                           enforce_derived_nonanticipativity,
+                           io_options),
+            function_kwds={'return_sto_entries': True})
+        sto_values = scenario_tree_manager.invoke_function(
+            "_convert_external_sto_values",
+            thisfile,
+            invocation_type=InvocationType.PerScenario,
+            function_args=(sto_entries,))
+        output_scenarios = [reference_scenario]
+    else:
+        counts = scenario_tree_manager.invoke_function(
+            "_convert_external_setup",
+            thisfile,
+            invocation_type=InvocationType.PerScenario,
+            function_args=(scenario_directory,
+                           basename,
+                           core_format,
+                           enforce_derived_nonanticipativity,
+                           io_options))[reference_scenario_name]
+        output_scenarios = scenario_tree.scenarios
+
     (firststage_variable_count,
      secondstage_variable_count,
      firststage_constraint_count,
      secondstage_constraint_count,
      stochastic_cost_count,
      stochastic_rhs_count,
-     stochastic_matrix_count) = counts[reference_scenario_name]
+     stochastic_matrix_count) = counts
 
     #
     # Copy the reference scenario's core, row, col, and tim
@@ -1183,6 +1328,14 @@ def convert_external(output_directory,
         fdst.write('STOCH '+basename+'\n')
         fdst.write('BLOCKS DISCRETE REPLACE\n')
         for scenario in scenario_tree.scenarios:
+            if reference_core_only:
+                fdst.write(" BL BLOCK1 PERIOD2 %.17g\n"
+                           % (_no_negative_zero(scenario.probability)))
+                fdst.writelines(
+                    "    %s    %s    %.17g\n" % (col_label, row_label, val)
+                    for (col_label, row_label, _), val
+                    in zip(sto_entries, sto_values[scenario.name]))
+                continue
             scenario_sto_filename = \
                 os.path.join(scenario_directory,
                              basename+".sto."+scenario.name)
@@ -1214,7 +1367,16 @@ def convert_external(output_directory,
         print("   - Stoch. Cost Entries: %d"
               % (stochastic_cost_count))
 
-    if not disable_consistency_checks:
+    if reference_core_only:
+        # Only the reference scenario was written to file, so there
+        # is nothing to compare. The locations of the stochastic
+        # entries were checked on every scenario while computing
+        # their values.
+        if verbose and (not disable_consistency_checks):
+            print("\nSkipping the comparison of per-scenario files "
+                  "(only the reference scenario is written when the "
+                  "reference_core_only option is used)")
+    elif not disable_consistency_checks:
         if verbose:
             print("\nStarting scenario structure consistency checks "
                   "across scenario files stored in %s."
@@ -1365,7 +1527,7 @@ def convert_external(output_directory,
     if not keep_scenario_files:
         if verbose:
             print("Cleaning temporary per-scenario files")
-        for scenario in scenario_tree.scenarios:
+        for scenario in output_scenarios:
 
             scenario_core_row_filename = \
                 os.path.join(scenario_directory,
@@ -2153,6 +2315,22 @@ def convertsmps_register_options(options=None):
             ),
             doc=None,
             visibility=0))
+    safe_register_unique_option(
+        options,
+        "reference_core_only",
+        PySPConfigValue(
+            False,
+            domain=bool,
+            description=(
+                "Writes the core problem file for the reference scenario "
+                "only, and computes the .sto entries for every scenario "
+                "directly from the constraints and objective declared as "
+                "stochastic. This is much faster for problems with many "
+                "scenarios, but the deterministic parts of each scenario "
+                "are not compared against the core problem file."
+            ),
+            doc=None,
+            visibility=0))
     safe_register_unique_option(
         options,
         "keep_scenario_files",
@@ -2231,7 +2409,8 @@ def run_convertsmps(options):
             options.disable_consistency_checks,
             keep_scenario_files=options.keep_scenario_files,
             keep_auxiliary_files=options.keep_auxiliary_files,
-            verbose=options.verbose)
+            verbose=options.verbose,
+            reference_core_only=options.reference_core_only)
 
     end_time = time.time()
 
@@ -8,7 +8,15 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+try:
+    from collections import OrderedDict
+except ImportError:                         #pragma:nocover
+    from ordereddict import OrderedDict
+
 from pyomo.core.base import *
+from pyomo.core.base.label import cpxlp_label_from_name
+from pyomo.core.expr.symbol_map import SymbolMap
+from pyomo.repn import generate_standard_repn
 from pyomo.opt import (ProblemFormat,
                        SolverFactory,
                        SolverManagerFactory,
@@ -348,6 +356,230 @@ def write_ef(binding_instance,
 
     return smap_id
 
+#
+# write the EF for a scenario tree directly to an LP file, without
+# constructing the EF binding instance. the constraints of each
+# scenario instance are written as they are generated, so only the
+# column bounds (and not the expression representations of the whole
+# EF) are held in memory at once.
+#
+
+def write_ef_direct(scenario_tree,
+                    output_filename,
+                    symbolic_solver_labels=False):
+    """Write the extensive form of a scenario tree linked with
+    scenario instances to an LP file. The variables of each non-leaf
+    tree node are written as a single column shared by all scenarios
+    through the node, so no nonanticipativity constraints are
+    written. Only linear objectives and constraints are supported.
+
+    Returns a SymbolMap from the column labels to variables (the
+    variable of the first scenario through a node for the shared
+    columns)."""
+
+    for scenario in scenario_tree.scenarios:
+        if scenario._instance is None:
+            raise ValueError(
+                "Cannot write extensive form. The scenario tree "
+                "does not appear to be linked to any Pyomo models. "
+                "Missing model for scenario with name: %s"
+                % (scenario.name))
+
+    if not output_filename.endswith(".lp"):
+        raise ValueError("The direct extensive form writer only supports "
+                         "the LP file format. Invalid output filename: %s"
+                         % (output_filename))
+
+    # component names are slow to generate, so the name for a
+    # symbolic label is passed as a function that is only called
+    # when symbolic labels are used
+    _counters = {"x": 0, "c": 0}
+    def _label(prefix, name):
+        if symbolic_solver_labels:
+            return cpxlp_label_from_name(name())
+        _counters[prefix] += 1
+        return "%s%d" % (prefix, _counters[prefix])
+
+    symbol_map = SymbolMap()
+    # maps id(vardata) -> column label
+    columns = {}
+    # maps column label -> vardata used for its bounds and domain,
+    # for the columns referenced so far
+    column_vardatas = OrderedDict()
+
+    # shared columns for the non-anticipative variables
+    shared_vardatas = {}
+    for stage in scenario_tree.stages[:-1]:
+        for tree_node in stage.nodes:
+            for variable_id in sorted(tree_node._standard_variable_ids):
+                vardatas = tree_node._variable_datas[variable_id]
+                label = _label("x", lambda: "MASTER_BLEND_VAR_%s[%s]"
+                               % (tree_node.name, variable_id))
+                for vardata, probability in vardatas:
+                    columns[id(vardata)] = label
+                shared_vardatas[label] = vardatas[0][0]
+
+    def _column(scenario, vardata):
+        label = columns.get(id(vardata))
+        if label is None:
+            label = columns[id(vardata)] = \
+                _label("x", lambda: scenario.name+"."+vardata.name)
+        if label not in column_vardatas:
+            vardata = shared_vardatas.get(label, vardata)
+            column_vardatas[label] = vardata
+            symbol_map.addSymbol(vardata, label)
+        return label
+
+    with open(output_filename, "w") as output_file:
+
+        #
+        # The objective is the expected cost. It is aggregated over
+        # all scenarios before anything is written.
+        #
+        objective_coefficients = OrderedDict()
+        objective_constant = 0.0
+        for scenario in scenario_tree.scenarios:
+            repn = generate_standard_repn(
+                scenario._instance_cost_expression.expr)
+            if not repn.is_linear():
+                raise ValueError(
+                    "The direct extensive form writer only supports "
+                    "linear objectives. The cost expression for "
+                    "scenario %s is nonlinear." % (scenario.name))
+            objective_constant += scenario.probability * repn.constant
+            for vardata, coef in zip(repn.linear_vars, repn.linear_coefs):
+                label = _column(scenario, vardata)
+                objective_coefficients[label] = \
+                    objective_coefficients.get(label, 0.0) + \
+                    scenario.probability * coef
+
+        if scenario_tree.scenarios[0]._instance_objective.is_minimizing():
+            output_file.write("\\* Extensive form *\\\n\nmin \nMASTER:\n")
+        else:
+            output_file.write("\\* Extensive form *\\\n\nmax \nMASTER:\n")
+        for label, coef in objective_coefficients.items():
+            output_file.write("%+.17g %s\n" % (coef, label))
+        if (objective_constant != 0) or \
+           (len(objective_coefficients) == 0):
+            output_file.write("%+.17g ONE_VAR_CONSTANT\n"
+                              % (objective_constant))
+        del objective_coefficients
+        output_file.write("\ns.t.\n\n")
+
+        #
+        # The constraints are written scenario by scenario
+        #
+        output = []
+        for scenario in scenario_tree.scenarios:
+            instance = scenario._instance
+            for sos_data in instance.component_data_objects(
+                    SOSConstraint,
+                    active=True,
+                    descend_into=True):
+                raise ValueError(
+                    "The direct extensive form writer does not support "
+                    "SOS constraints. Constraint %s on scenario %s is an "
+                    "SOS constraint." % (sos_data.name, scenario.name))
+            for constraint_data in instance.component_data_objects(
+                    Constraint,
+                    active=True,
+                    descend_into=True):
+
+                if (not constraint_data.has_lb()) and \
+                   (not constraint_data.has_ub()):
+                    continue # non-binding, so skip
+
+                repn = generate_standard_repn(constraint_data.body)
+                if not repn.is_linear():
+                    raise ValueError(
+                        "The direct extensive form writer only supports "
+                        "linear constraints. Constraint %s on scenario "
+                        "%s is nonlinear."
+                        % (constraint_data.name, scenario.name))
+                lower = None
+                if constraint_data.has_lb():
+                    lower = value(constraint_data.lower) - repn.constant
+                upper = None
+                if constraint_data.has_ub():
+                    upper = value(constraint_data.upper) - repn.constant
+
+                if len(repn.linear_vars) == 0:
+                    # trivial after fixing variables
+                    if ((lower is not None) and (lower > 1e-9)) or \
+                       ((upper is not None) and (upper < -1e-9)):
+                        raise ValueError(
+                            "Constraint %s on scenario %s is infeasible "
+                            "for the current fixed variable values"
+                            % (constraint_data.name, scenario.name))
+                    continue
+
+                body = "".join("%+.17g %s\n" % (coef, _column(scenario, vardata))
+                               for vardata, coef in zip(repn.linear_vars,
+                                                        repn.linear_coefs))
+                con_label = _label(
+                    "c", lambda: scenario.name+"."+constraint_data.name)
+                if constraint_data.equality:
+                    output.append("c_e_%s_:\n%s= %.17g\n\n"
+                                  % (con_label, body, lower))
+                elif (lower is not None) and (upper is not None):
+                    output.append("r_l_%s_:\n%s>= %.17g\n\n"
+                                  % (con_label, body, lower))
+                    output.append("r_u_%s_:\n%s<= %.17g\n\n"
+                                  % (con_label, body, upper))
+                elif lower is not None:
+                    output.append("c_l_%s_:\n%s>= %.17g\n\n"
+                                  % (con_label, body, lower))
+                else:
+                    output.append("c_u_%s_:\n%s<= %.17g\n\n"
+                                  % (con_label, body, upper))
+
+                if len(output) > 1024:
+                    output_file.write("".join(output))
+                    output = []
+
+        output.append("c_e_ONE_VAR_CONSTANT: \nONE_VAR_CONSTANT = 1.0\n\n")
+        output_file.write("".join(output))
+        output = []
+
+        #
+        # Bounds and domains
+        #
+        output_file.write("bounds\n")
+        integer_columns = []
+        binary_columns = []
+        for label, vardata in column_vardatas.items():
+            if vardata.is_binary():
+                binary_columns.append(label)
+            elif vardata.is_integer():
+                integer_columns.append(label)
+            elif not vardata.is_continuous():
+                raise TypeError("Invalid domain type for variable with "
+                                "name '%s'. Variable is not continuous, "
+                                "integer, or binary." % (vardata.name))
+            output.append("   ")
+            if vardata.has_lb():
+                output.append("%.17g <= " % (value(vardata.lb)))
+            else:
+                output.append(" -inf <= ")
+            output.append(label)
+            if vardata.has_ub():
+                output.append(" <= %.17g\n" % (value(vardata.ub)))
+            else:
+                output.append(" <= +inf\n")
+            if len(output) > 1024:
+                output_file.write("".join(output))
+                output = []
+        if len(integer_columns):
+            output.append("general\n")
+            output.extend("  %s\n" % (label) for label in integer_columns)
+        if len(binary_columns):
+            output.append("binary\n")
+            output.extend("  %s\n" % (label) for label in binary_columns)
+        output.append("end\n")
+        output_file.write("".join(output))
+
+    return symbol_map
+
 #
 # solve the EF binding instance and load the solution
 #
@@ -57,7 +57,9 @@ from pyomo.pysp.solutionioextensions import \
     (IPySPSolutionSaverExtension,
      IPySPSolutionLoaderExtension)
 from pyomo.pysp.solutionwriter import ISolutionWriterExtension
-from pyomo.pysp.ef import write_ef, create_ef_instance
+from pyomo.pysp.ef import (write_ef,
+                           write_ef_direct,
+                           create_ef_instance)
 
 logger = logging.getLogger('pyomo.pysp')
 
@@ -155,6 +157,26 @@ class ExtensiveFormAlgorithm(PySPConfiguredObject):
                 doc=None,
                 visibility=0),
             ap_group=_ef_group_label)
+        safe_declare_unique_option(
+            options,
+            "direct_write",
+            PySPConfigValue(
+                False,
+                domain=bool,
+                description=(
+                    "Write the extensive form LP file directly from "
+                    "the scenario instances, without constructing "
+                    "the extensive form instance. The variables of "
+                    "each non-leaf tree node are written as a single "
+                    "column shared by all scenarios, so no "
+                    "nonanticipativity constraints are written. Only "
+                    "linear problems are supported, and this option "
+                    "can not be combined with the CVaR or chance "
+                    "constraint options. Default is False."
+                ),
+                doc=None,
+                visibility=0),
+            ap_group=_ef_group_label)
         safe_declare_common_option(options,
                                    "solver")
         safe_declare_common_option(options,
@@ -333,6 +355,9 @@ class ExtensiveFormAlgorithm(PySPConfiguredObject):
 
     def write(self, filename):
 
+        if self.get_option("direct_write"):
+            return self._write_direct(filename)
+
         if self.instance is None:
             raise RuntimeError(
                 "The extensive form instance has not been constructed."
@@ -367,6 +392,38 @@ class ExtensiveFormAlgorithm(PySPConfiguredObject):
 
         return filename, smap_id
 
+    def _write_direct(self, filename):
+
+        if self.get_option("generate_weighted_cvar") or \
+           (self.get_option("cc_indicator_var") is not None):
+            raise ValueError("The direct_write option can not be used "
+                             "with the CVaR or chance constraint options")
+
+        suf = os.path.splitext(filename)[1]
+        if suf in ['.nl','.mps']:
+            raise ValueError("The direct_write option only supports "
+                             "the LP file format. Invalid filename: %s"
+                             % (filename))
+        elif suf != '.lp':
+            filename += '.lp'
+
+        start_time = time.time()
+        if self.get_option("verbose"):
+            print("Starting to write extensive form")
+
+        symbol_map = write_ef_direct(
+            self._manager.scenario_tree,
+            filename,
+            symbolic_solver_labels=\
+                self.get_option("symbolic_solver_labels"))
+
+        print("Extensive form written to file="+filename)
+        if self.get_option("verbose") or self.get_option("output_times"):
+            print("Time to write output file=%.2f seconds"
+                  % (time.time() - start_time))
+
+        return filename, symbol_map
+
     def solve(self,
               check_status=True,
               exception_on_failure=True,
@@ -713,7 +770,12 @@ def runef(options,
               "stochastic programming problems.")
         with ExtensiveFormAlgorithm(manager, options) as ef:
 
-            ef.build_ef()
+            if options.direct_write:
+                if options.solve:
+                    raise ValueError("The direct_write option can not be "
+                                     "used with the solve option")
+            else:
+                ef.build_ef()
             # This is somewhat of a hack to get around the
             # weird semantics of this script (assumed by tests)
             if (not options.solve) or \
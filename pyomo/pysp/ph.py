@@ -24,6 +24,12 @@ try:
 except ImportError:
     guppy_available = False
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:                               #pragma:nocover
+    numpy_available = False
+
 import pyutilib.common
 
 from pyomo.core import *
@@ -255,6 +261,14 @@ def assign_aggregate_data(ph,
                           aggregate_data):
     ph._aggregate_user_data = aggregate_data
 
+def _values_getter(keys):
+    """Return a function mapping a dict to the tuple of its values
+    for keys (in order)"""
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda d: (d[key],)
+    return itemgetter(*keys)
+
 class _PHBase(object):
 
     def __init__(self):
@@ -1247,6 +1261,7 @@ class ProgressiveHedging(_PHBase):
                 phsolverserverutils.activate_ph_objective_proximal_terms(self)
 
         end_time = time.time()
+        self._record_time("objective_update", end_time - start_time)
 
         if self._output_times:
             print("Activate PH objective proximal terms time=%.2f seconds"
@@ -1265,6 +1280,7 @@ class ProgressiveHedging(_PHBase):
             phsolverserverutils.deactivate_ph_objective_proximal_terms(self)
 
         end_time = time.time()
+        self._record_time("objective_update", end_time - start_time)
 
         if self._output_times:
             print("Deactivate PH objective proximal terms time=%.2f seconds"
@@ -1283,6 +1299,7 @@ class ProgressiveHedging(_PHBase):
             phsolverserverutils.activate_ph_objective_weight_terms(self)
 
         end_time = time.time()
+        self._record_time("objective_update", end_time - start_time)
 
         if self._output_times:
             print("Activate PH objective weight terms time=%.2f seconds"
@@ -1301,6 +1318,7 @@ class ProgressiveHedging(_PHBase):
             phsolverserverutils.deactivate_ph_objective_weight_terms(self)
 
         end_time = time.time()
+        self._record_time("objective_update", end_time - start_time)
 
         if self._output_times:
             print("Deactivate PH objective weight terms time=%.2f "
@@ -1911,6 +1929,9 @@ class ProgressiveHedging(_PHBase):
         self._cumulative_xbar_time = 0.0
         # seconds, over course of update_weights()
         self._cumulative_weight_time = 0.0
+        # timing and counter records for each PH iteration (see
+        # _record_time), over course of solve()
+        self._timing_history = {}
 
         # do I disable warm-start for scenario sub-problem solves
         # during PH iterations >= 1?
@@ -2738,7 +2759,9 @@ class ProgressiveHedging(_PHBase):
         if not isinstance(self._solver_manager,
                           pyomo.solvers.plugins.smanager.\
                           phpyro.SolverManager_PHPyro):
+            start_time = time.time()
             self._preprocess_scenario_instances(subproblems=subproblems)
+            self._record_time("preprocess", time.time() - start_time)
 
         # STEP -1: clear the auxilliary dictionaries (gaps, solve_times,
         #          pyomo_solve_times, solution_status)
@@ -2824,6 +2847,8 @@ class ProgressiveHedging(_PHBase):
                     print("Queuing solve for scenario bundle=%s"
                           % (scenario_bundle._name))
 
+                queue_start_time = time.time()
+
                 # and queue it up for solution - have to worry about
                 # warm-starting here.
                 new_action_handle = None
@@ -2856,6 +2881,9 @@ class ProgressiveHedging(_PHBase):
                 bundle_action_handle_map[scenario_bundle._name] = new_action_handle
                 action_handle_bundle_map[new_action_handle] = scenario_bundle._name
                 self._queued_solve_action_handles.add(new_action_handle)
+                self._record_time("queue",
+                                  time.time() - queue_start_time,
+                                  subproblem=scenario_bundle._name)
 
         else:
 
@@ -2866,6 +2894,8 @@ class ProgressiveHedging(_PHBase):
                 if self._verbose:
                     print("Queuing solve for scenario=%s" % (scenario._name))
 
+                queue_start_time = time.time()
+
                 # once past iteration 0, there is always a feasible
                 # solution from which to warm-start.  however, you
                 # might want to disable warm-start when the solver is
@@ -2911,6 +2941,9 @@ class ProgressiveHedging(_PHBase):
                 scenario_action_handle_map[scenario._name] = new_action_handle
                 action_handle_scenario_map[new_action_handle] = scenario._name
                 self._queued_solve_action_handles.add(new_action_handle)
+                self._record_time("queue",
+                                  time.time() - queue_start_time,
+                                  subproblem=scenario._name)
 
         if isinstance(self._solver_manager,
                       pyomo.solvers.plugins.smanager.\
@@ -2938,6 +2971,11 @@ class ProgressiveHedging(_PHBase):
 
         result_load_times = []
 
+        # the time at which each result is received (relative to
+        # wait_start_time) is recorded as the subproblem wait time,
+        # which identifies stragglers
+        wait_start_time = time.time()
+
         # loop for the solver results, reading them and
         # loading them into instances as they are available.
         if self._scenario_tree.contains_bundles():
@@ -2976,6 +3014,10 @@ class ProgressiveHedging(_PHBase):
                                               str(known_action_handles)))
 
                 subproblems.append(bundle_name)
+                self._record_time("wait",
+                                  time.time() - wait_start_time,
+                                  subproblem=bundle_name)
+                self._record_count("subproblem_results")
 
                 num_results_so_far += 1
 
@@ -3010,6 +3052,9 @@ class ProgressiveHedging(_PHBase):
                             auxilliary_values["pyomo_solve_time"]
 
                     end_time = time.time()
+                    self._record_time("load",
+                                      end_time - start_time,
+                                      subproblem=bundle_name)
                     if self._output_times:
                         result_load_times.append(end_time-start_time)
 
@@ -3073,6 +3118,9 @@ class ProgressiveHedging(_PHBase):
                         scenario.update_solution_from_instance()
 
                     end_time = time.time()
+                    self._record_time("load",
+                                      end_time - start_time,
+                                      subproblem=bundle_name)
                     if self._output_times:
                         result_load_times.append(end_time-start_time)
 
@@ -3116,6 +3164,10 @@ class ProgressiveHedging(_PHBase):
                 scenario = self._scenario_tree._scenario_map[scenario_name]
 
                 subproblems.append(scenario_name)
+                self._record_time("wait",
+                                  time.time() - wait_start_time,
+                                  subproblem=scenario_name)
+                self._record_count("subproblem_results")
 
                 num_results_so_far += 1
 
@@ -3158,6 +3210,9 @@ class ProgressiveHedging(_PHBase):
 
                     end_time = time.time()
 
+                    self._record_time("load",
+                                      end_time - start_time,
+                                      subproblem=scenario_name)
                     if self._output_times:
                         result_load_times.append(end_time-start_time)
 
@@ -3221,6 +3276,9 @@ class ProgressiveHedging(_PHBase):
 
                     end_time = time.time()
 
+                    self._record_time("load",
+                                      end_time - start_time,
+                                      subproblem=scenario_name)
                     if self._output_times:
                         result_load_times.append(end_time-start_time)
 
@@ -3230,6 +3288,17 @@ class ProgressiveHedging(_PHBase):
                           % (scenario_name,
                              len(self._scenario_tree._scenarios) - num_results_so_far))
 
+        self._record_count("subproblem_failures", len(failures))
+        for subproblem in subproblems:
+            for category, times in (("solve", self._solve_times),
+                                    ("pyomo_solve", self._pyomo_solve_times)):
+                solve_time = times.get(subproblem)
+                if (solve_time is not None) and \
+                   (not isinstance(solve_time, UndefinedData)):
+                    self._record_time(category,
+                                      solve_time,
+                                      subproblem=subproblem)
+
         if self._output_times:
             mean = sum(result_load_times) / float(len(result_load_times))
             std_dev = sqrt(sum(pow(x-mean,2.0) for x in result_load_times)) / float(len(result_load_times))
@@ -3264,6 +3333,9 @@ class ProgressiveHedging(_PHBase):
             warmstart=warmstart,
             exception_on_failure=exception_on_failure)
         queue_subproblems_end_time = time.time()
+        self._record_time("queue",
+                          queue_subproblems_end_time - \
+                          queue_subproblems_start_time)
 
         if self._output_times:
             print("Time queueing subproblems=%0.2f seconds"
@@ -3284,6 +3356,9 @@ class ProgressiveHedging(_PHBase):
                                                                       action_handle_bundle_map,
                                                                       bundle_action_handle_map)
         wait_subproblems_end_time = time.time()
+        self._record_time("wait",
+                          wait_subproblems_end_time - \
+                          wait_subproblems_start_time)
         if self._output_times:
             print("Time waiting for subproblems=%0.2f seconds"
                   % (wait_subproblems_end_time-wait_subproblems_start_time))
@@ -3414,6 +3489,11 @@ class ProgressiveHedging(_PHBase):
 
             for tree_node in stage._tree_nodes:
 
+                if numpy_available:
+                    self._update_node_variable_statistics(
+                        tree_node, overrelax, current_iteration)
+                    continue
+
                 xbars = tree_node._xbars
 
                 scenario_solutions = \
@@ -3449,10 +3529,57 @@ class ProgressiveHedging(_PHBase):
 
         end_time = time.time()
         self._cumulative_xbar_time += (end_time - start_time)
+        self._record_time("xbar_update", end_time - start_time)
 
         if self._output_times:
             print("Variable statistics compute time=%.2f seconds" % (end_time - start_time))
 
+    def _update_node_variable_statistics(self,
+                                         tree_node,
+                                         overrelax,
+                                         current_iteration):
+        # The vectorized form of the update_variable_statistics()
+        # loop for one tree node: the scenario solutions are gathered
+        # into a (scenarios x variables) array, with NaN for
+        # variables without a value (which are left stale).  The
+        # averages are accumulated scenario by scenario, in the same
+        # order (and so with the same rounding) as the scalar loop.
+        variable_ids = list(tree_node._standard_variable_ids)
+        if not variable_ids:
+            return
+        get_values = _values_getter(variable_ids)
+        node_name = tree_node._name
+
+        values = numpy.array(
+            [get_values(scenario._x[node_name])
+             for scenario in tree_node._scenarios], dtype=float)
+        avg_values = numpy.zeros(len(variable_ids))
+        for scenario, scenario_values in zip(tree_node._scenarios, values):
+            avg_values += scenario._probability * scenario_values
+        avg_values /= tree_node._probability
+
+        current = numpy.flatnonzero(~numpy.isnan(values).any(axis=0))
+        if len(current) < len(variable_ids):
+            variable_ids = [variable_ids[i] for i in current]
+            get_values = _values_getter(variable_ids)
+            values = values[:, current]
+            avg_values = avg_values[current]
+        if not variable_ids:
+            return
+
+        tree_node._minimums.update(
+            zip(variable_ids, values.min(axis=0).tolist()))
+        tree_node._maximums.update(
+            zip(variable_ids, values.max(axis=0).tolist()))
+        if self._ph_xbar_updates_enabled:
+            if (overrelax) and (current_iteration >= 1):
+                xbars = self._nu*avg_values + (1-self._nu)*numpy.array(
+                    get_values(tree_node._averages), dtype=float)
+            else:
+                xbars = avg_values
+            tree_node._xbars.update(zip(variable_ids, xbars.tolist()))
+        tree_node._averages.update(zip(variable_ids, avg_values.tolist()))
+
     def update_weights(self):
 
         start_time = time.time()
@@ -3494,6 +3621,11 @@ class ProgressiveHedging(_PHBase):
                 tree_node_wbars = tree_node._wbars = \
                     dict((var_id,0) for var_id in tree_node._variable_ids)
 
+                if numpy_available:
+                    self._update_node_weights(
+                        tree_node, tree_node_xbars, tree_node_wbars)
+                    continue
+
                 for scenario in tree_node._scenarios:
 
                     instance = scenario._instance
@@ -3557,10 +3689,69 @@ class ProgressiveHedging(_PHBase):
 
         end_time = time.time()
         self._cumulative_weight_time += (end_time - start_time)
+        self._record_time("weight_update", end_time - start_time)
 
         if self._output_times:
             print("Weight update time=%.2f seconds" % (end_time - start_time))
 
+    def _update_node_weights(self, tree_node, tree_node_xbars, tree_node_wbars):
+        # The vectorized form of the update_weights() loop for one tree
+        # node.  The weights of each scenario are updated as an array
+        # (only for the variables with a value) using the same
+        # arithmetic as the scalar loop, and wbar is accumulated
+        # scenario by scenario.
+        variable_ids = list(tree_node._standard_variable_ids)
+        if not variable_ids:
+            return
+        get_values = _values_getter(variable_ids)
+        node_name = tree_node._name
+
+        nu_value = 1.0
+        if self._overrelax:
+            nu_value = self._nu
+        xbars = numpy.array(get_values(tree_node_xbars), dtype=float)
+        blend_values = numpy.array(get_values(tree_node._blend), dtype=float)
+        wbars = numpy.zeros(len(variable_ids))
+
+        for scenario in tree_node._scenarios:
+            weight_values = scenario._w[node_name]
+            var_values = numpy.array(
+                get_values(scenario._x[node_name]), dtype=float)
+            rho_values = numpy.array(
+                get_values(scenario._rho[node_name]), dtype=float)
+            weights = numpy.array(get_values(weight_values), dtype=float)
+
+            current = ~numpy.isnan(var_values)
+            delta = blend_values * rho_values * nu_value * \
+                (var_values - xbars)
+            if not self._dual_mode:
+                if self._objective_sense == minimize:
+                    weights[current] += delta[current]
+                else:
+                    weights[current] -= delta[current]
+            else:
+                # **Adding these asserts simply because we haven't
+                # **thought about what this means for other steps in
+                # **the code
+                assert (blend_values[current] == 1.0).all()
+                assert nu_value == 1.0
+                assert self._objective_sense == minimize
+                weights[current] = delta[current]
+
+            if current.all():
+                weight_values.update(zip(variable_ids, weights.tolist()))
+                wbars += scenario._probability * weights / \
+                    tree_node._probability
+            else:
+                index = numpy.flatnonzero(current)
+                weight_values.update(
+                    zip((variable_ids[i] for i in index),
+                        weights[index].tolist()))
+                wbars[index] += scenario._probability * weights[index] / \
+                    tree_node._probability
+
+        tree_node_wbars.update(zip(variable_ids, wbars.tolist()))
+
     def update_weights_for_scenario(self, scenario):
 
         start_time = time.time()
@@ -3632,6 +3823,7 @@ class ProgressiveHedging(_PHBase):
 
         end_time = time.time()
         self._cumulative_weight_time += (end_time - start_time)
+        self._record_time("weight_update", end_time - start_time)
 
     def iteration_k_solves(self):
 
@@ -3647,9 +3839,11 @@ class ProgressiveHedging(_PHBase):
 
         # update parameters on instances (transmitting to ph solver
         # servers when appropriate)
+        start_time = time.time()
         self._push_xbar_to_instances()
         self._push_w_to_instances()
         self._push_rho_to_instances()
+        self._record_time("objective_update", time.time() - start_time)
 
         # STEP -1: if using a PH solver manager, propagate current
         #          weights/averages to the appropriate solver servers.
@@ -4012,6 +4206,7 @@ class ProgressiveHedging(_PHBase):
         self._cumulative_solve_time = 0.0
         self._cumulative_xbar_time = 0.0
         self._cumulative_weight_time = 0.0
+        self._timing_history = {}
         self._current_iteration = 0;
 
         # garbage collection noticeably slows down PH when dealing with
@@ -4081,8 +4276,7 @@ class ProgressiveHedging(_PHBase):
                                 self._report_only_nonconverged_variables)
 
             # let plugins know if they care.
-            for plugin in self._ph_plugins:
-                plugin.post_iteration_0_solves(self)
+            self._invoke_ph_plugins("post_iteration_0_solves")
 
             # update the fixed variable statistics.
             self._total_fixed_discrete_vars, \
@@ -4125,8 +4319,7 @@ class ProgressiveHedging(_PHBase):
                 self._incumbent_cost_history[self._current_iteration] = expected_cost
 
             # let plugins know if they care.
-            for plugin in self._ph_plugins:
-                plugin.post_iteration_0(self)
+            self._invoke_ph_plugins("post_iteration_0")
 
             # IMPT: update the weights after the PH iteration 0 callbacks;
             #       they might compute rhos based on iteration 0
@@ -4211,8 +4404,7 @@ class ProgressiveHedging(_PHBase):
                 print("Initiating PH iteration=" + str(self._current_iteration))
 
                 # let plugins know if they care.
-                for plugin in self._ph_plugins:
-                    plugin.pre_iteration_k_solves(self)
+                self._invoke_ph_plugins("pre_iteration_k_solves")
 
                 if not _OLD_OUTPUT:
                     if self._report_rhos_each_iteration or \
@@ -4269,8 +4461,7 @@ class ProgressiveHedging(_PHBase):
                     self.update_weights()
 
                 # let plugins know if they care.
-                for plugin in self._ph_plugins:
-                    plugin.post_iteration_k_solves(self)
+                self._invoke_ph_plugins("post_iteration_k_solves")
 
                 if (self._verbose) or (self._report_solutions):
                     print("Variable values following scenario solves:")
@@ -4331,8 +4522,7 @@ class ProgressiveHedging(_PHBase):
                     self._incumbent_cost_history[self._current_iteration] = expected_cost
 
                 # let plugins know if they care.
-                for plugin in self._ph_plugins:
-                    plugin.post_iteration_k(self)
+                self._invoke_ph_plugins("post_iteration_k")
 
                 # at this point, all the real work of an iteration is
                 # complete.
@@ -4596,6 +4786,42 @@ class ProgressiveHedging(_PHBase):
         self._bundle_binding_instance_map = {}
         self._bundle_scenario_instance_map = {}
     #
+    # accumulate timing and counter data for the current PH
+    # iteration. when a subproblem name is given, the time is
+    # recorded for that subproblem rather than for the iteration.
+    #
+
+    def _iteration_timing_record(self):
+        record = self._timing_history.get(self._current_iteration)
+        if record is None:
+            record = self._timing_history[self._current_iteration] = \
+                {'times': {}, 'counts': {}, 'subproblems': {}}
+        return record
+
+    def _record_time(self, category, seconds, subproblem=None):
+        record = self._iteration_timing_record()
+        if subproblem is None:
+            times = record['times']
+        else:
+            times = record['subproblems'].setdefault(subproblem, {})
+        times[category] = times.get(category, 0.0) + seconds
+
+    def _record_count(self, counter, count=1):
+        counts = self._iteration_timing_record()['counts']
+        counts[counter] = counts.get(counter, 0) + count
+
+    #
+    # invoke the named callback on all PH extension plugins,
+    # recording the time spent in them.
+    #
+
+    def _invoke_ph_plugins(self, callback_name):
+        start_time = time.time()
+        for plugin in self._ph_plugins:
+            getattr(plugin, callback_name)(self)
+        self._record_time("extensions", time.time() - start_time)
+
+    #
     # prints a summary of all collected time statistics
     #
 
@@ -4609,6 +4835,15 @@ class ProgressiveHedging(_PHBase):
         print("Average update time=  %.2f seconds" % self._cumulative_xbar_time)
         print("Weight update time=   %.2f seconds" % self._cumulative_weight_time)
 
+        # the per-phase totals over all iterations (see _record_time)
+        totals = {}
+        for record in itervalues(self._timing_history):
+            for category, seconds in iteritems(record['times']):
+                totals[category] = totals.get(category, 0.0) + seconds
+        for category in sorted(totals):
+            print("  %-20s %.2f seconds"
+                  % (category+" time=", totals[category]))
+
     #
     # a utility to determine whether to output weight / average / etc. information for
     # a variable/node combination. when the printing is moved into a callback/plugin,
@@ -713,6 +713,28 @@ def find_active_objective(instance, safety_checks=False):
             return objectives[0]
     return None
 
+#
+# Replaces, within a persistent solver, all constraints belonging to
+# the given constraint components with their current (active)
+# constraint datas. Constraint datas that no longer exist on a
+# component (e.g., after it was cleared) are removed from the solver.
+#
+
+def update_persistent_constraints(solver, constraints):
+
+    constraints = [constraint for constraint in constraints
+                   if constraint is not None]
+    if len(constraints) == 0:
+        return
+    constraint_ids = set(id(constraint) for constraint in constraints)
+    for constraint_data in list(solver._pyomo_con_to_solver_con_map):
+        if id(constraint_data.parent_component()) in constraint_ids:
+            solver.remove_constraint(constraint_data)
+    for constraint in constraints:
+        for constraint_data in constraint.values():
+            if constraint_data.active:
+                solver.add_constraint(constraint_data)
+
 def preprocess_scenario_instance(scenario_instance,
                                  instance_variables_fixed,
                                  instance_variables_freed,
@@ -759,6 +781,27 @@ def preprocess_scenario_instance(scenario_instance,
             elif len(active_objective_datas) == 1:
                 solver.set_objective(active_objective_datas[0])
 
+    # it can be the case that the solver plugin no longer has an
+    # instance compiled, depending on what state the solver plugin is
+    # in relative to the instance.  if this is the case, just don't
+    # push any of the changes below to the solver.
+    if persistent_solver_in_use and solver.has_instance():
+
+        if instance_variables_fixed or instance_variables_freed:
+            variables_to_change = \
+                instance_variables_fixed + instance_variables_freed
+            for var_name, var_index in variables_to_change:
+                solver.update_var(scenario_instance.find_component(var_name)[var_index])
+
+        # the linearized proximal terms are re-formed (cleared and
+        # re-populated) each iteration, so the solver's copies of
+        # those constraints must be replaced.
+        if instance_ph_constraints_modified:
+            update_persistent_constraints(
+                solver,
+                [scenario_instance.find_component(constraint_name)
+                 for constraint_name in instance_ph_constraints])
+
     if (instance_variables_fixed or instance_variables_freed) and \
        (preprocess_fixed_variables):
 
@@ -768,18 +811,6 @@ def preprocess_scenario_instance(scenario_instance,
         # anything else
         return
 
-    if (instance_variables_fixed or instance_variables_freed) and \
-       (persistent_solver_in_use):
-        # it can be the case that the solver plugin no longer has an
-        # instance compiled, depending on what state the solver plugin
-        # is in relative to the instance.  if this is the case, just
-        # don't compile the variable bounds.
-        if solver.has_instance():
-            variables_to_change = \
-                instance_variables_fixed + instance_variables_freed
-            for var_name, var_index in variables_to_change:
-                solver.update_var(scenario_instance.find_component(var_name)[var_index])
-
     if instance_user_constraints_modified:
 
         _preprocess(scenario_instance,
@@ -17,6 +17,7 @@ def load():
     import pyomo.pysp.plugins.testphextension
     import pyomo.pysp.plugins.wwphextension
     import pyomo.pysp.plugins.phhistoryextension
+    import pyomo.pysp.plugins.phtimingextension
     import pyomo.pysp.plugins.jsonsolutionwriter
     import pyomo.pysp.plugins.ddextensionnew
     import pyomo.pysp.plugins.adaptive_rho_converger
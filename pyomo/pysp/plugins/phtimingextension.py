@@ -0,0 +1,102 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import csv
+import json
+
+from pyomo.common.plugin import *
+from pyomo.pysp import phextension
+
+from six import iteritems
+
+#
+# The timing history recorded by PH is keyed by iteration. For each
+# iteration it holds
+#   - 'times': seconds spent in each phase of the iteration
+#              (preprocess, queue, wait, objective_update,
+#              xbar_update, weight_update, extensions)
+#   - 'counts': counters (subproblem_results, subproblem_failures)
+#   - 'subproblems': for each scenario (or bundle) solved, the
+#              seconds spent queueing it (queue), the time after
+#              waiting began that its result was received (wait),
+#              the time spent loading its solution (load), and the
+#              solve times reported by the solver (solve,
+#              pyomo_solve) when available
+#
+
+def extract_timings(ph):
+    """Return the PH timing history as a dict that can be
+    serialized to JSON (iterations are converted to strings)."""
+    return dict((str(iteration), record) for iteration, record
+                in sorted(iteritems(ph._timing_history)))
+
+def write_timings_json(ph, filename):
+    with open(filename, 'w') as f:
+        json.dump(extract_timings(ph), f, indent=2, sort_keys=True)
+
+def write_timings_csv(ph, filename):
+    """Write the PH timing history as one row per value, with the
+    columns iteration, subproblem, name, and value. The subproblem
+    column is empty for iteration totals and counters."""
+    with open(filename, 'w') as f:
+        writer = csv.writer(f)
+        writer.writerow(["iteration", "subproblem", "name", "value"])
+        for iteration, record in sorted(iteritems(ph._timing_history)):
+            for key in ('times', 'counts'):
+                for name, val in sorted(iteritems(record[key])):
+                    writer.writerow([iteration, "", name, val])
+            for subproblem, times in sorted(iteritems(record['subproblems'])):
+                for name, val in sorted(iteritems(times)):
+                    writer.writerow([iteration, subproblem, name, val])
+
+class phtimingextension(SingletonPlugin):
+
+    implements(phextension.IPHExtension)
+
+    # the below is a hack to get this extension into the
+    # set of IPHExtension objects, so it can be queried
+    # automagically by PH.
+    alias("PHTimingExtension")
+
+    def __init__(self):
+        self._ph_timing_filename = "ph_timings"
+
+    def reset(self, ph):
+        self.__init__()
+
+    def pre_ph_initialization(self,ph):
+        pass
+
+    def post_instance_creation(self,ph):
+        pass
+
+    def post_ph_initialization(self, ph):
+        pass
+
+    def post_iteration_0_solves(self, ph):
+        pass
+
+    def post_iteration_0(self, ph):
+        pass
+
+    def pre_iteration_k_solves(self, ph):
+        pass
+
+    def post_iteration_k_solves(self, ph):
+        pass
+
+    def post_iteration_k(self, ph):
+        pass
+
+    def post_ph_execution(self, ph):
+        write_timings_json(ph, self._ph_timing_filename+".json")
+        write_timings_csv(ph, self._ph_timing_filename+".csv")
+        print("PH timing history written to files=%s.json, %s.csv"
+              % (self._ph_timing_filename, self._ph_timing_filename))
@@ -0,0 +1,228 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+#
+# Scenario tree servers running on the ranks of an MPI communicator.
+# The client (e.g., a ScenarioTreeManagerClientMPI) runs on the root
+# rank and every other rank runs exec_scenariotreeserver_mpi(). This
+# can be done from a single script
+#
+#   if not exec_scenariotreeserver_mpi():
+#       ... code using the 'mpi' scenario tree manager ...
+#       shutdown_scenariotreeservers_mpi()
+#
+# or by launching the servers as separate MPI programs, e.g.,
+#
+#   mpiexec -n 1 runbenders --scenario-tree-manager=mpi ... : \
+#           -n 8 python -m pyomo.pysp.scenariotree.action_manager_mpi
+#
+
+__all__ = ("ScenarioTreeActionManagerMPI",
+           "exec_scenariotreeserver_mpi",
+           "shutdown_scenariotreeservers_mpi")
+
+from pyomo.opt.parallel.manager import (ActionHandle,
+                                        ActionStatus)
+from pyomo.pysp.scenariotree.action_manager_pyro import \
+    ScenarioTreeActionManagerPyro
+from pyomo.pysp.scenariotree.action_manager_multiprocessing import \
+    ScenarioTreeServerMultiprocessing
+
+_task_tag = 1
+_result_tag = 2
+
+def _get_mpi(comm):
+    # This import calls MPI_Init, so it is delayed until MPI is
+    # actually used
+    import mpi4py.MPI
+    if comm is None:
+        comm = mpi4py.MPI.COMM_WORLD
+    return mpi4py.MPI, comm
+
+def _server_name(rank):
+    # The MPIRank suffix lets the client create a communicator over
+    # the ranks that it uses (see ScenarioTreeServerPyro_setup)
+    return "ScenarioTreeServerMPI_MPIRank_%d" % (rank)
+
+def exec_scenariotreeserver_mpi(comm=None, root=0, verbose=False):
+    """Run a scenario tree server on this rank until the servers are
+    shut down by the root rank. Returns False (immediately) on the
+    root rank and True on all other ranks."""
+    MPI, comm = _get_mpi(comm)
+    if comm.rank == root:
+        return False
+    server = ScenarioTreeServerMultiprocessing(_server_name(comm.rank),
+                                               verbose=verbose,
+                                               mpi=(MPI, comm))
+    try:
+        while not server._worker_shutdown:
+            task = comm.recv(source=root, tag=_task_tag)
+            if task is None:
+                break
+            if task.get('broadcast', False):
+                task['data'] = comm.bcast(None, root=root)
+                if task['id'] is None:
+                    # this rank is not used by the client
+                    continue
+            result = server.process(task['data'])
+            if task['generateResponse']:
+                comm.send({'id': task['id'], 'result': result},
+                          dest=root,
+                          tag=_result_tag)
+    finally:
+        server.reset()
+    return True
+
+def shutdown_scenariotreeservers_mpi(comm=None, root=0):
+    """Cause exec_scenariotreeserver_mpi to return on all non-root
+    ranks. Must be called on the root rank."""
+    MPI, comm = _get_mpi(comm)
+    assert comm.rank == root
+    for rank in range(comm.size):
+        if rank != root:
+            comm.send(None, dest=rank, tag=_task_tag)
+
+#
+# Plays the role of the dispatcher client for the server on a single
+# rank.
+#
+
+class _ScenarioTreeServerRank(object):
+
+    def __init__(self, comm, rank):
+        self.URI = _server_name(rank)
+        self.rank = rank
+        self._comm = comm
+        self._requests = []
+
+    def add_task(self, task, verbose=False, override_type=None):
+        # discard completed sends
+        self._requests = [request for request in self._requests
+                          if not request.Test()]
+        self._requests.append(
+            self._comm.isend(task, dest=self.rank, tag=_task_tag))
+
+    def add_tasks(self, tasks, verbose=False):
+        for queue_name in tasks:
+            for task in tasks[queue_name]:
+                self.add_task(task)
+
+    def close(self):
+        for request in self._requests:
+            request.Wait()
+        self._requests = []
+
+#
+# An asynchronous action manager for scenario tree servers running on
+# the non-root ranks of an MPI communicator.
+#
+
+class ScenarioTreeActionManagerMPI(ScenarioTreeActionManagerPyro):
+
+    def __init__(self, comm=None, root=0, verbose=0):
+        super(ScenarioTreeActionManagerMPI, self).__init__(verbose=verbose)
+        self._MPI, self._comm = _get_mpi(comm)
+        self._root = root
+        if self._comm.rank != root:
+            raise RuntimeError(
+                "%s must be created on the root rank (%s) of the MPI "
+                "communicator, not on rank %s"
+                % (type(self).__name__, root, self._comm.rank))
+
+    def acquire_servers(self, servers_requested, timeout=None):
+
+        ranks = [rank for rank in range(self._comm.size)
+                 if rank != self._root]
+        if servers_requested > len(ranks):
+            raise RuntimeError(
+                "Unable to acquire %s scenario tree servers. Only %s "
+                "non-root MPI ranks are available."
+                % (servers_requested, len(ranks)))
+
+        if self._verbose:
+            print("Acquiring %s scenario tree servers on MPI ranks"
+                  % (servers_requested))
+
+        assert len(self.server_pool) == 0
+        assert len(self._dispatcher_name_to_client) == 0
+        for rank in ranks[:servers_requested]:
+            client = _ScenarioTreeServerRank(self._comm, rank)
+            server_name = client.URI
+            self._dispatcher_name_to_client[server_name] = client
+            self._server_name_to_dispatcher_name[server_name] = server_name
+            self._dispatcher_name_to_server_names[server_name] = \
+                [server_name]
+            self.server_pool.append(server_name)
+
+    def release_servers(self):
+
+        if self._verbose:
+            print("Releasing scenario tree servers on MPI ranks")
+
+        self.server_pool = []
+        self._server_name_to_dispatcher_name = {}
+        self._dispatcher_name_to_server_names = {}
+
+    def broadcast(self, queue_names, **kwds):
+        """Queue the same action on each of the named servers,
+        transmitting the action data with a single MPI broadcast
+        (rather than one message per server). Returns the list of
+        action handles. Every non-root rank must be running
+        exec_scenariotreeserver_mpi."""
+        assert not self._paused
+        generate_response = kwds.pop('generate_response', True)
+        task_data = self._get_task_data(None, **kwds)
+
+        action_handles = []
+        ids = {}
+        for queue_name in queue_names:
+            ah = ActionHandle()
+            self.event_handle[ah.id] = ah
+            ah.status = ActionStatus.queued
+            self.queued_action_counter += 1
+            rank = self._dispatcher_name_to_client[
+                self._get_dispatcher_name(queue_name)].rank
+            ids[rank] = ah.id
+            action_handles.append(ah)
+
+        for rank in range(self._comm.size):
+            if rank != self._root:
+                self._comm.send({'id': ids.get(rank, None),
+                                 'broadcast': True,
+                                 'generateResponse': generate_response},
+                                dest=rank,
+                                tag=_task_tag)
+        self._comm.bcast(task_data, root=self._root)
+
+        if not generate_response:
+            for ah in action_handles:
+                ah.status = ActionStatus.done
+                self.event_handle[ah.id].update(ah)
+                self.queued_action_counter -= 1
+
+        return action_handles
+
+    def _download_results(self):
+
+        task = self._comm.recv(source=self._MPI.ANY_SOURCE,
+                               tag=_result_tag)
+        while task is not None:
+            self.queued_action_counter -= 1
+            self._process_task_result(task)
+            if self._comm.Iprobe(source=self._MPI.ANY_SOURCE,
+                                 tag=_result_tag):
+                task = self._comm.recv(source=self._MPI.ANY_SOURCE,
+                                       tag=_result_tag)
+            else:
+                task = None
+
+if __name__ == "__main__":
+    import pyomo.environ
+    exec_scenariotreeserver_mpi()
@@ -0,0 +1,182 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ("ScenarioTreeActionManagerMultiprocessing",
+           "ScenarioTreeServerMultiprocessing")
+
+import sys
+import logging
+import traceback
+import multiprocessing
+try:
+    import cPickle as pickle
+except:                                           #pragma:nocover
+    import pickle
+try:
+    import queue
+except ImportError:                               #pragma:nocover
+    import Queue as queue
+
+from pyutilib.pyro import TaskProcessingError
+
+from pyomo.pysp.scenariotree.action_manager_pyro import \
+    ScenarioTreeActionManagerPyro
+from pyomo.pysp.scenariotree.server_pyro import ScenarioTreeServerPyro
+
+logger = logging.getLogger('pyomo.pysp')
+
+#
+# A scenario tree server that lives in a process started by the
+# multiprocessing action manager (or on an MPI rank). It processes the
+# same requests as ScenarioTreeServerPyro, but it receives them over a
+# local queue (or MPI) rather than from a Pyro dispatcher.
+#
+
+class ScenarioTreeServerMultiprocessing(ScenarioTreeServerPyro):
+
+    def __init__(self, name, verbose=False, mpi=None):
+        # Note: TaskWorker.__init__ is intentionally not called, as it
+        #       connects to a Pyro dispatcher
+        self.WORKERNAME = name
+        self._verbose = verbose
+        self._worker_error = False
+        self._worker_shutdown = False
+        self._modules_imported = {}
+        self._init_server(mpi)
+
+    def process(self, data):
+        try:
+            return pickle.dumps(self._process(pickle.loads(data)))
+        except:
+            logger.error(
+                "Scenario tree server %s caught an exception of type "
+                "%s while processing a task. Going idle."
+                % (self.WORKERNAME, sys.exc_info()[0].__name__))
+            traceback.print_exception(*sys.exc_info())
+            self._worker_error = True
+            return pickle.dumps(TaskProcessingError(traceback.format_exc()))
+
+def _run_scenariotreeserver(name, task_queue, result_queue, verbose):
+    server = ScenarioTreeServerMultiprocessing(name, verbose=verbose)
+    try:
+        while not server._worker_shutdown:
+            task = task_queue.get()
+            if task is None:
+                break
+            result = server.process(task['data'])
+            if task['generateResponse']:
+                result_queue.put({'id': task['id'], 'result': result})
+    finally:
+        server.reset()
+
+#
+# Plays the role of the dispatcher client for a single server
+# process: tasks for the server are placed on its own queue.
+#
+
+class _ScenarioTreeServerProcess(object):
+
+    def __init__(self, name, result_queue, verbose=False):
+        self.URI = name
+        self._task_queue = multiprocessing.Queue()
+        self.process = multiprocessing.Process(
+            target=_run_scenariotreeserver,
+            name=name,
+            args=(name, self._task_queue, result_queue, verbose))
+        self.process.daemon = True
+        self.process.start()
+
+    def add_task(self, task, verbose=False, override_type=None):
+        self._task_queue.put(task)
+
+    def add_tasks(self, tasks, verbose=False):
+        for queue_name in tasks:
+            for task in tasks[queue_name]:
+                self._task_queue.put(task)
+
+    def close(self):
+        if self.process.is_alive():
+            self._task_queue.put(None)
+            self.process.join(5)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self._task_queue.close()
+
+#
+# An asynchronous action manager for scenario tree servers running in
+# local processes. Tasks and results are exchanged over
+# multiprocessing queues, so no Pyro name server or dispatcher is
+# required.
+#
+
+class ScenarioTreeActionManagerMultiprocessing(ScenarioTreeActionManagerPyro):
+
+    def __init__(self, verbose=0):
+        super(ScenarioTreeActionManagerMultiprocessing, self).\
+            __init__(verbose=verbose)
+        self._result_queue = None
+
+    def acquire_servers(self, servers_requested, timeout=None):
+
+        if self._verbose:
+            print("Starting %s scenario tree server processes"
+                  % (servers_requested))
+
+        assert len(self.server_pool) == 0
+        assert len(self._dispatcher_name_to_client) == 0
+        self._result_queue = multiprocessing.Queue()
+        for i in range(servers_requested):
+            server_name = "ScenarioTreeServerMultiprocessing_%d" % (i)
+            self._dispatcher_name_to_client[server_name] = \
+                _ScenarioTreeServerProcess(server_name,
+                                           self._result_queue,
+                                           verbose=self._verbose > 1)
+            self._server_name_to_dispatcher_name[server_name] = server_name
+            self._dispatcher_name_to_server_names[server_name] = \
+                [server_name]
+            self.server_pool.append(server_name)
+
+    def release_servers(self):
+
+        if self._verbose:
+            print("Releasing scenario tree server processes")
+
+        self.server_pool = []
+        self._server_name_to_dispatcher_name = {}
+        self._dispatcher_name_to_server_names = {}
+
+    def close(self):
+        """Close the manager."""
+        super(ScenarioTreeActionManagerMultiprocessing, self).close()
+        if self._result_queue is not None:
+            self._result_queue.close()
+            self._result_queue = None
+
+    def _download_results(self):
+
+        task = None
+        while task is None:
+            try:
+                task = self._result_queue.get(timeout=1)
+            except queue.Empty:
+                for client in self._dispatcher_name_to_client.values():
+                    if not client.process.is_alive():
+                        raise RuntimeError(
+                            "Scenario tree server process %s exited "
+                            "while results were still expected"
+                            % (client.URI))
+        while task is not None:
+            self.queued_action_counter -= 1
+            self._process_task_result(task)
+            try:
+                task = self._result_queue.get_nowait()
+            except queue.Empty:
+                task = None
@@ -219,6 +219,39 @@ class ScenarioTreeActionManagerPyro(PyroAsynchronousActionManager):
         self._server_name_to_dispatcher_name = {}
         self._dispatcher_name_to_server_names = {}
 
+    def _process_task_result(self, task):
+
+        # ** See note in _get_task_data about why we pickle
+        #    all communication
+        task['result'] = pickle.loads(task['result'])
+
+        ah = self.event_handle.get(task['id'], None)
+        if ah is None:
+            # if we are here, this is really bad news!
+            raise RuntimeError(
+                "The %s found results for task with id=%s"
+                " - but no corresponding action handle "
+                "could be located! Showing task result "
+                "below:\n%s" % (type(self).__name__,
+                                task['id'],
+                                task.get('result', None)))
+        if type(task['result']) is TaskProcessingError:
+            ah.status = ActionStatus.error
+            self.event_handle[ah.id].update(ah)
+            msg = ("ScenarioTreeServer reported a processing "
+                   "error for task with id=%s. Reason: \n%s"
+                   % (task['id'], task['result'].args[0]))
+            if not self.ignore_task_errors:
+                raise RuntimeError(msg)
+            elif self.ignore_task_errors == 1:
+                logger.warning(msg)
+            # any value other than 0 or 1 will
+            # silently ignore task errors
+        else:
+            ah.status = ActionStatus.done
+            self.event_handle[ah.id].update(ah)
+            self.results[ah.id] = task['result']
+
     #
     # Abstract Methods
     #
@@ -271,36 +304,7 @@ class ScenarioTreeActionManagerPyro(PyroAsynchronousActionManager):
                         else:
                             assert type(task['result']) is unicode
                             task['result'] = str(task['result'])
-                    # ** See note in _get_task_data about why we pickle
-                    #    all communication
-                    task['result'] = pickle.loads(task['result'])
-
-                    ah = self.event_handle.get(task['id'], None)
-                    if ah is None:
-                        # if we are here, this is really bad news!
-                        raise RuntimeError(
-                            "The %s found results for task with id=%s"
-                            " - but no corresponding action handle "
-                            "could be located! Showing task result "
-                            "below:\n%s" % (type(self).__name__,
-                                            task['id'],
-                                            task.get('result', None)))
-                    if type(task['result']) is TaskProcessingError:
-                        ah.status = ActionStatus.error
-                        self.event_handle[ah.id].update(ah)
-                        msg = ("ScenarioTreeServer reported a processing "
-                               "error for task with id=%s. Reason: \n%s"
-                               % (task['id'], task['result'].args[0]))
-                        if not self.ignore_task_errors:
-                            raise RuntimeError(msg)
-                        elif self.ignore_task_errors == 1:
-                            logger.warning(msg)
-                        # any value other than 0 or 1 will
-                        # silently ignore task errors
-                    else:
-                        ah.status = ActionStatus.done
-                        self.event_handle[ah.id].update(ah)
-                        self.results[ah.id] = task['result']
+                    self._process_task_result(task)
 
         if not found_results:
             # If the queues are all empty, wait some time for things to
@@ -8,7 +8,8 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
-__all__ = ('ScenarioTreeInstanceFactory',)
+__all__ = ('ScenarioTreeInstanceFactory',
+           'ScenarioInstanceCache')
 
 import os
 import time
@@ -17,6 +18,11 @@ import tempfile
 import shutil
 import copy
 import logging
+from collections import OrderedDict
+try:
+    from collections.abc import Mapping as collections_Mapping
+except ImportError:                               #pragma:nocover
+    from collections import Mapping as collections_Mapping
 
 from pyutilib.misc import (ArchiveReaderFactory,
                            ArchiveReader,
@@ -24,12 +30,14 @@ from pyutilib.misc import (ArchiveReaderFactory,
 
 from pyomo.dataportal import DataPortal
 from pyomo.core import (Block,
+                        Var,
                         IPyomoScriptModifyInstance,
                         AbstractModel)
 from pyomo.core.base.block import _BlockData
 from pyomo.common.plugin import ExtensionPoint
 from pyomo.pysp.phutils import _OLD_OUTPUT
 from pyomo.pysp.util.misc import load_external_module
+from pyomo.pysp.scenariotree.template import ScenarioTemplate
 from pyomo.pysp.scenariotree.tree_structure_model import \
     (CreateAbstractScenarioTreeModel,
      ScenarioTreeModelFromNetworkX)
@@ -738,7 +746,15 @@ class ScenarioTreeInstanceFactory(object):
             profile_memory=False,
             output_instance_construction_time=False,
             compile_scenario_instances=False,
-            verbose=False):
+            verbose=False,
+            lazy=False,
+            max_instances=None):
+        """Construct the instances for all scenarios on the scenario
+        tree and return them in a dictionary keyed by scenario
+        name. If lazy is True, a ScenarioInstanceCache is returned
+        instead, which constructs each instance when it is first
+        accessed and holds at most max_instances instances at a
+        time."""
         assert not self._closed
 
         if scenario_tree._scenario_based_data:
@@ -748,6 +764,19 @@ class ScenarioTreeInstanceFactory(object):
             if verbose:
                 print("Node-based instance initialization enabled")
 
+        if lazy:
+            return ScenarioInstanceCache(
+                self,
+                scenario_tree,
+                max_instances=max_instances,
+                profile_memory=profile_memory,
+                output_instance_construction_time=output_instance_construction_time,
+                compile_instance=compile_scenario_instances,
+                verbose=verbose)
+        elif max_instances is not None:
+            raise ValueError("The max_instances keyword can only be "
+                             "used when lazy=True")
+
         scenario_instances = {}
         for scenario in scenario_tree._scenarios:
 
@@ -776,6 +805,25 @@ class ScenarioTreeInstanceFactory(object):
 
         return scenario_instances
 
+    def construct_scenario_template(self,
+                                    scenario_tree,
+                                    profile_memory=False,
+                                    output_instance_construction_time=False,
+                                    compile_scenario_instances=False,
+                                    verbose=False):
+        """Construct a ScenarioTemplate that represents all scenarios
+        on the scenario tree with a single instance. Only the
+        parameter values and variable bounds that differ from the
+        first scenario are stored for the remaining scenarios."""
+        assert not self._closed
+        return ScenarioTemplate(
+            self,
+            scenario_tree,
+            profile_memory=profile_memory,
+            output_instance_construction_time=output_instance_construction_time,
+            compile_instance=compile_scenario_instances,
+            verbose=verbose)
+
     def generate_scenario_tree(self,
                                downsample_fraction=1.0,
                                include_scenarios=None,
@@ -908,3 +956,112 @@ class ScenarioTreeInstanceFactory(object):
         scenario_tree._scenario_instance_factory = self
 
         return scenario_tree
+
+class ScenarioInstanceCache(collections_Mapping):
+    """A mapping from scenario name to scenario instance that
+    constructs each instance (using a ScenarioTreeInstanceFactory)
+    when it is first accessed.
+
+    When max_instances is not None, the least recently accessed
+    instances are evicted once more than max_instances instances are
+    held. The values and fixed status of the variables on an evicted
+    instance are retained and restored if the instance is rebuilt,
+    which bounds the memory required to work with trees with a large
+    number of scenarios. Note that instances linked into a
+    ScenarioTree (with linkInInstances) must not be evicted, as the
+    scenario tree keeps references to their components.
+    """
+
+    def __init__(self,
+                 factory,
+                 scenario_tree,
+                 max_instances=None,
+                 **kwds):
+        if (max_instances is not None) and (max_instances < 1):
+            raise ValueError("The max_instances keyword must be a "
+                             "positive integer or None")
+        self._factory = factory
+        self._scenario_tree = scenario_tree
+        self._max_instances = max_instances
+        # keyword arguments for construct_scenario_instance
+        self._kwds = kwds
+        self._scenario_names = [scenario.name for scenario
+                                in scenario_tree.scenarios]
+        self._scenario_name_set = frozenset(self._scenario_names)
+        # held instances, ordered from least to most recently used
+        self._instances = OrderedDict()
+        # the variable state of evicted instances
+        self._states = {}
+        self.construction_count = 0
+
+    def __getitem__(self, scenario_name):
+        instance = self._instances.pop(scenario_name, None)
+        if instance is None:
+            if not self._scenario_tree.contains_scenario(scenario_name):
+                raise KeyError(scenario_name)
+            with PauseGC() as pgc:
+                instance = self._factory.construct_scenario_instance(
+                    scenario_name,
+                    self._scenario_tree,
+                    **self._kwds)
+            self.construction_count += 1
+            state = self._states.pop(scenario_name, None)
+            if state is not None:
+                self._restore_state(instance, state)
+            if self._max_instances is not None:
+                while len(self._instances) >= self._max_instances:
+                    self.evict(next(iter(self._instances)))
+        self._instances[scenario_name] = instance
+        return instance
+
+    def __iter__(self):
+        return iter(self._scenario_names)
+
+    def __len__(self):
+        return len(self._scenario_names)
+
+    def __contains__(self, scenario_name):
+        # the Mapping default calls __getitem__, which would construct
+        # the instance (and possibly evict another)
+        return scenario_name in self._scenario_name_set
+
+    def constructed(self):
+        """Return the names of the scenarios with an instance
+        currently held, from least to most recently used."""
+        return list(self._instances)
+
+    def evict(self, scenario_name):
+        """Discard the instance for a scenario, retaining the state
+        of its variables."""
+        instance = self._instances.pop(scenario_name)
+        self._states[scenario_name] = self._save_state(instance)
+
+    @staticmethod
+    def _save_state(instance):
+        # variables are stored positionally, as a rebuilt instance
+        # declares them in the same order
+        values = []
+        fixed = []
+        for i, vardata in enumerate(
+                instance.component_data_objects(Var, descend_into=True)):
+            values.append(vardata.value)
+            if vardata.fixed:
+                fixed.append(i)
+        return tuple(values), frozenset(fixed)
+
+    @staticmethod
+    def _restore_state(instance, state):
+        values, fixed = state
+        vardatas = list(instance.component_data_objects(Var,
+                                                        descend_into=True))
+        if len(vardatas) != len(values):
+            raise RuntimeError(
+                "Unable to restore the state of scenario instance %s. "
+                "The rebuilt instance has %s variables but %s were "
+                "saved." % (instance.name, len(vardatas), len(values)))
+        for i, (vardata, value) in enumerate(zip(vardatas, values)):
+            vardata.value = value
+            if i in fixed:
+                vardata.fix()
+            else:
+                vardata.unfix()
@@ -11,10 +11,13 @@
 __all__ = ("InvocationType",
            "ScenarioTreeManagerClientSerial",
            "ScenarioTreeManagerClientPyro",
+           "ScenarioTreeManagerClientMultiprocessing",
+           "ScenarioTreeManagerClientMPI",
            "ScenarioTreeManagerFactory")
 
 import math
 import sys
+import multiprocessing
 import time
 import itertools
 import inspect
@@ -46,6 +49,10 @@ from pyomo.pysp.scenariotree.instance_factory import \
     ScenarioTreeInstanceFactory
 from pyomo.pysp.scenariotree.action_manager_pyro \
     import ScenarioTreeActionManagerPyro
+from pyomo.pysp.scenariotree.action_manager_multiprocessing \
+    import ScenarioTreeActionManagerMultiprocessing
+from pyomo.pysp.scenariotree.action_manager_mpi \
+    import ScenarioTreeActionManagerMPI
 from pyomo.pysp.scenariotree.server_pyro \
     import ScenarioTreeServerPyro
 from pyomo.pysp.ef import create_ef_instance
@@ -2631,10 +2638,7 @@ class _ScenarioTreeManagerClientPyroAdvanced(ScenarioTreeManagerClient,
         action manager."""
 
         assert self._action_manager is None
-        self._action_manager = ScenarioTreeActionManagerPyro(
-            verbose=self._options.verbose,
-            host=self._options.pyro_host,
-            port=self._options.pyro_port)
+        self._action_manager = self._create_action_manager()
         self._action_manager.acquire_servers(num_servers, timeout=timeout)
 
         scenario_instance_factory = \
@@ -2677,24 +2681,36 @@ class _ScenarioTreeManagerClientPyroAdvanced(ScenarioTreeManagerClient,
         server_init['scenario_tree'] = self._scenario_tree
         server_init['data'] = instance_factory.data_directory()
         try:
-            self.pause_transmit()
-            for server_name in self._action_manager.server_pool:
-                action_handles.append(
-                    self._action_manager.queue(
-                        queue_name=server_name,
-                        action="ScenarioTreeServerPyro_setup",
-                        options=server_init,
-                        generate_response=True))
-                self._pyro_server_workers_map[server_name] = []
-            self.unpause_transmit()
+            action_handles = self._transmit_server_setup(server_init)
         finally:
             self._scenario_tree._scenario_instance_factory = instance_factory
+        for server_name in self._action_manager.server_pool:
+            self._pyro_server_workers_map[server_name] = []
         self._action_manager.wait_all(action_handles)
         for ah in action_handles:
             self._action_manager.get_results(ah)
 
         return len(self._action_manager.server_pool)
 
+    def _create_action_manager(self):
+        return ScenarioTreeActionManagerPyro(
+            verbose=self._options.verbose,
+            host=self._options.pyro_host,
+            port=self._options.pyro_port)
+
+    def _transmit_server_setup(self, server_init):
+        action_handles = []
+        self.pause_transmit()
+        for server_name in self._action_manager.server_pool:
+            action_handles.append(
+                self._action_manager.queue(
+                    queue_name=server_name,
+                    action="ScenarioTreeServerPyro_setup",
+                    options=server_init,
+                    generate_response=True))
+        self.unpause_transmit()
+        return action_handles
+
     def release_scenariotreeservers(self, ignore_errors=False):
         """Release the pool of scenario tree servers and destroy the
         action manager."""
@@ -3226,6 +3242,27 @@ class ScenarioTreeManagerClientPyro(_ScenarioTreeManagerClientPyroAdvanced,
     # Abstract methods for ScenarioTreeManagerClient:
     #
 
+    def _scenariotreeservers_required(self, num_jobs):
+        """Return the number of scenario tree servers to acquire
+        for the given number of jobs along with the acquisition
+        timeout."""
+        servers_required = self._options.pyro_required_scenariotreeservers
+        if servers_required == 0:
+            servers_required = num_jobs
+        elif servers_required > num_jobs:
+            if servers_required > num_jobs:
+                print("Value assigned to pyro_required_scenariotreeservers option (%s) "
+                      "is greater than the number of available jobs (%s). "
+                      "Limiting the number of servers to acquire to %s"
+                      % (servers_required, num_jobs, num_jobs))
+            servers_required = num_jobs
+
+        timeout = self._options.pyro_find_scenariotreeservers_timeout if \
+                  (self._options.pyro_required_scenariotreeservers == 0) else \
+                  None
+
+        return servers_required, timeout
+
     # Override the implementation on _ScenarioTreeManagerClientPyroAdvanced
     def _init_client(self):
         assert self._scenario_tree is not None
@@ -3242,20 +3279,7 @@ class ScenarioTreeManagerClientPyro(_ScenarioTreeManagerClientPyroAdvanced,
                 print("Scenario jobs available: %s"
                       % (str(num_jobs)))
 
-        servers_required = self._options.pyro_required_scenariotreeservers
-        if servers_required == 0:
-            servers_required = num_jobs
-        elif servers_required > num_jobs:
-            if servers_required > num_jobs:
-                print("Value assigned to pyro_required_scenariotreeservers option (%s) "
-                      "is greater than the number of available jobs (%s). "
-                      "Limiting the number of servers to acquire to %s"
-                      % (servers_required, num_jobs, num_jobs))
-            servers_required = num_jobs
-
-        timeout = self._options.pyro_find_scenariotreeservers_timeout if \
-                  (self._options.pyro_required_scenariotreeservers == 0) else \
-                  None
+        servers_required, timeout = self._scenariotreeservers_required(num_jobs)
 
         if self._options.verbose:
             if servers_required == 0:
@@ -3820,6 +3844,80 @@ class ScenarioTreeManagerClientPyro(_ScenarioTreeManagerClientPyroAdvanced,
         return self.get_server_for_worker(
             self.get_worker_for_bundle(bundle_name))
 
+#
+# This class replaces the Pyro name server, dispatcher, and
+# scenariotreeserver processes required by ScenarioTreeManagerClientPyro
+# with scenario tree server processes launched on the local machine
+# (using the multiprocessing module). Scenarios / bundles are pinned to
+# these processes exactly as they are to the Pyro scenario tree
+# servers.
+#
+
+class ScenarioTreeManagerClientMultiprocessing(ScenarioTreeManagerClientPyro,
+                                               PySPConfiguredObject):
+
+    @classmethod
+    def _declare_options(cls, options=None):
+        if options is None:
+            options = PySPConfigBlock()
+
+        safe_declare_common_option(options,
+                                   "multiprocessing_scenariotreeservers")
+
+        return options
+
+    def _create_action_manager(self):
+        return ScenarioTreeActionManagerMultiprocessing(
+            verbose=self._options.verbose)
+
+    def _scenariotreeservers_required(self, num_jobs):
+        servers_required = self._options.multiprocessing_scenariotreeservers
+        if servers_required == 0:
+            servers_required = min(num_jobs, multiprocessing.cpu_count())
+        servers_required = min(servers_required, num_jobs)
+        return servers_required, None
+
+#
+# This class distributes the scenario tree over scenario tree servers
+# running on the non-root ranks of an MPI communicator (see
+# pyomo.pysp.scenariotree.action_manager_mpi), which must be executing
+# exec_scenariotreeserver_mpi(). The client must be created on the
+# root rank. The scenario tree server setup data is sent to all ranks
+# with a single broadcast.
+#
+
+class ScenarioTreeManagerClientMPI(ScenarioTreeManagerClientPyro,
+                                   PySPConfiguredObject):
+
+    @classmethod
+    def _declare_options(cls, options=None):
+        if options is None:
+            options = PySPConfigBlock()
+
+        safe_declare_common_option(options,
+                                   "mpi_scenariotreeservers")
+
+        return options
+
+    def _create_action_manager(self):
+        return ScenarioTreeActionManagerMPI(
+            verbose=self._options.verbose)
+
+    def _scenariotreeservers_required(self, num_jobs):
+        servers_required = self._options.mpi_scenariotreeservers
+        if servers_required == 0:
+            import mpi4py.MPI
+            servers_required = mpi4py.MPI.COMM_WORLD.size - 1
+        servers_required = min(servers_required, num_jobs)
+        return servers_required, None
+
+    def _transmit_server_setup(self, server_init):
+        return self._action_manager.broadcast(
+            self._action_manager.server_pool,
+            action="ScenarioTreeServerPyro_setup",
+            options=server_init,
+            generate_response=True)
+
 def ScenarioTreeManagerFactory(options, *args, **kwds):
     type_ = options.scenario_tree_manager
     try:
@@ -3839,6 +3937,10 @@ ScenarioTreeManagerFactory.registered_types['serial'] = \
     ScenarioTreeManagerClientSerial
 ScenarioTreeManagerFactory.registered_types['pyro'] = \
     ScenarioTreeManagerClientPyro
+ScenarioTreeManagerFactory.registered_types['multiprocessing'] = \
+    ScenarioTreeManagerClientMultiprocessing
+ScenarioTreeManagerFactory.registered_types['mpi'] = \
+    ScenarioTreeManagerClientMPI
 
 def _register_scenario_tree_manager_options(*args, **kwds):
     if len(args) == 0:
@@ -3860,6 +3962,10 @@ def _register_scenario_tree_manager_options(*args, **kwds):
                                                      **kwds)
     ScenarioTreeManagerClientPyro.register_options(options,
                                                    **kwds)
+    ScenarioTreeManagerClientMultiprocessing.register_options(options,
+                                                              **kwds)
+    ScenarioTreeManagerClientMPI.register_options(options,
+                                                  **kwds)
 
     return options
 
@@ -97,6 +97,9 @@ class ScenarioTreeServerPyro(TaskWorker):
         self.type = self.WORKERNAME
         self.block = True
         self.timeout = None
+        self._init_server(mpi)
+
+    def _init_server(self, mpi):
         self._worker_map = {}
         self._init_verbose = self._verbose
 
@@ -0,0 +1,229 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ("ScenarioTemplate",)
+
+from pyutilib.misc import PauseGC
+
+from pyomo.core import (Var,
+                        Param,
+                        Set,
+                        Constraint,
+                        Objective)
+from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.repn import generate_standard_repn
+
+# The component types whose index sets must match across all
+# scenarios represented by a template
+_structure_ctypes = (Set, Param, Var, Constraint, Objective)
+
+def _expression_structure(expr):
+    """Return a description of the structure of an expression that
+    does not depend on the values of mutable parameters: the names of
+    the variables in each part of its standard representation and the
+    coefficients written in terms of the parameters."""
+    repn = generate_standard_repn(expr, compute_values=False)
+    return (str(repn.constant),
+            tuple((var.name, str(coef)) for var, coef
+                  in zip(repn.linear_vars, repn.linear_coefs)),
+            tuple(((var1.name, var2.name), str(coef))
+                  for (var1, var2), coef
+                  in zip(repn.quadratic_vars, repn.quadratic_coefs)),
+            tuple(var.name for var in repn.nonlinear_vars),
+            str(repn.nonlinear_expr))
+
+def _constraint_structure(con):
+    return (con.active,
+            con.equality,
+            con.has_lb(),
+            con.has_ub(),
+            _expression_structure(con.body) if con.active else None)
+
+def _objective_structure(obj):
+    return (obj.active,
+            obj.sense,
+            _expression_structure(obj.expr) if obj.active else None)
+
+class ScenarioTemplate(object):
+    """A single model instance that represents every scenario of a
+    scenario tree whose scenarios share the same structure.
+
+    The instance for the first scenario is kept as the template. The
+    remaining scenarios are constructed one at a time, compared with
+    the template, and discarded, so that each scenario is stored only
+    as the mutable parameter values, variable bounds and fixed
+    variable values that differ from the template. Calling activate() patches the template with the
+    data for a scenario, after which it can be written or solved as the
+    subproblem for that scenario.
+
+    Scenarios that differ in the value of an immutable parameter, in
+    the index set of any component, in the domain or fixed status of a
+    variable, or in the structure of an active constraint or objective
+    (its variables, coefficient expressions, sense, or which bounds are
+    set) cannot share a template, and a ValueError is raised. Immutable parameter values are compiled into
+    the expressions of a model, so they must be declared mutable for
+    the corresponding data to vary by scenario.
+    """
+
+    def __init__(self, factory, scenario_tree, **kwds):
+        # kwds are passed to construct_scenario_instance
+        scenario_names = [scenario.name for scenario
+                          in scenario_tree.scenarios]
+        assert len(scenario_names) > 0
+        self._scenario_names = scenario_names
+        self._active = scenario_names[0]
+        with PauseGC() as pgc:
+            self.instance = factory.construct_scenario_instance(
+                scenario_names[0],
+                scenario_tree,
+                **kwds)
+        # the template values of any data that differs by scenario
+        self._base = ComponentMap()
+        # the data that differs from the template, by scenario
+        self._data = {scenario_names[0]: ComponentMap()}
+        for scenario_name in scenario_names[1:]:
+            with PauseGC() as pgc:
+                instance = factory.construct_scenario_instance(
+                    scenario_name,
+                    scenario_tree,
+                    **kwds)
+            self._data[scenario_name] = self._compare(instance)
+
+    @property
+    def scenario_names(self):
+        return self._scenario_names
+
+    @property
+    def active_scenario(self):
+        """The name of the scenario the template currently
+        represents."""
+        return self._active
+
+    def scenario_data(self, scenario_name):
+        """Return a ComponentMap (keyed by template parameter or
+        variable data) holding the values that differ between the
+        given scenario and the template."""
+        return self._data[scenario_name]
+
+    def activate(self, scenario_name):
+        """Patch the template with the data for the given scenario
+        and return the template instance."""
+        if scenario_name != self._active:
+            data = self._data[scenario_name]
+            for obj, val in self._data[self._active].items():
+                if obj not in data:
+                    self._set(obj, self._base[obj])
+            for obj, val in data.items():
+                self._set(obj, val)
+            self._active = scenario_name
+        self.instance._name = scenario_name
+        return self.instance
+
+    def write(self, scenario_name, *args, **kwds):
+        """Write the subproblem for the given scenario by patching
+        the template. Arguments are passed to the write method of
+        the template instance."""
+        return self.activate(scenario_name).write(*args, **kwds)
+
+    @staticmethod
+    def _set(obj, val):
+        if obj.type() is Var:
+            obj.setlb(val[0])
+            obj.setub(val[1])
+            if obj.fixed:
+                obj.value = val[2]
+        else:
+            obj.value = val
+
+    def _mismatch(self, instance, what):
+        return ValueError(
+            "Scenario %s does not have the same structure as the "
+            "template scenario %s: %s"
+            % (instance.name, self._scenario_names[0], what))
+
+    def _compare(self, instance):
+        template = self.instance
+        data = ComponentMap()
+        for component in template.component_objects(_structure_ctypes,
+                                                    descend_into=True):
+            other = instance.find_component(component.name)
+            if (other is None) or \
+               (other.type() is not component.type()) or \
+               (len(other) != len(component)) or \
+               (component.is_indexed() and
+                any(index not in other for index in component)):
+                raise self._mismatch(
+                    instance, "component %s differs" % (component.name))
+            ctype = component.type()
+            if ctype is Set:
+                if component.is_indexed():
+                    same = all(set(component[i]) == set(other[i])
+                               for i in component)
+                else:
+                    same = set(component) == set(other)
+                if not same:
+                    raise self._mismatch(
+                        instance,
+                        "the members of set %s differ" % (component.name))
+            elif ctype is Param:
+                for index in component:
+                    val = component[index]
+                    other_val = other[index]
+                    if component._mutable:
+                        val, other_val = val.value, other_val.value
+                    if val == other_val:
+                        continue
+                    if not component._mutable:
+                        raise ValueError(
+                            "Scenario %s can not share a template with "
+                            "scenario %s: the values of immutable "
+                            "parameter %s differ. Declare it with "
+                            "mutable=True."
+                            % (instance.name, self._scenario_names[0],
+                               component.name))
+                    obj = component[index]
+                    self._base[obj] = val
+                    data[obj] = other_val
+            elif ctype is Var:
+                for index in component:
+                    obj = component[index]
+                    other_obj = other[index]
+                    if (obj.fixed != other_obj.fixed) or \
+                       (obj.domain.name != other_obj.domain.name):
+                        raise self._mismatch(
+                            instance,
+                            "the domain or fixed status of variable %s "
+                            "differs" % (obj.name))
+                    bounds = (obj.lb, obj.ub,
+                              obj.value if obj.fixed else None)
+                    other_bounds = (other_obj.lb, other_obj.ub,
+                                    other_obj.value if other_obj.fixed
+                                    else None)
+                    if bounds != other_bounds:
+                        self._base[obj] = bounds
+                        data[obj] = other_bounds
+            elif ctype is Constraint:
+                for index in component:
+                    if _constraint_structure(component[index]) != \
+                       _constraint_structure(other[index]):
+                        raise self._mismatch(
+                            instance,
+                            "the expression of constraint %s differs"
+                            % (component[index].name))
+            else:
+                assert ctype is Objective
+                for index in component:
+                    if _objective_structure(component[index]) != \
+                       _objective_structure(other[index]):
+                        raise self._mismatch(
+                            instance,
+                            "the expression of objective %s differs"
+                            % (component[index].name))
+        return data
@@ -42,6 +42,7 @@ from pyomo.core import (value, minimize, Set,
                         Expression, Suffix, Reals, Param)
 from pyomo.core.base.constraint import _GeneralConstraintData
 from pyomo.core.beta.list_objects import XConstraintList
+from pyomo.core.util import quicksum
 from pyomo.pysp.util.configured_object import PySPConfiguredObject
 from pyomo.pysp.util.config import (PySPConfigValue,
                                     PySPConfigBlock,
@@ -52,6 +53,7 @@ from pyomo.pysp.util.config import (PySPConfigValue,
                                     _domain_percent,
                                     _domain_nonnegative,
                                     _domain_positive_integer,
+                                    _domain_nonnegative_integer,
                                     _domain_must_be_str,
                                     _domain_unit_interval,
                                     _domain_tuple_of_str,
@@ -94,6 +96,7 @@ def EXTERNAL_activate_rootnode_costs(manager,
     assert len(manager.scenario_tree.stages) == 2
     assert scenario in manager.scenario_tree.scenarios
     rootnode = manager.scenario_tree.findRootNode()
+    instance = scenario._instance
     nodecost_var = instance.find_component(
         rootnode._cost_variable[0])[rootnode._cost_variable[1]]
     scenario._instance.find_component(
@@ -383,6 +386,10 @@ class BendersOptimalityCut(object):
 
 class BendersAlgorithm(PySPConfiguredObject):
 
+    # the slack above which a cut is considered inactive (or below
+    # whose negative it is considered violated) by update_cut_pool
+    _cut_slack_tolerance = 1e-6
+
     @classmethod
     def _declare_options(cls, options=None):
         if options is None:
@@ -431,6 +438,23 @@ class BendersAlgorithm(PySPConfiguredObject):
                 doc=None,
                 visibility=0),
             ap_group=_benders_group_label)
+        safe_declare_unique_option(
+            options,
+            "cut_pool_inactive_limit",
+            PySPConfigValue(
+                0,
+                domain=_domain_nonnegative_integer,
+                description=(
+                    "Deactivate a cut on the master benders problem "
+                    "once it has been inactive (slack) at this many "
+                    "consecutive master solutions. Deactivated cuts "
+                    "are reactivated when a later master solution "
+                    "violates them. Default is 0, which disables cut "
+                    "deactivation."
+                ),
+                doc=None,
+                visibility=0),
+            ap_group=_benders_group_label)
         safe_declare_unique_option(
             options,
             "optimality_gap_epsilon",
@@ -636,6 +660,9 @@ class BendersAlgorithm(PySPConfiguredObject):
         self.master = None
         self.cut_pool = []
         self._num_first_stage_constraints = None
+        # the number of consecutive master solutions at which each
+        # constraint in PYSP_BENDERS_CUTS_SSC has been slack
+        self._cut_inactive_counts = []
 
         super(BendersAlgorithm, self).__init__(*args, **kwds)
 
@@ -975,23 +1002,27 @@ class BendersAlgorithm(PySPConfiguredObject):
             benders_objective_name)
         cutlist_constraint_name = "PYSP_BENDERS_CUTS_SSC"
         assert not hasattr(master, cutlist_constraint_name)
-        # I am using the XConstraintList prototype because
-        # it is zero-based, meaning the index within self.cut_pool
-        # (which stores the benders cuts objects) will correspond
-        # directly with the index within this constraint.
+        # I am using the XConstraintList prototype because it is
+        # zero-based, meaning the index within this constraint will
+        # correspond directly with the index within
+        # self._cut_inactive_counts. Each benders cut object in
+        # self.cut_pool adds one constraint for each cut group.
         master.add_component(cutlist_constraint_name,
                              XConstraintList())
 
         self.master = master
         self.cut_pool = []
+        self._cut_inactive_counts = []
 
     def add_cut(self, benders_cut, ignore_cut_bundles=False):
         """
         Add the cut defined by the benders_cut object to the
-        master problem. The optional keyword ignore_cut_bundles
-        can be used generate the cut using the single master
-        alpha cut variable rather than over the possibly many
-        bundle cut groups.
+        master problem. A separate cut constraint is added for
+        each cut group (see the multicut_level option). The
+        optional keyword ignore_cut_bundles can be used generate
+        a single cut using the master alpha cut variable rather
+        than one over each of the possibly many bundle cut
+        groups.
         """
 
         if self.master is None:
@@ -1018,48 +1049,95 @@ class BendersAlgorithm(PySPConfiguredObject):
             "PYSP_BENDERS_BUNDLE_ALPHA_SSC")
 
         xhat = benders_cut.xhat
-        cut_expression = 0.0
         if not ignore_cut_bundles:
-            for i, cut_scenarios in enumerate(
-                    getattr(master, "PYSP_BENDERS_CUT_BUNDLES_SSC")):
-
-                for scenario_name in cut_scenarios:
-                    assert scenario_name not in master._scenarios_included
-                    scenario_duals = benders_cut.duals[scenario_name]
-                    scenario_ssc = benders_cut.ssc[scenario_name]
-                    scenario = scenario_tree.get_scenario(scenario_name)
-                    cut_expression += \
-                        scenario.probability * \
-                        (scenario_ssc + \
-                         sum(scenario_duals[variable_id] * \
-                             (master_variable[variable_id] - xhat[variable_id]) \
-                             for variable_id in xhat))
-
-                cut_expression -= bundle_alpha[i]
-
+            cut_groups = \
+                [(cut_scenarios, bundle_alpha[i]) for i, cut_scenarios
+                 in enumerate(getattr(master,
+                                      "PYSP_BENDERS_CUT_BUNDLES_SSC"))]
         else:
-            for scenario in scenario_tree.scenarios:
-                if scenario.name in master._scenarios_included:
-                    continue
-                scenario_name = scenario.name
+            cut_groups = [([scenario.name for scenario
+                            in scenario_tree.scenarios
+                            if scenario.name not in
+                            master._scenarios_included],
+                           master_alpha)]
+
+        for cut_scenarios, alpha in cut_groups:
+            # Aggregate the cut coefficients over the scenarios
+            # in the group, so that the cut has a single term for
+            # each first-stage variable rather than one for each
+            # scenario and variable
+            constant = 0.0
+            coefficients = dict.fromkeys(xhat, 0.0)
+            for scenario_name in cut_scenarios:
+                assert scenario_name not in master._scenarios_included
+                probability = \
+                    scenario_tree.get_scenario(scenario_name).probability
                 scenario_duals = benders_cut.duals[scenario_name]
-                scenario_ssc = benders_cut.ssc[scenario_name]
-                scenario = scenario_tree.get_scenario(scenario_name)
-                cut_expression += \
-                    scenario.probability * \
-                    (scenario_ssc + \
-                     sum(scenario_duals[variable_id] * \
-                         (master_variable[variable_id] - xhat[variable_id]) \
-                         for variable_id in xhat))
+                constant += probability * benders_cut.ssc[scenario_name]
+                for variable_id in xhat:
+                    coefficient = probability * scenario_duals[variable_id]
+                    coefficients[variable_id] += coefficient
+                    constant -= coefficient * xhat[variable_id]
+
+            cut_expression = \
+                quicksum((coefficients[variable_id] * \
+                          master_variable[variable_id]
+                          for variable_id in xhat),
+                         linear=True) + constant - alpha
 
-            cut_expression -= master_alpha
+            if objective_sense == minimize:
+                benders_cuts.append(
+                    _GeneralConstraintData((None,cut_expression,0.0)))
+            else:
+                benders_cuts.append(
+                    _GeneralConstraintData((0.0,cut_expression,None)))
+            self._cut_inactive_counts.append(0)
 
-        if objective_sense == minimize:
-            benders_cuts.append(
-                _GeneralConstraintData((None,cut_expression,0.0)))
-        else:
-            benders_cuts.append(
-                _GeneralConstraintData((0.0,cut_expression,None)))
+    def update_cut_pool(self):
+        """
+        Deactivate the cuts on the master problem that have been
+        slack at the last cut_pool_inactive_limit master
+        solutions, and reactivate any deactivated cuts that are
+        violated by the current master solution. Returns the
+        number of active cuts.
+        """
+
+        if self.master is None:
+            raise RuntimeError("The master problem has not been constructed."
+                               "Call the build_master_problem() method to "
+                               "construct it.")
+
+        benders_cuts = self.master.find_component(
+            "PYSP_BENDERS_CUTS_SSC")
+        inactive_limit = self.get_option("cut_pool_inactive_limit")
+        if inactive_limit == 0:
+            return len(benders_cuts)
+
+        tolerance = self._cut_slack_tolerance
+        inactive_counts = self._cut_inactive_counts
+        assert len(inactive_counts) == len(benders_cuts)
+        num_active = 0
+        for i, cut in enumerate(benders_cuts):
+            slack = cut.slack()
+            if cut.active:
+                if slack > tolerance:
+                    inactive_counts[i] += 1
+                    if inactive_counts[i] >= inactive_limit:
+                        cut.deactivate()
+                        continue
+                else:
+                    inactive_counts[i] = 0
+                num_active += 1
+            elif slack < -tolerance:
+                cut.activate()
+                inactive_counts[i] = 0
+                num_active += 1
+
+        if self.get_option("verbose"):
+            print("Number of active cuts on the master problem: %s "
+                  "(of %s)" % (num_active, len(benders_cuts)))
+
+        return num_active
 
     def extract_master_xhat(self):
 
@@ -1245,6 +1323,8 @@ class BendersAlgorithm(PySPConfiguredObject):
 
             self.master_bound_history[i] = current_master_bound
 
+            self.update_cut_pool()
+
             new_xhat = self.extract_master_xhat()
             new_cut_info, solve_results = \
                 self.generate_cut(new_xhat,
@@ -23,6 +23,12 @@ from pyomo.pysp.util.misc import (_get_test_nameserver,
                                   _poll,
                                   _kill)
 from pyomo.environ import *
+from pyomo.pysp.scenariotree.instance_factory import \
+    ScenarioTreeInstanceFactory
+from pyomo.pysp.scenariotree.manager import \
+    ScenarioTreeManagerClientSerial
+from pyomo.pysp.solvers.benders import (BendersAlgorithm,
+                                        BendersOptimalityCut)
 
 from six import StringIO
 
@@ -52,6 +58,68 @@ def setUpModule():
             testing_solvers[_solver, _io] = True
 
 
+class TestBendersAlgorithm(unittest.TestCase):
+
+    def _check_cuts(self, multicut_level, num_cuts):
+        farmer_examples_dir = join(pysp_examples_dir, "farmer")
+        options = ScenarioTreeManagerClientSerial.register_options()
+        with ScenarioTreeInstanceFactory(
+                join(farmer_examples_dir, "models"),
+                join(farmer_examples_dir, "scenariodata")) as factory:
+            with ScenarioTreeManagerClientSerial(
+                    options, factory=factory) as manager:
+                manager.initialize()
+                benders_options = BendersAlgorithm.register_options()
+                benders_options.multicut_level = multicut_level
+                benders_options.cut_pool_inactive_limit = 2
+                with BendersAlgorithm(manager, benders_options) as benders:
+                    benders.initialize_subproblems()
+                    benders.build_master_problem()
+                    master = benders.master
+                    scenario_tree = manager.scenario_tree
+                    variable_ids = scenario_tree.findRootNode().\
+                                   _standard_variable_ids
+                    xhat = dict((variable_id, 1.0)
+                                for variable_id in variable_ids)
+                    ssc = {}
+                    duals = {}
+                    for i, scenario in enumerate(scenario_tree.scenarios):
+                        ssc[scenario.name] = 10.0
+                        duals[scenario.name] = \
+                            dict((variable_id, float(i))
+                                 for variable_id in variable_ids)
+                    benders.add_cut(BendersOptimalityCut(xhat, ssc, duals))
+                    cuts = master.PYSP_BENDERS_CUTS_SSC
+                    self.assertEqual(len(cuts), num_cuts)
+
+                    master_variable = master.MASTER_BLEND_VAR_RootNode
+                    for variable_id in variable_ids:
+                        master_variable[variable_id].value = 1.0
+                    master.PYSP_BENDERS_BUNDLE_ALPHA_SSC[:].value = 100.0
+                    master.PYSP_BENDERS_ALPHA_SSC.value = 100.0
+                    # each cut evaluates to sum_s p_s * ssc_s
+                    # at xhat (the duals cancel)
+                    self.assertAlmostEqual(
+                        sum(cut.body() for cut in cuts),
+                        10.0 - 100.0 * num_cuts)
+
+                    # the cuts are slack, so they are deactivated
+                    # at the second master solution
+                    self.assertEqual(benders.update_cut_pool(), num_cuts)
+                    self.assertEqual(benders.update_cut_pool(), 0)
+                    self.assertEqual(
+                        [cut.active for cut in cuts], [False] * num_cuts)
+                    # and reactivated once they are violated
+                    master.PYSP_BENDERS_BUNDLE_ALPHA_SSC[:].value = 0.0
+                    master.PYSP_BENDERS_ALPHA_SSC.value = 0.0
+                    self.assertEqual(benders.update_cut_pool(), num_cuts)
+
+    def test_singlecut(self):
+        self._check_cuts(1, 1)
+
+    def test_multicut(self):
+        self._check_cuts(0, 3)
+
 class _RunBendersTesterBase(object):
 
     basename = None
@@ -376,6 +376,36 @@ class _SMPSTesterBase(object):
                    self.options['--output-directory'])
         self._cleanup()
 
+    def _run_reference_core_only(self, baseline_suffix):
+        self.options['--reference-core-only'] = None
+        del self.options['--keep-scenario-files']
+        cmd = self._get_cmd()
+        self._run_cmd(cmd)
+        # only the reference scenario files are written, and they
+        # are removed after the conversion
+        baseline = os.path.join(baselinedir,
+                                self.baseline_basename+baseline_suffix)
+        output_directory = self.options['--output-directory']
+        self.assertFalse(os.path.exists(join(output_directory,
+                                             'scenario_files')))
+        self._diff(baseline,
+                   output_directory,
+                   dc=filecmp.dircmp(baseline,
+                                     output_directory,
+                                     ['.svn', 'scenario_files']))
+        self._cleanup()
+
+    def test_scenarios_LP_reference_core_only(self):
+        self._setup(self.options)
+        self.options['--core-format'] = 'lp'
+        self._run_reference_core_only('_LP_baseline')
+
+    def test_scenarios_MPS_symbolic_names_reference_core_only(self):
+        self._setup(self.options)
+        self.options['--core-format'] = 'mps'
+        self.options['--symbolic-solver-labels'] = None
+        self._run_reference_core_only('_MPS_symbolic_names_baseline')
+
 _pyomo_ns_host = '127.0.0.1'
 _pyomo_ns_port = None
 _pyomo_ns_process = None
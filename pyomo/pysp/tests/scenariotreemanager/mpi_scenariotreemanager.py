@@ -0,0 +1,55 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Runs the scenario tree manager client tests against the 'mpi'
+# scenario tree manager. This script must be launched with mpiexec
+# using at least 2 ranks, e.g.,
+#
+#   mpiexec -n 4 python mpi_scenariotreemanager.py
+#
+
+import sys
+
+import pyutilib.th as unittest
+
+from pyomo.pysp.util.config import PySPConfigBlock
+from pyomo.pysp.scenariotree.manager import ScenarioTreeManagerClientMPI
+from pyomo.pysp.scenariotree.action_manager_mpi import \
+    (exec_scenariotreeserver_mpi,
+     shutdown_scenariotreeservers_mpi)
+# registers the ScenarioTreeManagerWorkerTest worker type
+from pyomo.pysp.tests.scenariotreemanager.test_scenariotreemanager import \
+    (_ScenarioTreeManagerTesterBase,
+     _ScenarioTreeManagerClientPyroTesterBase)
+
+class TestScenarioTreeManagerClientMPI(
+        unittest.TestCase,
+        _ScenarioTreeManagerClientPyroTesterBase):
+
+    cls = ScenarioTreeManagerClientMPI
+
+    def setUp(self):
+        self.options = PySPConfigBlock()
+        ScenarioTreeManagerClientMPI.register_options(
+            self.options,
+            registered_worker_name='ScenarioTreeManagerWorkerTest')
+    def _setup(self, options, servers=None):
+        _ScenarioTreeManagerTesterBase._setup(self, options)
+        options.pyro_handshake_at_startup = False
+        if servers is not None:
+            options.mpi_scenariotreeservers = servers
+
+if __name__ == "__main__":
+    if not exec_scenariotreeserver_mpi():
+        try:
+            result = unittest.main(argv=sys.argv[:1], exit=False).result
+        finally:
+            shutdown_scenariotreeservers_mpi()
+        sys.exit(not result.wasSuccessful())
@@ -36,6 +36,7 @@ from pyomo.pysp.scenariotree.manager import (ScenarioTreeManager,
                                              _ScenarioTreeManagerWorker,
                                              ScenarioTreeManagerClientSerial,
                                              ScenarioTreeManagerClientPyro,
+                                             ScenarioTreeManagerClientMultiprocessing,
                                              ScenarioTreeManagerFactory,
                                              InvocationType)
 from pyomo.pysp.scenariotree.manager_worker_pyro import \
@@ -49,6 +50,12 @@ from pyomo.pysp.scenariotree.instance_factory import \
 
 from pyomo.environ import *
 
+try:
+    import mpi4py
+    mpi4py_available = True
+except ImportError:
+    mpi4py_available = False
+
 try:
     import dill
     dill_available = True                         #pragma:nocover
@@ -259,7 +266,7 @@ class _ScenarioTreeManagerTesterBase(object):
             manager.unpause_transmit()
             self.assertEqual(manager._transmission_paused, False)
         if dill_available or \
-           isinstance(manager, ScenarioTreeManagerClientPyro):
+           (not isinstance(manager, ScenarioTreeManagerClientPyro)):
             print("")
             print("Running InvocationType.Single... (using dill)")
             results = manager.invoke_function(
@@ -671,7 +678,7 @@ class _ScenarioTreeManagerTesterBase(object):
                     async_call=True)
 
             if dill_available or \
-               isinstance(manager, ScenarioTreeManagerClientPyro):
+               (not isinstance(manager, ScenarioTreeManagerClientPyro)):
                 print("")
                 print("Running InvocationType.Single... (using dill)")
                 results = manager.invoke_function_on_worker(
@@ -1508,5 +1515,40 @@ class TestScenarioTreeManagerClientPyro_HandshakeAtStartup(
         _ScenarioTreeManagerClientPyroTesterBase._setup(self, options, servers=servers)
         options.pyro_handshake_at_startup = True
 
+@unittest.category('parallel')
+class TestScenarioTreeManagerClientMultiprocessing(
+        unittest.TestCase,
+        _ScenarioTreeManagerClientPyroTesterBase):
+
+    cls = ScenarioTreeManagerClientMultiprocessing
+
+    def setUp(self):
+        self.options = PySPConfigBlock()
+        ScenarioTreeManagerClientMultiprocessing.register_options(
+            self.options,
+            registered_worker_name='ScenarioTreeManagerWorkerTest')
+    def _setup(self, options, servers=None):
+        _ScenarioTreeManagerTesterBase._setup(self, options)
+        options.pyro_handshake_at_startup = False
+        if servers is not None:
+            options.multiprocessing_scenariotreeservers = servers
+
+pyutilib.services.register_executable('mpiexec')
+_mpiexec = pyutilib.services.registered_executable('mpiexec')
+
+@unittest.skipIf(not mpi4py_available, "mpi4py is not available")
+@unittest.skipIf(_mpiexec is None, "mpiexec is not available")
+@unittest.category('parallel')
+class TestScenarioTreeManagerClientMPI(unittest.TestCase):
+
+    def test_mpiexec(self):
+        # the tests for the 'mpi' scenario tree manager need to run
+        # under mpiexec, so they live in a separate script
+        retcode = subprocess.call(
+            [_mpiexec.get_path(), "--allow-run-as-root", "--oversubscribe",
+             "-n", "3", sys.executable,
+             os.path.join(thisdir, "mpi_scenariotreemanager.py")])
+        self.assertEqual(retcode, 0)
+
 if __name__ == "__main__":
     unittest.main()
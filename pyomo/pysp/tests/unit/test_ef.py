@@ -0,0 +1,78 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+import os
+import tempfile
+from os.path import join, dirname, abspath
+
+import pyutilib.th as unittest
+
+from pyomo.pysp.scenariotree.instance_factory import \
+    ScenarioTreeInstanceFactory
+from pyomo.pysp.scenariotree.manager import \
+    ScenarioTreeManagerClientSerial
+from pyomo.pysp.ef import write_ef_direct
+
+thisfile = abspath(__file__)
+thisdir = dirname(thisfile)
+testdatadir = join(thisdir, "testdata")
+
+@unittest.category('smoke','nightly','expensive')
+class TestWriteEFDirect(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix=".lp")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_shared_columns(self):
+        options = ScenarioTreeManagerClientSerial.register_options()
+        with ScenarioTreeInstanceFactory(
+                join(testdatadir, "reference_test_model.py"),
+                join(testdatadir,
+                     "reference_test_scenario_tree.dat")) as factory:
+            with ScenarioTreeManagerClientSerial(
+                    options, factory=factory) as manager:
+                manager.initialize()
+                scenario_tree = manager.scenario_tree
+                symbol_map = write_ef_direct(scenario_tree,
+                                             self.filename)
+                # the first-stage variable x is a single column
+                self.assertEqual(list(symbol_map.bySymbol), ["x1"])
+                self.assertIs(symbol_map.getObject("x1"),
+                              scenario_tree.get_scenario("s1")._instance.x)
+                with open(self.filename) as f:
+                    lines = f.read().splitlines()
+                self.assertEqual(lines[2:4], ["min ", "MASTER:"])
+                self.assertAlmostEqual(float(lines[4].split()[0]), 1.0)
+                self.assertEqual(lines[4].split()[1], "x1")
+                self.assertEqual(lines[8:19],
+                                 ["c_l_c1_:", "+1 x1", ">= 1", "",
+                                  "c_l_c2_:", "+1 x1", ">= 2", "",
+                                  "c_l_c3_:", "+1 x1", ">= 3"])
+                self.assertEqual(lines[-3:],
+                                 ["bounds",
+                                  "    -inf <= x1 <= +inf",
+                                  "end"])
+
+                write_ef_direct(scenario_tree,
+                                self.filename,
+                                symbolic_solver_labels=True)
+                with open(self.filename) as f:
+                    text = f.read()
+                self.assertTrue("c_l_s2_c_:" in text)
+                self.assertTrue("MASTER_BLEND_VAR_root(x)" in text)
+
+                with self.assertRaises(ValueError):
+                    write_ef_direct(scenario_tree, "ef.nl")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -141,6 +141,152 @@ class Test(unittest.TestCase):
 
     # model: name of .py file with model
     # scenario_tree: name of .dat file
+    def test_lazy_instances(self):
+        with ScenarioTreeInstanceFactory(
+                model=join(testdatadir,
+                           "reference_test_model.py"),
+                scenario_tree=join(testdatadir,
+                                   "reference_test_scenario_tree.dat")) as factory:
+            scenario_tree = factory.generate_scenario_tree()
+            with self.assertRaises(ValueError):
+                factory.construct_instances_for_scenario_tree(
+                    scenario_tree, max_instances=1)
+            instances = factory.construct_instances_for_scenario_tree(
+                scenario_tree, lazy=True, max_instances=2)
+            self.assertEqual(len(instances), 3)
+            self.assertEqual(sorted(instances), ["s1", "s2", "s3"])
+            self.assertEqual(instances.constructed(), [])
+            self.assertEqual(instances["s1"].p(), 1)
+            self.assertIs(instances["s1"], instances["s1"])
+            instances["s1"].x.value = 5
+            instances["s1"].x.fix()
+            self.assertEqual(instances["s2"].p(), 2)
+            self.assertEqual(instances.constructed(), ["s1", "s2"])
+            self.assertEqual(instances["s3"].p(), 3)
+            # the least recently used instance is evicted
+            self.assertEqual(instances.constructed(), ["s2", "s3"])
+            self.assertEqual(instances.construction_count, 3)
+            # and rebuilt with its variable state restored
+            self.assertEqual(instances["s1"].x.value, 5)
+            self.assertEqual(instances["s1"].x.fixed, True)
+            self.assertEqual(instances.constructed(), ["s3", "s1"])
+            self.assertEqual(instances.construction_count, 4)
+            self.assertEqual("s0" in instances, False)
+            with self.assertRaises(KeyError):
+                instances["s0"]
+            # membership tests do not construct (or evict) instances
+            self.assertEqual("s2" in instances, True)
+            self.assertEqual(instances.constructed(), ["s3", "s1"])
+            self.assertEqual(instances.construction_count, 4)
+
+    # model: name of .py file with model
+    # scenario_tree: name of .dat file
+    def test_scenario_template(self):
+        with ScenarioTreeInstanceFactory(
+                model=join(testdatadir,
+                           "reference_test_model.py"),
+                scenario_tree=join(testdatadir,
+                                   "reference_test_scenario_tree.dat")) as factory:
+            scenario_tree = factory.generate_scenario_tree()
+            template = factory.construct_scenario_template(scenario_tree)
+            self.assertEqual(template.scenario_names, ["s1", "s2", "s3"])
+            self.assertEqual(template.active_scenario, "s1")
+            instance = template.instance
+            self.assertEqual(len(template.scenario_data("s1")), 0)
+            self.assertEqual(list(template.scenario_data("s2").values()),
+                             [2])
+            self.assertIs(template.activate("s3"), instance)
+            self.assertEqual(instance.p(), 3)
+            self.assertEqual(instance.name, "s3")
+            self.assertEqual(template.activate("s1").p(), 1)
+            self.assertEqual(template.activate("s2").p(), 2)
+            self.assertEqual(template.active_scenario, "s2")
+
+    def _template_factory(self, scenario_model_callback):
+        scenario_tree_model = CreateAbstractScenarioTreeModel().\
+            create_instance(
+                join(testdatadir, "reference_test_scenario_tree.dat"))
+        return ScenarioTreeInstanceFactory(
+            model=scenario_model_callback,
+            scenario_tree=scenario_tree_model)
+
+    def test_scenario_template_bounds(self):
+        import pyomo.environ as pe
+        def scenario_model_callback(scenario_tree, scenario_name, node_list):
+            model = pe.ConcreteModel()
+            k = int(scenario_name[1:])
+            model.x = pe.Var(bounds=(0, k))
+            model.y = pe.Var(initialize=k)
+            model.y.fix()
+            model.c = pe.Constraint(expr=model.x >= model.y)
+            model.o = pe.Objective(expr=model.x)
+            model.cost = pe.Expression([1,2], initialize={1:model.x, 2:0})
+            return model
+        with self._template_factory(scenario_model_callback) as factory:
+            scenario_tree = factory.generate_scenario_tree()
+            template = factory.construct_scenario_template(scenario_tree)
+            instance = template.instance
+            self.assertEqual(
+                sorted(template.scenario_data("s3").values(), key=str),
+                [(0, 3, None), (None, None, 3)])
+            self.assertEqual(template.activate("s3").x.ub, 3)
+            self.assertEqual(instance.y.value, 3)
+            self.assertEqual(template.activate("s1").x.ub, 1)
+            self.assertEqual(instance.y.value, 1)
+            self.assertEqual(instance.x.lb, 0)
+
+            output = join(thisdir, "scenario_template_s2.lp")
+            try:
+                template.write("s2", output)
+                self.assertEqual(template.active_scenario, "s2")
+                self.assertEqual(instance.x.ub, 2)
+                with open(output) as f:
+                    lp = f.read()
+                self.assertTrue("<= 2" in lp)
+            finally:
+                if exists(output):
+                    os.remove(output)
+
+    def test_scenario_template_mismatch(self):
+        import pyomo.environ as pe
+        def build(scenario_name, con_rule=None, domain=pe.Reals,
+                  fixed=False, sense=pe.minimize):
+            model = pe.ConcreteModel()
+            model.p = pe.Param(mutable=True,
+                               initialize=int(scenario_name[1:]))
+            model.x = pe.Var(domain=domain)
+            if fixed:
+                model.x.fix(0)
+            if con_rule is None:
+                con_rule = lambda m: m.x >= m.p
+            model.c = pe.Constraint(rule=con_rule)
+            model.o = pe.Objective(expr=model.x, sense=sense)
+            model.cost = pe.Expression([1,2], initialize={1:model.x, 2:0})
+            return model
+        def con_rule(m):
+            if pe.value(m.p) < 2:
+                return m.x >= m.p
+            else:
+                return m.x <= 10*m.p
+        for kwds, msg in (
+                (dict(con_rule=con_rule), "constraint c"),
+                (dict(domain=pe.Integers), "variable x"),
+                (dict(fixed=True), "variable x"),
+                (dict(sense=pe.maximize), "objective o")):
+            def scenario_model_callback(scenario_tree,
+                                        scenario_name,
+                                        node_list):
+                if scenario_name == "s1":
+                    return build(scenario_name)
+                return build(scenario_name, **kwds)
+            with self._template_factory(scenario_model_callback) \
+                 as factory:
+                scenario_tree = factory.generate_scenario_tree()
+                with self.assertRaises(ValueError) as cm:
+                    factory.construct_scenario_template(scenario_tree)
+                self.assertTrue(msg in str(cm.exception))
+                self.assertTrue("Scenario s2" in str(cm.exception))
+
     def test_init1(self):
         self.assertTrue("reference_test_model" not in sys.modules)
         with ScenarioTreeInstanceFactory(
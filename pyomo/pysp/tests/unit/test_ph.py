@@ -14,9 +14,11 @@
 
 import os
 import sys
+import csv
+import json
 import subprocess
 import time
-from os.path import abspath, dirname
+from os.path import abspath, dirname, join
 
 try:
     from subprocess import check_output as _run_cmd
@@ -47,8 +49,11 @@ from pyomo.pysp.util.misc import (_get_test_nameserver,
                                   _kill)
 import pyomo.opt
 import pyomo.pysp
+import pyomo.pysp.ph
 import pyomo.pysp.phinit
 import pyomo.pysp.ef_writer_script
+from pyomo.core import (minimize, maximize, ConcreteModel, Var,
+                        Constraint)
 
 _diff_tolerance = 1e-5
 _diff_tolerance_relaxed = 1e-3
@@ -2589,5 +2594,167 @@ class TestPHParallel(unittest.TestCase):
             self.fail("Differences identified relative to all baseline output file alternatives")
         _remove(this_test_file_directory+"networkflow1ef10_linearized_cplex_with_bundles_with_phpyro.out")
 
+class _Bunch(object):
+    def __init__(self, **kwds):
+        self.__dict__.update(kwds)
+
+def _ph_statistics_problem(nscenarios, nvariables, stale=()):
+    # A PH object holding just the data used by
+    # update_variable_statistics() and update_weights(), for a
+    # two-stage tree with random scenario solutions
+    import random
+    rng = random.Random(1234)
+    ids = ['v%d' % i for i in range(nvariables)]
+    root = _Bunch(_name='RootNode', _probability=1.0,
+                  _standard_variable_ids=set(ids), _variable_ids=set(ids),
+                  _xbars=dict.fromkeys(ids, 0.0),
+                  _averages=dict.fromkeys(ids, 0.0),
+                  _minimums={}, _maximums={}, _wbars={},
+                  _blend=dict((i, rng.choice((0, 1, 1))) for i in ids),
+                  _scenarios=[])
+    for s in range(nscenarios):
+        root._scenarios.append(_Bunch(
+            _probability=1.0/nscenarios, _instance=None,
+            _x={'RootNode': dict((i, rng.uniform(-10, 10)) for i in ids)},
+            _w={'RootNode': dict((i, rng.uniform(-1, 1)) for i in ids)},
+            _rho={'RootNode': dict((i, rng.uniform(0, 5)) for i in ids)}))
+    for s, i in stale:
+        root._scenarios[s]._x['RootNode'][ids[i]] = None
+    ph = pyomo.pysp.ph.ProgressiveHedging.__new__(
+        pyomo.pysp.ph.ProgressiveHedging)
+    ph._scenario_tree = _Bunch(_stages=[_Bunch(_tree_nodes=[root]),
+                                        _Bunch(_tree_nodes=[])])
+    ph._overrelax = False
+    ph._nu = 1.5
+    ph._current_iteration = 1
+    ph._ph_xbar_updates_enabled = True
+    ph._dual_mode = False
+    ph._objective_sense = minimize
+    ph._output_times = False
+    ph._cumulative_xbar_time = 0.0
+    ph._cumulative_weight_time = 0.0
+    ph._timing_history = {}
+    return ph, root
+
+@unittest.skipIf(not pyomo.pysp.ph.numpy_available, "numpy is not available")
+class TestPHStatistics(unittest.TestCase):
+
+    def _compare(self, **options):
+        # The vectorized statistics and weight updates must give
+        # exactly the same results as the scalar loops
+        results = []
+        for use_numpy in (True, False):
+            ph, root = _ph_statistics_problem(
+                20, 30, stale=[(3, 4), (7, 4), (0, 11)])
+            for name, val in options.items():
+                setattr(ph, name, val)
+            orig = pyomo.pysp.ph.numpy_available
+            pyomo.pysp.ph.numpy_available = use_numpy
+            try:
+                for i in range(2):
+                    ph.update_variable_statistics()
+                    ph.update_weights()
+            finally:
+                pyomo.pysp.ph.numpy_available = orig
+            results.append((root._xbars, root._averages, root._minimums,
+                            root._maximums, root._wbars,
+                            [s._w['RootNode'] for s in root._scenarios]))
+        self.assertNotIn('v4', results[0][2])
+        self.assertEqual(results[0], results[1])
+
+    def test_statistics(self):
+        self._compare()
+
+    def test_statistics_overrelax(self):
+        self._compare(_overrelax=True)
+
+    def test_statistics_maximize(self):
+        self._compare(_objective_sense=maximize)
+
+    def test_statistics_no_xbar_updates(self):
+        self._compare(_ph_xbar_updates_enabled=False)
+
+class _SlowPHExtension(object):
+    def post_iteration_k(self, ph):
+        time.sleep(0.01)
+
+class TestPHTimings(unittest.TestCase):
+
+    def test_timing_history(self):
+        from pyomo.pysp.plugins.phtimingextension import \
+            (extract_timings, write_timings_json, write_timings_csv)
+        ph, root = _ph_statistics_problem(4, 5)
+        ph._ph_plugins = [_SlowPHExtension()]
+        ph.update_variable_statistics()
+        ph.update_weights()
+        ph._record_time("wait", 1.5, subproblem="Scenario1")
+        ph._record_time("load", 0.25, subproblem="Scenario1")
+        ph._record_time("load", 0.25, subproblem="Scenario1")
+        ph._record_count("subproblem_results")
+        ph._invoke_ph_plugins("post_iteration_k")
+        ph._current_iteration = 2
+        ph._record_count("subproblem_failures", 3)
+
+        timings = extract_timings(ph)
+        self.assertEqual(sorted(timings), ['1', '2'])
+        record = timings['1']
+        self.assertEqual(sorted(record['times']),
+                         ['extensions', 'weight_update', 'xbar_update'])
+        self.assertGreaterEqual(record['times']['extensions'], 0.01)
+        self.assertEqual(record['counts'], {'subproblem_results': 1})
+        self.assertEqual(record['subproblems'],
+                         {'Scenario1': {'wait': 1.5, 'load': 0.5}})
+        self.assertEqual(timings['2']['counts'],
+                         {'subproblem_failures': 3})
+
+        filename = join(thisdir, "ph_timings_test")
+        try:
+            write_timings_json(ph, filename+".json")
+            with open(filename+".json") as f:
+                self.assertEqual(json.load(f), timings)
+            write_timings_csv(ph, filename+".csv")
+            with open(filename+".csv") as f:
+                rows = list(csv.reader(f))
+        finally:
+            _remove(filename+".json")
+            _remove(filename+".csv")
+        self.assertEqual(rows[0], ["iteration", "subproblem", "name", "value"])
+        self.assertIn(["1", "Scenario1", "wait", "1.5"], rows)
+        self.assertIn(["2", "", "subproblem_failures", "3"], rows)
+        self.assertEqual(len(rows), 8)
+
+class _RecordingPersistentSolver(object):
+    # Mimics the constraint bookkeeping of a PersistentSolver
+    def __init__(self):
+        self._pyomo_con_to_solver_con_map = {}
+    def add_constraint(self, con):
+        self._pyomo_con_to_solver_con_map[con] = con.name
+    def remove_constraint(self, con):
+        del self._pyomo_con_to_solver_con_map[con]
+
+class TestPHPersistent(unittest.TestCase):
+
+    def test_update_persistent_constraints(self):
+        from pyomo.pysp.phutils import update_persistent_constraints
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        m.c = Constraint([1, 2, 3], rule=lambda m, i: m.x[i] >= i)
+        m.d = Constraint(expr=m.x[1] <= 10)
+        solver = _RecordingPersistentSolver()
+        for con in (m.c[1], m.c[2], m.c[3], m.d):
+            solver.add_constraint(con)
+        # re-form the constraint with fewer pieces, as is done for
+        # the linearized proximal terms
+        m.c.clear()
+        m.c.add(1, m.x[1] >= 0)
+        m.c.add(2, m.x[2] >= 0)
+        m.c[2].deactivate()
+        update_persistent_constraints(solver, [m.c, None])
+        self.assertEqual(sorted(solver._pyomo_con_to_solver_con_map.values()),
+                         ['c[1]', 'd'])
+        self.assertIs(
+            [con for con in solver._pyomo_con_to_solver_con_map
+             if con.name == 'c[1]'][0], m.c[1])
+
 if __name__ == "__main__":
     unittest.main()
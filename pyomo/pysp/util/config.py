@@ -779,7 +779,47 @@ safe_declare_unique_option(
             "process and performs all scenario tree operations "
             "sequentially. If 'pyro' is specified, the scenario tree "
             "is fully distributed and scenario tree operations are "
-            "performed asynchronously."
+            "performed asynchronously. If 'multiprocessing' is "
+            "specified, the scenario tree is distributed in the same "
+            "way over scenario tree server processes launched on the "
+            "local machine, without requiring any Pyro components. If "
+            "'mpi' is specified, the scenario tree is distributed over "
+            "scenario tree servers running on the non-root ranks of "
+            "MPI_COMM_WORLD (requires the mpi4py module)."
+        ),
+        doc=None,
+        visibility=0),
+    ap_group=_scenario_tree_options_group_title)
+
+safe_declare_unique_option(
+    common_block,
+    "multiprocessing_scenariotreeservers",
+    PySPConfigValue(
+        0,
+        domain=_domain_nonnegative_integer,
+        description=(
+            "Set the number of scenario tree server processes to "
+            "launch when the 'multiprocessing' scenario tree manager "
+            "is selected. The default value of 0 indicates that one "
+            "process should be launched for each scenario (or "
+            "bundle), up to the number of cpus on this machine."
+        ),
+        doc=None,
+        visibility=0),
+    ap_group=_scenario_tree_options_group_title)
+
+safe_declare_unique_option(
+    common_block,
+    "mpi_scenariotreeservers",
+    PySPConfigValue(
+        0,
+        domain=_domain_nonnegative_integer,
+        description=(
+            "Set the number of MPI ranks used as scenario tree servers "
+            "when the 'mpi' scenario tree manager is selected. The "
+            "default value of 0 indicates that all non-root ranks "
+            "should be used, up to the number of scenarios (or "
+            "bundles)."
         ),
         doc=None,
         visibility=0),
@@ -635,7 +635,61 @@ class GAMSShell(_GAMSSolver):
             Note: put_results is not available for modification on
             GAMSShell solver.
         """
+        state = self._solve_prepare(args, kwds)
+        try:
+            rc, _ = pyutilib.subprocess.run(state.command, tee=state.tee)
+        except:
+            self._solve_cleanup(state)
+            raise
+        return self._solve_finish(state, rc)
 
+    def solve_async(self, *args, **kwds):
+        """
+        Solve a model via the GAMS executable without blocking on it.
+
+        This accepts the same arguments as solve() (and the 'loop'
+        keyword, see SystemCallSolver.solve_async()).  The GAMS
+        model is written and GAMS is started as an asyncio
+        subprocess before this method returns.  The returned asyncio
+        Future is resolved with the solver results once GAMS exits.
+        The GAMS log is only echoed (tee=True) once GAMS exits.
+        Requires Python 3.4 or later.
+        """
+        try:
+            import asyncio
+        except ImportError:
+            raise RuntimeError(
+                "solve_async() requires the asyncio module "
+                "(Python 3.4 or later)")
+        from pyomo.opt.solver.shellcmd import _run_command_async
+        loop = kwds.pop('loop', None)
+        if loop is None:
+            loop = asyncio.get_event_loop()
+
+        state = self._solve_prepare(args, kwds)
+        future = asyncio.Future(loop=loop)
+
+        def _finish(rc, log, err=None):
+            try:
+                if err is not None:
+                    self._solve_cleanup(state)
+                    raise err
+                result = self._solve_finish(state, rc)
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+
+        _run_command_async(state.command, loop, _finish, tee=state.tee)
+        return future
+
+    def _solve_prepare(self, args, kwds):
+        """
+        Write the GAMS model and return the state of the solve (the
+        solve options, file names and the GAMS command line).
+        """
         # Make sure available() doesn't crash
         self.available()
 
@@ -712,10 +766,6 @@ class GAMSShell(_GAMSSolver):
             print("      %6.2f seconds required for presolve" %
                   (presolve_completion_time - initial_time))
 
-        ####################################################################
-        # Apply solver
-        ####################################################################
-
         exe = self.executable()
         command = [exe, output, "o=" + lst, "curdir=" + tmpdir]
         if tee and not logfile:
@@ -732,9 +782,50 @@ class GAMSShell(_GAMSSolver):
         if logfile:
             command.append("lf=" + str(logfile))
 
-        try:
-            rc, _ = pyutilib.subprocess.run(command, tee=tee)
+        return Options(
+            model=model, load_solutions=load_solutions, tee=tee,
+            keepfiles=keepfiles, tmpdir=tmpdir, newdir=newdir,
+            report_timing=report_timing, command=command,
+            output_filename=output_filename, lst_filename=lst_filename,
+            results_filename=results_filename,
+            statresults_filename=statresults_filename,
+            smap_id=smap_id, symbolMap=symbolMap,
+            initial_time=initial_time,
+            presolve_completion_time=presolve_completion_time)
+
+    def _solve_cleanup(self, state):
+        """Remove the GAMS files (unless keepfiles was specified)"""
+        if not state.keepfiles:
+            if state.newdir:
+                shutil.rmtree(state.tmpdir)
+            else:
+                for filename in (state.output_filename,
+                                 state.lst_filename,
+                                 state.results_filename,
+                                 state.statresults_filename):
+                    if os.path.exists(filename):
+                        os.remove(filename)
+
+    def _solve_finish(self, state, rc):
+        """
+        Read the GAMS results (once GAMS has exited with return code
+        rc) and load them into the model (if requested).  Returns the
+        results object.
+        """
+        model = state.model
+        load_solutions = state.load_solutions
+        keepfiles = state.keepfiles
+        tmpdir = state.tmpdir
+        report_timing = state.report_timing
+        output_filename = state.output_filename
+        results_filename = state.results_filename
+        statresults_filename = state.statresults_filename
+        smap_id = state.smap_id
+        symbolMap = state.symbolMap
+        initial_time = state.initial_time
+        presolve_completion_time = state.presolve_completion_time
 
+        try:
             if keepfiles:
                 print("\nGAMS WORKING DIRECTORY: %s\n" % tmpdir)
 
@@ -754,14 +845,7 @@ class GAMSShell(_GAMSSolver):
             with open(statresults_filename, 'r') as statresults_file:
                 statresults_text = statresults_file.read()
         finally:
-            if not keepfiles:
-                if newdir:
-                    shutil.rmtree(tmpdir)
-                else:
-                    os.remove(output_filename)
-                    os.remove(lst_filename)
-                    os.remove(results_filename)
-                    os.remove(statresults_filename)
+            self._solve_cleanup(state)
 
         solve_completion_time = time.time()
         if report_timing:
@@ -12,7 +12,7 @@ import logging
 import re
 import sys
 import pyomo.common
-from pyutilib.misc import Bunch
+from pyutilib.misc import Bunch, PauseGC
 from pyutilib.services import TempfileManager
 from pyomo.core.expr.numvalue import is_fixed
 from pyomo.core.expr.numvalue import value
@@ -649,16 +649,17 @@ class CPLEXDirect(DirectSolver):
                         soln_constraints[con_name]["Slack"] = qudratic_slacks[i]
         elif self._load_solutions:
             if cpxprob.solution.get_solution_type() > 0:
-                self._load_vars()
+                with PauseGC():
+                    self._load_vars()
 
-                if extract_reduced_costs:
-                    self._load_rc()
+                    if extract_reduced_costs:
+                        self._load_rc()
 
-                if extract_duals:
-                    self._load_duals()
+                    if extract_duals:
+                        self._load_duals()
 
-                if extract_slacks:
-                    self._load_slacks()
+                    if extract_slacks:
+                        self._load_slacks()
 
         self.results.solution.insert(soln)
 
@@ -691,34 +692,19 @@ class CPLEXDirect(DirectSolver):
                     self._solver_model.MIP_starts.effort_level.auto)
 
     def _load_vars(self, vars_to_load=None):
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        cplex_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
+        pyomo_vars, cplex_vars_to_load = \
+            self._get_referenced_vars_to_load(vars_to_load)
         vals = self._solver_model.solution.get_values(cplex_vars_to_load)
-
-        for i, pyomo_var in enumerate(vars_to_load):
-            if ref_vars[pyomo_var] > 0:
-                pyomo_var.stale = False
-                pyomo_var.value = vals[i]
+        self._set_var_values(pyomo_vars, vals)
 
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
             self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
         rc = self._pyomo_model.rc
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        cplex_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
+        pyomo_vars, cplex_vars_to_load = \
+            self._get_referenced_vars_to_load(vars_to_load)
         vals = self._solver_model.solution.get_reduced_costs(cplex_vars_to_load)
-
-        for i, pyomo_var in enumerate(vars_to_load):
-            if ref_vars[pyomo_var] > 0:
-                rc[pyomo_var] = vals[i]
+        rc.update_values(zip(pyomo_vars, vals), expand=False)
 
     def _load_duals(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'dual'):
@@ -735,9 +721,10 @@ class CPLEXDirect(DirectSolver):
             linear_cons_to_load = cplex_cons_to_load.intersection(set(self._solver_model.linear_constraints.get_names()))
             vals = self._solver_model.solution.get_dual_values(linear_cons_to_load)
 
-        for i, cplex_con in enumerate(linear_cons_to_load):
-            pyomo_con = reverse_con_map[cplex_con]
-            dual[pyomo_con] = vals[i]
+        dual.update_values(
+            zip([reverse_con_map[cplex_con]
+                 for cplex_con in linear_cons_to_load], vals),
+            expand=False)
 
     def _load_slacks(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'slack'):
@@ -786,7 +773,8 @@ class CPLEXDirect(DirectSolver):
         ----------
         cons_to_load: list of Constraint
         """
-        self._load_duals(cons_to_load)
+        with PauseGC():
+            self._load_duals(cons_to_load)
 
     def load_rc(self, vars_to_load):
         """
@@ -796,7 +784,8 @@ class CPLEXDirect(DirectSolver):
         ----------
         vars_to_load: list of Var
         """
-        self._load_rc(vars_to_load)
+        with PauseGC():
+            self._load_rc(vars_to_load)
 
     def load_slacks(self, cons_to_load=None):
         """
@@ -19,7 +19,9 @@ import pyomo.opt.base.solvers
 from pyomo.core.kernel.component_map import ComponentMap
 from pyomo.core.kernel.component_set import ComponentSet
 from pyomo.opt.base.formats import ResultsFormat
-from pyutilib.misc import Options
+from pyutilib.misc import Options, PauseGC
+
+from six import itervalues
 
 class DirectOrPersistentSolver(OptSolver):
     """
@@ -271,6 +273,41 @@ class DirectOrPersistentSolver(OptSolver):
         raise NotImplementedError("This method should be implemented "
                                   "by subclasses")
 
+    def _get_referenced_vars_to_load(self, vars_to_load=None):
+        """
+        Return a tuple of two aligned lists: the pyomo variables in
+        vars_to_load (all variables in the solver model if None) that
+        are referenced by the solver model, and the corresponding solver
+        variables. The lists are built by reading the underlying id
+        dictionaries of the ComponentMaps directly so that a single bulk
+        query can be issued to the solver.
+        """
+        var_map = self._pyomo_var_to_solver_var_map._dict
+        ref_vars = self._referenced_variables._dict
+        if vars_to_load is None:
+            pyomo_vars = []
+            solver_vars = []
+            for pyomo_var, solver_var in itervalues(var_map):
+                if ref_vars[id(pyomo_var)][1] > 0:
+                    pyomo_vars.append(pyomo_var)
+                    solver_vars.append(solver_var)
+        else:
+            pyomo_vars = [pyomo_var for pyomo_var in vars_to_load
+                          if ref_vars[id(pyomo_var)][1] > 0]
+            solver_vars = [var_map[id(pyomo_var)][1]
+                           for pyomo_var in pyomo_vars]
+        return pyomo_vars, solver_vars
+
+    @staticmethod
+    def _set_var_values(pyomo_vars, vals):
+        """
+        Assign the solver values in vals to the aligned list of pyomo
+        variables and mark those variables as not stale.
+        """
+        for pyomo_var, val in zip(pyomo_vars, vals):
+            pyomo_var.stale = False
+            pyomo_var.value = val
+
     def load_vars(self, vars_to_load=None):
         """
         Load the values from the solver's variables into the corresponding pyomo variables.
@@ -279,7 +316,8 @@ class DirectOrPersistentSolver(OptSolver):
         ----------
         vars_to_load: list of Var
         """
-        self._load_vars(vars_to_load)
+        with PauseGC():
+            self._load_vars(vars_to_load)
 
     """ This method should be implemented by subclasses."""
     def warm_start_capable(self):
@@ -74,6 +74,9 @@ class DirectSolver(DirectOrPersistentSolver):
         for arg in args:
             if isinstance(arg, (_BlockData, IBlock)):
                 if isinstance(arg, _BlockData):
+                    _top = arg.model()
+                    if getattr(_top, '_deferred_construction', None):
+                        _top.construct_deferred()
                     if not arg.is_constructed():
                         raise RuntimeError(
                             "Attempting to solve model=%s with unconstructed "
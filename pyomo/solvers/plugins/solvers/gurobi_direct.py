@@ -12,7 +12,7 @@ import logging
 import re
 import sys
 import pyomo.common
-from pyutilib.misc import Bunch
+from pyutilib.misc import Bunch, PauseGC
 from pyutilib.services import TempfileManager
 from pyomo.core.expr.numvalue import is_fixed
 from pyomo.core.expr.numvalue import value
@@ -664,17 +664,17 @@ class GurobiDirect(DirectSolver):
                             soln_constraints[name]["Slack"] = val
         elif self._load_solutions:
             if gprob.SolCount > 0:
+                with PauseGC():
+                    self._load_vars()
 
-                self._load_vars()
+                    if extract_reduced_costs:
+                        self._load_rc()
 
-                if extract_reduced_costs:
-                    self._load_rc()
-
-                if extract_duals:
-                    self._load_duals()
+                    if extract_duals:
+                        self._load_duals()
 
-                if extract_slacks:
-                    self._load_slacks()
+                    if extract_slacks:
+                        self._load_slacks()
 
         self.results.solution.insert(soln)
 
@@ -693,34 +693,19 @@ class GurobiDirect(DirectSolver):
                 gurobipy_var.setAttr(self._gurobipy.GRB.Attr.Start, value(pyomo_var))
 
     def _load_vars(self, vars_to_load=None):
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        gurobi_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
+        pyomo_vars, gurobi_vars_to_load = \
+            self._get_referenced_vars_to_load(vars_to_load)
         vals = self._solver_model.getAttr("X", gurobi_vars_to_load)
-
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                var.stale = False
-                var.value = val
+        self._set_var_values(pyomo_vars, vals)
 
     def _load_rc(self, vars_to_load=None):
         if not hasattr(self._pyomo_model, 'rc'):
             self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
         rc = self._pyomo_model.rc
-        if vars_to_load is None:
-            vars_to_load = var_map.keys()
-
-        gurobi_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
+        pyomo_vars, gurobi_vars_to_load = \
+            self._get_referenced_vars_to_load(vars_to_load)
         vals = self._solver_model.getAttr("Rc", gurobi_vars_to_load)
-
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                rc[var] = val
+        rc.update_values(zip(pyomo_vars, vals), expand=False)
 
     def _load_duals(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'dual'):
@@ -742,13 +727,15 @@ class GurobiDirect(DirectSolver):
         if self._version_major >= 5:
             quadratic_vals = self._solver_model.getAttr("QCPi", quadratic_cons_to_load)
 
-        for gurobi_con, val in zip(linear_cons_to_load, linear_vals):
-            pyomo_con = reverse_con_map[gurobi_con]
-            dual[pyomo_con] = val
+        dual.update_values(
+            zip([reverse_con_map[gurobi_con]
+                 for gurobi_con in linear_cons_to_load], linear_vals),
+            expand=False)
         if self._version_major >= 5:
-            for gurobi_con, val in zip(quadratic_cons_to_load, quadratic_vals):
-                pyomo_con = reverse_con_map[gurobi_con]
-                dual[pyomo_con] = val
+            dual.update_values(
+                zip([reverse_con_map[gurobi_con]
+                     for gurobi_con in quadratic_cons_to_load], quadratic_vals),
+                expand=False)
 
     def _load_slacks(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'slack'):
@@ -801,7 +788,8 @@ class GurobiDirect(DirectSolver):
         ----------
         cons_to_load: list of Constraint
         """
-        self._load_duals(cons_to_load)
+        with PauseGC():
+            self._load_duals(cons_to_load)
 
     def load_rc(self, vars_to_load):
         """
@@ -811,7 +799,8 @@ class GurobiDirect(DirectSolver):
         ----------
         vars_to_load: list of Var
         """
-        self._load_rc(vars_to_load)
+        with PauseGC():
+            self._load_rc(vars_to_load)
 
     def load_slacks(self, cons_to_load=None):
         """
@@ -77,6 +77,9 @@ class PersistentSolver(DirectOrPersistentSolver):
             This is useful for catching bugs. Ordinarily a fixed variable should appear as a constant value in the
             solver constraints. If True, then the error will not be raised.
         """
+        _top = model.model()
+        if getattr(_top, '_deferred_construction', None):
+            _top.construct_deferred()
         return self._set_instance(model, kwds)
 
     def add_block(self, block):
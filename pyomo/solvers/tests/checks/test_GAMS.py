@@ -13,6 +13,7 @@ from pyomo.environ import *
 from pyomo.solvers.plugins.solvers.GAMS import GAMSShell, GAMSDirect
 import pyutilib.th as unittest
 from pyutilib.misc import capture_output
+import pyutilib.services
 import os, shutil
 from tempfile import mkdtemp
 
@@ -24,6 +25,15 @@ if gamspy_available:
 opt_gms = SolverFactory('gams', solver_io='gms')
 gamsgms_available = opt_gms.available(exception_flag=False)
 
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+pyutilib.services.register_executable('true')
+_true_exe = pyutilib.services.registered_executable('true')
+if _true_exe is not None:
+    _true_exe = _true_exe.get_path()
+
 
 class GAMSTests(unittest.TestCase):
 
@@ -307,6 +317,60 @@ class GAMSTests(unittest.TestCase):
         with SolverFactory("gams", solver_io="gms") as opt:
             self.assertIsNotNone(opt.version())
 
+    @unittest.skipIf(not gamsgms_available,
+                     "The 'gams' executable is not available")
+    def test_solve_async_gms(self):
+        import asyncio
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            models = []
+            for i in range(3):
+                m = ConcreteModel()
+                m.x = Var()
+                m.c = Constraint(expr= m.x >= i)
+                m.o = Objective(expr= m.x)
+                models.append(m)
+            futures = [SolverFactory("gams", solver_io="gms").solve_async(m)
+                       for m in models]
+            loop.run_until_complete(asyncio.gather(*futures))
+            for i, m in enumerate(models):
+                self.assertAlmostEqual(value(m.x), i)
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+    @unittest.skipIf(asyncio is None or _true_exe is None,
+                     "asyncio and a 'true' executable are required")
+    def test_solve_async_phases(self):
+        # GAMS itself is replaced by a command that does nothing, so
+        # this only checks the solve_async() orchestration
+        class _NoGAMS(GAMSShell):
+            def available(self, exception_flag=True):
+                return True
+            def executable(self):
+                return _true_exe
+            def _solve_finish(self, state, rc):
+                self._solve_cleanup(state)
+                return rc, state
+
+        m = ConcreteModel()
+        m.x = Var()
+        m.c = Constraint(expr= m.x >= 10)
+        m.o = Objective(expr= m.x)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            rc, state = loop.run_until_complete(
+                _NoGAMS().solve_async(m, loop=loop))
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+        self.assertEqual(rc, 0)
+        self.assertTrue(state.newdir)
+        self.assertFalse(os.path.exists(state.tmpdir))
+
+
 class GAMSLogfileTestBase(unittest.TestCase):
     def setUp(self):
         """Set up model and temporary directory."""
@@ -1,8 +1,15 @@
 """This module contains functions to interrogate the size of a Pyomo model."""
 import logging
+import sys
+from weakref import ref as weakref_ref
 
-from pyomo.core import Block, Constraint, Var
+from six import itervalues
+
+from pyomo.core import (Block, Constraint, Var, Param, Expression,
+                        Objective)
+from pyomo.core.base.component import Component, ComponentData
 from pyomo.core.expr import current as EXPR
+from pyomo.core.expr.numvalue import NumericValue, native_types
 from pyomo.core.kernel.component_set import ComponentSet
 from pyomo.gdp import Disjunct, Disjunction
 from pyutilib.misc import Container
@@ -130,6 +137,99 @@ def log_model_size_report(model, logger=default_logger):
     logger.info(build_model_size_report(model))
 
 
+class ModelMemoryReport(Container):
+    """Stores the memory used by the component data in a model.
+
+    For each component type (variables, constraints, parameters,
+    expressions and objectives) the report records the number of data
+    objects, the bytes they use and the average bytes per object.  The
+    bytes include the data objects, their entries (and keys) in the
+    component dictionaries and the numbers and expression trees they
+    own.  Objects shared by several data objects (e.g., common bounds
+    or index values) are only counted once, and the variables and
+    parameters appearing in expressions are counted with their own
+    components.
+
+    """
+    pass
+
+
+_memory_report_ctypes = (
+    ('variables', Var),
+    ('constraints', Constraint),
+    ('parameters', Param),
+    ('expressions', Expression),
+    ('objectives', Objective),
+)
+
+
+def build_model_memory_report(model):
+    """Build a report of the memory used by the model component data."""
+    report = ModelMemoryReport()
+    block_like = (Block, Disjunct)
+    seen = set()
+    report.total_bytes = 0
+    for name, ctype in _memory_report_ctypes:
+        count = 0
+        nbytes = 0
+        for comp in model.component_objects(ctype, descend_into=block_like):
+            if comp.is_indexed():
+                nbytes += sys.getsizeof(comp._data)
+                for key, data in comp._data.items():
+                    nbytes += _owned_size(key, seen)
+                    nbytes += _owned_size(data, seen, root=True)
+            elif comp._data:
+                nbytes += _owned_size(comp, seen, root=True)
+            count += len(comp)
+        info = Container()
+        info.count = count
+        info.bytes = nbytes
+        info.bytes_per_object = float(nbytes) / count if count else 0.
+        report[name] = info
+        report.total_bytes += nbytes
+    return report
+
+
+def log_model_memory_report(model, logger=default_logger):
+    """Generate a report logging the memory used by the model."""
+    logger.info(build_model_memory_report(model))
+
+
+def _owned_size(obj, seen, root=False):
+    """Return the bytes of obj and the numbers and expressions it owns.
+
+    Objects whose id is in seen are skipped (and the ids of the
+    counted objects are added to seen).  Components and component
+    data (other than the root object) are not descended into.
+    """
+    nbytes = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if obj is None or obj is True or obj is False or id(obj) in seen:
+            continue
+        if not root:
+            if isinstance(obj, (Component, ComponentData, weakref_ref)):
+                continue
+            if obj.__class__ not in native_types and \
+               obj.__class__ not in (tuple, list) and \
+               not isinstance(obj, NumericValue):
+                # e.g., the domain of a variable
+                continue
+        root = False
+        seen.add(id(obj))
+        nbytes += sys.getsizeof(obj)
+        if obj.__class__ in (tuple, list):
+            stack.extend(obj)
+        elif obj.__class__ is dict:
+            stack.extend(itervalues(obj))
+        elif obj.__class__ not in native_types:
+            for cls in type(obj).__mro__:
+                for slot in cls.__dict__.get('__slots__', ()):
+                    stack.append(getattr(obj, slot, None))
+    return nbytes
+
+
 def _process_activated_container(blk):
     """Process a container object, returning the new components found."""
     new_fixed_true_disjuncts = ComponentSet(
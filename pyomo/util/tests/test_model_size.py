@@ -1,15 +1,18 @@
 """Tests for the model size report utility."""
 import logging
+import sys
 from os.path import abspath, dirname, join, normpath
 
 from six import StringIO
 
 import pyutilib.th as unittest
 from pyomo.common.log import LoggingIntercept
-from pyomo.core import Binary, Block, ConcreteModel, Constraint, Integers, Var
+from pyomo.core import (Binary, Block, ConcreteModel, Constraint, Integers,
+                        Var, Param, RangeSet)
 from pyomo.gdp import Disjunct, Disjunction
 from pyomo.util.model_size import (build_model_size_report,
-                                   log_model_size_report)
+                                   log_model_size_report,
+                                   build_model_memory_report)
 from pyutilib.misc import import_file
 
 currdir = dirname(abspath(__file__))
@@ -171,6 +174,37 @@ warning:
         """.strip()
         self.assertEqual(output.getvalue().strip(), expected_output)
 
+    def test_memory_report(self):
+        """Test the memory report."""
+        m = ConcreteModel()
+        m.I = RangeSet(100)
+        m.x = Var(m.I, bounds=(0, 1000))
+        m.p = Param(m.I, initialize=lambda m, i: i*1.5)
+        m.b = Block()
+        m.b.y = Var(m.I, bounds=lambda m, i: (0, i*1.5))
+        m.b.c = Constraint(m.I, rule=lambda b, i: b.y[i] <= m.x[i])
+        report = build_model_memory_report(m)
+        self.assertEqual(report.variables.count, 200)
+        self.assertEqual(report.parameters.count, 100)
+        self.assertEqual(report.constraints.count, 100)
+        self.assertEqual(report.expressions.count, 0)
+        self.assertEqual(report.expressions.bytes, 0)
+        self.assertEqual(report.total_bytes, sum(
+            report[name].bytes for name in ('variables', 'constraints',
+                                             'parameters', 'expressions',
+                                             'objectives')))
+        # The index values and the bounds of m.x are shared (and
+        # counted with m.x), but m.b.y owns its upper bounds
+        xy_bytes = report.variables.bytes
+        m.del_component(m.b)
+        report = build_model_memory_report(m)
+        self.assertEqual(report.constraints.bytes, 0)
+        x_bytes = report.variables.bytes
+        shared = sum(sys.getsizeof(i) for i in m.I) \
+            + sys.getsizeof(0) + sys.getsizeof(1000)
+        self.assertEqual(xy_bytes - x_bytes,
+                         x_bytes - shared + 100*sys.getsizeof(1.5))
+
 
 if __name__ == '__main__':
     unittest.main()